@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+해결책 통계 재계산 스크립트
+execution_history를 다시 집계해 solutions의 execution_count / success_count / success_rate를 맞춤
+(success_count 컬럼 추가 마이그레이션 직후 한 번 실행)
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database import DatabaseManager
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    db = DatabaseManager()
+    if not db.connect():
+        print("데이터베이스 연결 실패")
+        return 1
+        
+    try:
+        updated = db.reconcile_solution_stats()
+    finally:
+        db.disconnect()
+        
+    if updated is None:
+        return 1
+    print(f"해결책 통계 재계산 완료: {updated}개 갱신")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
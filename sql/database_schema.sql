@@ -1,5 +1,6 @@
 -- ELK Auto Resolver Database Schema
 -- PostgreSQL 데이터베이스 스키마
+-- (error_logs / execution_history 시간 파티션 버전: database_schema_partitioned.sql)
 
 -- 데이터베이스 생성 (관리자 권한으로 실행)
 -- CREATE DATABASE elk_resolver;
@@ -28,12 +29,16 @@ CREATE TABLE IF NOT EXISTS solutions (
     solution_commands JSONB,  -- 실행할 명령어들
     success_rate DECIMAL(5,2) DEFAULT 0.00,
     execution_count INTEGER DEFAULT 0,
+    success_count INTEGER DEFAULT 0,  -- 성공한 실행 횟수 (success_rate 증분 계산용)
     last_success_at TIMESTAMP,
     ai_analysis TEXT,  -- AI가 분석한 내용
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 기존 설치 마이그레이션: success_count 추가 후 scripts/reconcile_solution_stats.py 실행
+ALTER TABLE solutions ADD COLUMN IF NOT EXISTS success_count INTEGER DEFAULT 0;
+
 -- 실행 이력 테이블
 CREATE TABLE IF NOT EXISTS execution_history (
     id SERIAL PRIMARY KEY,
@@ -54,9 +59,13 @@ CREATE TABLE IF NOT EXISTS error_patterns (
     error_category VARCHAR(50) NOT NULL,
     priority INTEGER DEFAULT 5,  -- 1=highest, 10=lowest
     auto_resolve BOOLEAN DEFAULT false,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 패턴 세트 버전 (변경 시 트리거가 갱신)
 );
 
+-- 기존 설치 마이그레이션: 패턴 세트 버전 컬럼
+ALTER TABLE error_patterns ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
 -- 시스템 상태 테이블
 CREATE TABLE IF NOT EXISTS system_status (
     id SERIAL PRIMARY KEY,
@@ -68,37 +77,59 @@ CREATE TABLE IF NOT EXISTS system_status (
     metadata JSONB
 );
 
+-- 증분 검색 커서 테이블 (마지막으로 처리한 @timestamp/_id 정렬값)
+CREATE TABLE IF NOT EXISTS search_cursors (
+    cursor_name VARCHAR(100) PRIMARY KEY,
+    sort_values JSONB NOT NULL,  -- Elasticsearch search_after 값
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 시간별 에러 집계 (error_logs 삽입 시 문장 단위 트리거가 증분 갱신 - 분석 통계 조회용)
+CREATE TABLE IF NOT EXISTS error_rollup_hourly (
+    bucket TIMESTAMP NOT NULL,  -- date_trunc('hour', created_at)
+    error_type VARCHAR(100) NOT NULL,
+    source_system VARCHAR(50) NOT NULL,
+    error_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, error_type, source_system)
+);
+
+-- 시간별 분석/해결 집계 (AI 분석은 solutions 삽입 트리거, 실행은 execution_history 삽입 트리거,
+-- DB 재사용 횟수는 AIAnalyzer가 모아서 기록)
+CREATE TABLE IF NOT EXISTS resolution_rollup_hourly (
+    bucket TIMESTAMP PRIMARY KEY,
+    ai_analyses BIGINT NOT NULL DEFAULT 0,
+    db_reuses BIGINT NOT NULL DEFAULT 0,
+    executions BIGINT NOT NULL DEFAULT 0,
+    successes BIGINT NOT NULL DEFAULT 0,
+    execution_seconds_total DOUBLE PRECISION NOT NULL DEFAULT 0,
+    execution_seconds_max DOUBLE PRECISION NOT NULL DEFAULT 0
+);
+
 -- 인덱스 생성
 CREATE INDEX IF NOT EXISTS idx_error_logs_timestamp ON error_logs(timestamp);
 CREATE INDEX IF NOT EXISTS idx_error_logs_hash ON error_logs(hash_signature);
 CREATE INDEX IF NOT EXISTS idx_error_logs_type ON error_logs(error_type);
 CREATE INDEX IF NOT EXISTS idx_solutions_error_hash ON solutions(error_hash);
 CREATE INDEX IF NOT EXISTS idx_execution_history_error_log_id ON execution_history(error_log_id);
+CREATE INDEX IF NOT EXISTS idx_execution_history_solution_id ON execution_history(solution_id);  -- 해결책 정리 시 NOT EXISTS 조회용
 CREATE INDEX IF NOT EXISTS idx_execution_history_executed_at ON execution_history(executed_at);
 
--- 함수: 해결책 성공률 업데이트
+-- 함수: 해결책 성공률 업데이트 (누적 카운터로 O(1) 계산 - 실행 이력을 다시 집계하지 않음)
+-- 카운터가 어긋나면 scripts/reconcile_solution_stats.py로 실행 이력에서 재계산
 CREATE OR REPLACE FUNCTION update_solution_success_rate()
 RETURNS TRIGGER AS $$
+DECLARE
+    succeeded INTEGER := CASE WHEN NEW.execution_status = 'success' THEN 1 ELSE 0 END;
 BEGIN
-    UPDATE solutions 
-    SET 
-        success_rate = (
-            SELECT 
-                CASE 
-                    WHEN COUNT(*) = 0 THEN 0 
-                    ELSE (COUNT(*) FILTER (WHERE execution_status = 'success') * 100.0 / COUNT(*))
-                END
-            FROM execution_history 
-            WHERE solution_id = NEW.solution_id
-        ),
-        execution_count = (
-            SELECT COUNT(*) 
-            FROM execution_history 
-            WHERE solution_id = NEW.solution_id
-        ),
-        last_success_at = CASE 
-            WHEN NEW.execution_status = 'success' THEN NEW.executed_at 
-            ELSE last_success_at 
+    -- SET 절의 컬럼 참조는 갱신 전 값
+    UPDATE solutions
+    SET
+        execution_count = execution_count + 1,
+        success_count = success_count + succeeded,
+        success_rate = (success_count + succeeded) * 100.0 / (execution_count + 1),
+        last_success_at = CASE
+            WHEN succeeded = 1 THEN NEW.executed_at
+            ELSE last_success_at
         END,
         updated_at = CURRENT_TIMESTAMP
     WHERE id = NEW.solution_id;
@@ -113,6 +144,109 @@ CREATE TRIGGER trigger_update_solution_success_rate
     FOR EACH ROW
     EXECUTE FUNCTION update_solution_success_rate();
 
+-- 함수: 해결책 변경 알림 (프로세스 내 해결책 캐시 무효화용, payload = error_hash)
+-- 성공률 트리거의 UPDATE도 여기서 알림이 발생하며, 알림은 커밋 시점에 전달됨
+CREATE OR REPLACE FUNCTION notify_solution_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('solution_changed', COALESCE(NEW.error_hash, OLD.error_hash));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거: 해결책 추가/수정/삭제 시 캐시 무효화 알림
+CREATE TRIGGER trigger_notify_solution_change
+    AFTER INSERT OR UPDATE OR DELETE ON solutions
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_solution_change();
+
+-- 함수: 에러 패턴 변경 시 버전(updated_at) 갱신 및 알림 (ErrorMonitor 분류기 핫 리로드용)
+CREATE OR REPLACE FUNCTION touch_error_patterns()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        NEW.updated_at = CURRENT_TIMESTAMP;
+    END IF;
+    PERFORM pg_notify('error_patterns_changed', TG_OP);
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거: 에러 패턴 추가/수정/삭제 시 분류기 재컴파일 알림
+CREATE TRIGGER trigger_touch_error_patterns
+    BEFORE INSERT OR UPDATE OR DELETE ON error_patterns
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_error_patterns();
+
+-- 함수: 에러 시간별 집계 (문장 단위 - 일괄 삽입도 그룹별 UPSERT 한 번)
+CREATE OR REPLACE FUNCTION rollup_error_logs()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO error_rollup_hourly (bucket, error_type, source_system, error_count)
+    SELECT date_trunc('hour', created_at), error_type, source_system, COUNT(*)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (bucket, error_type, source_system)
+    DO UPDATE SET error_count = error_rollup_hourly.error_count + EXCLUDED.error_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_error_logs
+    AFTER INSERT ON error_logs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_error_logs();
+
+-- 함수: AI 분석(새 해결책) 시간별 집계
+CREATE OR REPLACE FUNCTION rollup_solutions()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO resolution_rollup_hourly (bucket, ai_analyses)
+    SELECT date_trunc('hour', created_at), COUNT(*)
+    FROM new_rows
+    GROUP BY 1
+    ON CONFLICT (bucket)
+    DO UPDATE SET ai_analyses = resolution_rollup_hourly.ai_analyses + EXCLUDED.ai_analyses;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_solutions
+    AFTER INSERT ON solutions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_solutions();
+
+-- 함수: 해결책 실행 결과/소요 시간 시간별 집계
+CREATE OR REPLACE FUNCTION rollup_execution_history()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO resolution_rollup_hourly (bucket, executions, successes, execution_seconds_total, execution_seconds_max)
+    SELECT
+        date_trunc('hour', executed_at),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE execution_status = 'success'),
+        COALESCE(SUM(EXTRACT(EPOCH FROM execution_time)), 0),
+        COALESCE(MAX(EXTRACT(EPOCH FROM execution_time)), 0)
+    FROM new_rows
+    GROUP BY 1
+    ON CONFLICT (bucket)
+    DO UPDATE SET
+        executions = resolution_rollup_hourly.executions + EXCLUDED.executions,
+        successes = resolution_rollup_hourly.successes + EXCLUDED.successes,
+        execution_seconds_total = resolution_rollup_hourly.execution_seconds_total + EXCLUDED.execution_seconds_total,
+        execution_seconds_max = GREATEST(resolution_rollup_hourly.execution_seconds_max, EXCLUDED.execution_seconds_max);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_execution_history
+    AFTER INSERT ON execution_history
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_execution_history();
+
 -- 샘플 에러 패턴 데이터
 INSERT INTO error_patterns (pattern_name, pattern_regex, error_category, priority, auto_resolve) VALUES
 ('Pod CrashLoopBackOff', 'CrashLoopBackOff.*pod.*', 'kubernetes', 1, true),
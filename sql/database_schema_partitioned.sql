@@ -0,0 +1,283 @@
+-- ELK Auto Resolver Database Schema (파티션 버전)
+-- error_logs / execution_history를 시간 기준 range 파티션으로 구성
+-- 보존 기간 정리는 행 DELETE 대신 오래된 파티션을 DETACH 후 DROP (config: database.partitioning)
+--
+-- 파티션 테이블의 PK/UNIQUE 제약에는 파티션 키가 포함되어야 하므로
+-- hash_signature 중복 방지는 error_signatures 게이트 테이블이 담당함
+-- 일별/주별 파티션은 DatabaseManager.ensure_partitions()가 미리 생성함
+-- 범위 파티션이 아직 없는 시각의 행은 DEFAULT 파티션에 저장되고, 해당 범위 파티션 생성 시 옮겨짐
+
+-- 에러 시그니처 게이트 테이블 (중복 에러 방지, 해결책 참조 대상)
+CREATE TABLE IF NOT EXISTS error_signatures (
+    hash_signature VARCHAR(64) PRIMARY KEY,
+    first_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 에러 로그 테이블 (created_at 기준 파티션)
+CREATE TABLE IF NOT EXISTS error_logs (
+    id BIGSERIAL,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    error_type VARCHAR(100) NOT NULL,
+    error_message TEXT NOT NULL,
+    source_system VARCHAR(50) NOT NULL,
+    severity VARCHAR(20) DEFAULT 'ERROR',
+    stack_trace TEXT,
+    elasticsearch_id VARCHAR(100),
+    raw_log_data JSONB,
+    hash_signature VARCHAR(64) NOT NULL REFERENCES error_signatures(hash_signature),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE IF NOT EXISTS error_logs_default PARTITION OF error_logs DEFAULT;
+
+-- 해결책 테이블 (학습 데이터)
+CREATE TABLE IF NOT EXISTS solutions (
+    id SERIAL PRIMARY KEY,
+    error_hash VARCHAR(64) NOT NULL REFERENCES error_signatures(hash_signature),
+    solution_type VARCHAR(50) NOT NULL,  -- 'kubernetes', 'config_fix', 'restart' 등
+    solution_description TEXT NOT NULL,
+    solution_commands JSONB,  -- 실행할 명령어들
+    success_rate DECIMAL(5,2) DEFAULT 0.00,
+    execution_count INTEGER DEFAULT 0,
+    success_count INTEGER DEFAULT 0,  -- 성공한 실행 횟수 (success_rate 증분 계산용)
+    last_success_at TIMESTAMP,
+    ai_analysis TEXT,  -- AI가 분석한 내용
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 기존 설치 마이그레이션: success_count 추가 후 scripts/reconcile_solution_stats.py 실행
+ALTER TABLE solutions ADD COLUMN IF NOT EXISTS success_count INTEGER DEFAULT 0;
+
+-- 실행 이력 테이블 (executed_at 기준 파티션)
+-- error_log_id는 파티션 테이블의 (id, created_at) 키를 참조할 수 없으므로 FK 없이 보관
+CREATE TABLE IF NOT EXISTS execution_history (
+    id BIGSERIAL,
+    error_log_id BIGINT,
+    solution_id INTEGER REFERENCES solutions(id),
+    execution_status VARCHAR(20) NOT NULL,  -- 'success', 'failed', 'timeout'
+    execution_output TEXT,
+    execution_time INTERVAL,
+    executed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    executed_by VARCHAR(50) DEFAULT 'auto-resolver',
+    PRIMARY KEY (id, executed_at)
+) PARTITION BY RANGE (executed_at);
+
+CREATE TABLE IF NOT EXISTS execution_history_default PARTITION OF execution_history DEFAULT;
+
+-- 에러 패턴 테이블 (자주 발생하는 에러 패턴)
+CREATE TABLE IF NOT EXISTS error_patterns (
+    id SERIAL PRIMARY KEY,
+    pattern_name VARCHAR(100) NOT NULL,
+    pattern_regex TEXT NOT NULL,
+    error_category VARCHAR(50) NOT NULL,
+    priority INTEGER DEFAULT 5,  -- 1=highest, 10=lowest
+    auto_resolve BOOLEAN DEFAULT false,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 패턴 세트 버전 (변경 시 트리거가 갱신)
+);
+
+-- 기존 설치 마이그레이션: 패턴 세트 버전 컬럼
+ALTER TABLE error_patterns ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+-- 시스템 상태 테이블
+CREATE TABLE IF NOT EXISTS system_status (
+    id SERIAL PRIMARY KEY,
+    component_name VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,  -- 'healthy', 'warning', 'error'
+    last_check TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    error_count INTEGER DEFAULT 0,
+    last_error_at TIMESTAMP,
+    metadata JSONB
+);
+
+-- 증분 검색 커서 테이블 (마지막으로 처리한 @timestamp/_id 정렬값)
+CREATE TABLE IF NOT EXISTS search_cursors (
+    cursor_name VARCHAR(100) PRIMARY KEY,
+    sort_values JSONB NOT NULL,  -- Elasticsearch search_after 값
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 시간별 에러 집계 (error_logs 삽입 시 문장 단위 트리거가 증분 갱신 - 분석 통계 조회용)
+CREATE TABLE IF NOT EXISTS error_rollup_hourly (
+    bucket TIMESTAMP NOT NULL,  -- date_trunc('hour', created_at)
+    error_type VARCHAR(100) NOT NULL,
+    source_system VARCHAR(50) NOT NULL,
+    error_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, error_type, source_system)
+);
+
+-- 시간별 분석/해결 집계 (AI 분석은 solutions 삽입 트리거, 실행은 execution_history 삽입 트리거,
+-- DB 재사용 횟수는 AIAnalyzer가 모아서 기록)
+CREATE TABLE IF NOT EXISTS resolution_rollup_hourly (
+    bucket TIMESTAMP PRIMARY KEY,
+    ai_analyses BIGINT NOT NULL DEFAULT 0,
+    db_reuses BIGINT NOT NULL DEFAULT 0,
+    executions BIGINT NOT NULL DEFAULT 0,
+    successes BIGINT NOT NULL DEFAULT 0,
+    execution_seconds_total DOUBLE PRECISION NOT NULL DEFAULT 0,
+    execution_seconds_max DOUBLE PRECISION NOT NULL DEFAULT 0
+);
+
+-- 인덱스 생성 (파티션 테이블에 만들면 각 파티션에 자동 생성됨)
+CREATE INDEX IF NOT EXISTS idx_error_logs_timestamp ON error_logs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_error_logs_hash ON error_logs(hash_signature);
+CREATE INDEX IF NOT EXISTS idx_error_logs_type ON error_logs(error_type);
+CREATE INDEX IF NOT EXISTS idx_error_signatures_first_seen_at ON error_signatures(first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_solutions_error_hash ON solutions(error_hash);
+CREATE INDEX IF NOT EXISTS idx_execution_history_error_log_id ON execution_history(error_log_id);
+CREATE INDEX IF NOT EXISTS idx_execution_history_solution_id ON execution_history(solution_id);  -- 해결책 정리 시 NOT EXISTS 조회용
+CREATE INDEX IF NOT EXISTS idx_execution_history_executed_at ON execution_history(executed_at);
+
+-- 함수: 해결책 성공률 업데이트 (누적 카운터로 O(1) 계산 - 실행 이력을 다시 집계하지 않음)
+-- 카운터가 어긋나면 scripts/reconcile_solution_stats.py로 실행 이력에서 재계산
+CREATE OR REPLACE FUNCTION update_solution_success_rate()
+RETURNS TRIGGER AS $$
+DECLARE
+    succeeded INTEGER := CASE WHEN NEW.execution_status = 'success' THEN 1 ELSE 0 END;
+BEGIN
+    -- SET 절의 컬럼 참조는 갱신 전 값
+    UPDATE solutions
+    SET
+        execution_count = execution_count + 1,
+        success_count = success_count + succeeded,
+        success_rate = (success_count + succeeded) * 100.0 / (execution_count + 1),
+        last_success_at = CASE
+            WHEN succeeded = 1 THEN NEW.executed_at
+            ELSE last_success_at
+        END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = NEW.solution_id;
+    
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거: 실행 이력 추가 시 성공률 자동 업데이트 (파티션 테이블에 행 단위 트리거 - PostgreSQL 11+)
+CREATE TRIGGER trigger_update_solution_success_rate
+    AFTER INSERT ON execution_history
+    FOR EACH ROW
+    EXECUTE FUNCTION update_solution_success_rate();
+
+-- 함수: 해결책 변경 알림 (프로세스 내 해결책 캐시 무효화용, payload = error_hash)
+-- 성공률 트리거의 UPDATE도 여기서 알림이 발생하며, 알림은 커밋 시점에 전달됨
+CREATE OR REPLACE FUNCTION notify_solution_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('solution_changed', COALESCE(NEW.error_hash, OLD.error_hash));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거: 해결책 추가/수정/삭제 시 캐시 무효화 알림
+CREATE TRIGGER trigger_notify_solution_change
+    AFTER INSERT OR UPDATE OR DELETE ON solutions
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_solution_change();
+
+-- 함수: 에러 패턴 변경 시 버전(updated_at) 갱신 및 알림 (ErrorMonitor 분류기 핫 리로드용)
+CREATE OR REPLACE FUNCTION touch_error_patterns()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        NEW.updated_at = CURRENT_TIMESTAMP;
+    END IF;
+    PERFORM pg_notify('error_patterns_changed', TG_OP);
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거: 에러 패턴 추가/수정/삭제 시 분류기 재컴파일 알림
+CREATE TRIGGER trigger_touch_error_patterns
+    BEFORE INSERT OR UPDATE OR DELETE ON error_patterns
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_error_patterns();
+
+-- 함수: 에러 시간별 집계 (문장 단위 - 일괄 삽입도 그룹별 UPSERT 한 번)
+CREATE OR REPLACE FUNCTION rollup_error_logs()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO error_rollup_hourly (bucket, error_type, source_system, error_count)
+    SELECT date_trunc('hour', created_at), error_type, source_system, COUNT(*)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (bucket, error_type, source_system)
+    DO UPDATE SET error_count = error_rollup_hourly.error_count + EXCLUDED.error_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_error_logs
+    AFTER INSERT ON error_logs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_error_logs();
+
+-- 함수: AI 분석(새 해결책) 시간별 집계
+CREATE OR REPLACE FUNCTION rollup_solutions()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO resolution_rollup_hourly (bucket, ai_analyses)
+    SELECT date_trunc('hour', created_at), COUNT(*)
+    FROM new_rows
+    GROUP BY 1
+    ON CONFLICT (bucket)
+    DO UPDATE SET ai_analyses = resolution_rollup_hourly.ai_analyses + EXCLUDED.ai_analyses;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_solutions
+    AFTER INSERT ON solutions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_solutions();
+
+-- 함수: 해결책 실행 결과/소요 시간 시간별 집계
+CREATE OR REPLACE FUNCTION rollup_execution_history()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO resolution_rollup_hourly (bucket, executions, successes, execution_seconds_total, execution_seconds_max)
+    SELECT
+        date_trunc('hour', executed_at),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE execution_status = 'success'),
+        COALESCE(SUM(EXTRACT(EPOCH FROM execution_time)), 0),
+        COALESCE(MAX(EXTRACT(EPOCH FROM execution_time)), 0)
+    FROM new_rows
+    GROUP BY 1
+    ON CONFLICT (bucket)
+    DO UPDATE SET
+        executions = resolution_rollup_hourly.executions + EXCLUDED.executions,
+        successes = resolution_rollup_hourly.successes + EXCLUDED.successes,
+        execution_seconds_total = resolution_rollup_hourly.execution_seconds_total + EXCLUDED.execution_seconds_total,
+        execution_seconds_max = GREATEST(resolution_rollup_hourly.execution_seconds_max, EXCLUDED.execution_seconds_max);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_rollup_execution_history
+    AFTER INSERT ON execution_history
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION rollup_execution_history();
+
+-- 샘플 에러 패턴 데이터
+INSERT INTO error_patterns (pattern_name, pattern_regex, error_category, priority, auto_resolve) VALUES
+('Pod CrashLoopBackOff', 'CrashLoopBackOff.*pod.*', 'kubernetes', 1, true),
+('Out of Memory', 'OutOfMemory|OOMKilled.*', 'resource', 2, true),
+('Connection Refused', 'Connection refused.*port.*', 'network', 3, true),
+('Disk Full', 'No space left on device|disk.*full', 'storage', 1, true),
+('Service Unavailable', 'Service Unavailable|503.*', 'service', 4, false);
+
+-- 샘플 시스템 상태 데이터
+INSERT INTO system_status (component_name, status, error_count) VALUES
+('elasticsearch', 'healthy', 0),
+('logstash', 'healthy', 0),
+('kibana', 'healthy', 0),
+('filebeat', 'healthy', 0);
+
+-- 권한 설정 (필요시 실행)
+-- GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO elk_resolver_user;
+-- GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO elk_resolver_user;
@@ -7,9 +7,17 @@ import yaml
 import json
 import logging
 import hashlib
-from typing import Dict, List, Optional, Any
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from openai import OpenAI
 from .database import DatabaseManager
+from .concurrency import RateLimiter, SingleFlight
+from .prompt_builder import PromptBuilder
+from .solution_cache import SOLUTION_CHANNEL, get_solution_cache
+from .similarity_index import get_similarity_index
+from .db_listener import get_notification_listener
 
 class AIAnalyzer:
     """퍼플렉시티 AI를 사용한 에러 분석 클래스"""
@@ -22,7 +30,8 @@ class AIAnalyzer:
             config_path: 설정 파일 경로
         """
         self.config = self._load_config(config_path)
-        self.db = DatabaseManager(config_path)
+        self.config_path = config_path
+        self._db_local = threading.local()  # 분석 스레드마다 별도 DatabaseManager (연결 공유 금지)
         self.logger = logging.getLogger(__name__)
         
         # 퍼플렉시티 클라이언트 초기화 (OpenAI 호환)
@@ -32,7 +41,62 @@ class AIAnalyzer:
             base_url=perplexity_config['base_url']
         )
         self.model = perplexity_config['model']
+        self.max_tokens = perplexity_config.get('max_tokens', 2000)
+        # 에러 상세 정보를 토큰 예산 안에서 구성 (우선순위 필드, 압축 JSON, 중복 프레임 제거)
+        self.prompt_builder = PromptBuilder(perplexity_config.get('prompt', {}))
         
+        # API 한도에 맞춘 호출 제한 (분석 스레드 전체가 공유)
+        rate_limit_config = perplexity_config.get('rate_limit', {})
+        self.max_concurrency = max(rate_limit_config.get('max_concurrency', 4), 1)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=rate_limit_config.get('requests_per_minute', 50),
+            tokens_per_minute=rate_limit_config.get('tokens_per_minute', 0)
+        )
+        # 여러 에러를 한 요청으로 분석 (지시문/시스템 프롬프트를 한 번만 보냄, 1이면 에러마다 요청)
+        batch_config = perplexity_config.get('batch', {})
+        self.batch_max_errors = max(batch_config.get('max_errors', 5), 1) if batch_config.get('enabled', True) else 1
+        self.batch_max_tokens = batch_config.get('max_tokens', 6000)
+        
+        # 같은 에러 해시의 동시 분석은 한 번만 실행 (여러 호스트에서 같은 에러가 동시에 들어오는 경우)
+        self.inflight = SingleFlight()
+        
+        # 원본 로그 조회 함수 (예: ErrorMonitor.fetch_raw_logs) - 프롬프트 구성 시 필요할 때만 호출
+        self.raw_log_loader = None
+        
+        # 프로세스 공용 해결책 캐시 (solutions 변경 NOTIFY로 무효화)
+        self.solution_cache_config = self.config['database'].get('solution_cache', {})
+        self.solution_cache = None
+        if self.solution_cache_config.get('enabled', True):
+            self.solution_cache = get_solution_cache(self.solution_cache_config)
+            
+        # 해시가 정확히 같지 않아도 메시지가 거의 같은 에러의 해결책 재사용 (NumPy 필요)
+        self.similarity_config = self.config['database'].get('similarity_index', {})
+        self.similarity_index = None
+        if self.similarity_config.get('enabled', True):
+            self.similarity_index = get_similarity_index(self.similarity_config)
+            if self.similarity_index is None:
+                self.logger.warning("similarity_index가 활성화되어 있지만 NumPy가 없어 유사도 기반 해결책 재사용 비활성화 (pip install numpy)")
+                
+        if self.solution_cache or self.similarity_index:
+            self._subscribe_solution_changes()
+            
+        # DB 재사용 횟수는 메모리에 모았다가 주기적으로 시간별 집계 테이블에 기록
+        # (AI 분석 횟수와 실행 결과는 DB 트리거가 집계)
+        self.stats_config = self.config.get('analysis_stats', {})
+        self.reuse_flush_interval = self.stats_config.get('reuse_flush_interval', 60)
+        self._stats_lock = threading.Lock()
+        self._pending_reuses = 0
+        self._last_reuse_flush = time.monotonic()
+    
+    @property
+    def db(self) -> DatabaseManager:
+        """현재 스레드 전용 DatabaseManager (처음 사용할 때 생성)"""
+        db = getattr(self._db_local, 'db', None)
+        if db is None:
+            db = DatabaseManager(self.config_path)
+            self._db_local.db = db
+        return db
+    
     def _load_config(self, config_path: str) -> Dict:
         """설정 파일 로드 (환경 변수 포함)"""
         try:
@@ -41,6 +105,60 @@ class AIAnalyzer:
         except Exception as e:
             raise Exception(f"설정 파일을 읽을 수 없습니다: {e}")
     
+    def _subscribe_solution_changes(self):
+        """다른 프로세스/트리거의 해결책 변경 알림으로 캐시 무효화"""
+        if not self.config['database'].get('notifications', {}).get('enabled', True):
+            self.logger.info("해결책 변경 알림 비활성화 - 캐시는 TTL로만 갱신")
+            return
+            
+        try:
+            listener = get_notification_listener(self.config['database'])
+            # 끊긴 동안 놓친 알림이 있을 수 있으므로 재연결 시 전체 무효화
+            if self.solution_cache:
+                listener.subscribe(SOLUTION_CHANNEL, self.solution_cache.invalidate)
+                listener.on_reconnect(self.solution_cache.clear)
+            if self.similarity_index:
+                listener.subscribe(SOLUTION_CHANNEL, self.similarity_index.mark_pending)
+                listener.on_reconnect(self.similarity_index.mark_pending)
+        except Exception as e:
+            self.logger.warning(f"해결책 변경 알림 구독 실패 - 캐시는 TTL로만 갱신: {e}")
+    
+    def _find_existing_solution(self, error_hash: str) -> Optional[Dict]:
+        """
+        기존 해결책 조회 (캐시 우선, 없으면 DB 조회 후 캐시에 저장)
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            
+        Returns:
+            해결책 정보 또는 None
+        """
+        cache = self.solution_cache
+        if cache:
+            found, solution = cache.get(error_hash)
+            if found:
+                return solution
+                
+        if not self.db.connect():
+            return None
+            
+        if not cache:
+            return self.db.get_solution_by_error_hash(error_hash)
+            
+        if not cache.warmed:
+            generation = cache.generation
+            warm_limit = self.solution_cache_config.get('warm_limit', 5000)
+            count = cache.warm(self.db.get_best_solutions(warm_limit), generation)
+            self.logger.info(f"해결책 캐시 적재: {count}개")
+            found, solution = cache.get(error_hash)
+            if found:
+                return solution
+                
+        generation = cache.generation
+        solution = self.db.get_solution_by_error_hash(error_hash)
+        cache.put(error_hash, solution, generation)
+        return solution
+    
     def analyze_error(self, error_data: Dict) -> Optional[Dict]:
         """
         단일 에러 분석
@@ -52,44 +170,48 @@ class AIAnalyzer:
             분석 결과 및 해결책
         """
         try:
-            # 기존 해결책이 있는지 확인
-            error_hash = self.db.create_hash_signature(
-                error_data['error_type'], 
-                error_data['error_message']
-            )
+            error_hash = self.db.create_error_signature(error_data)
             
-            if self.db.connect():
-                existing_solution = self.db.get_solution_by_error_hash(error_hash)
-                if existing_solution and existing_solution['success_rate'] > 50:
-                    self.logger.info(f"📚 기존 해결책 발견 (성공률: {existing_solution['success_rate']}%) - AI 분석 없이 DB에서 재사용")
-                    # 기존 해결책 재사용 표시
-                    existing_solution['is_reused'] = True
-                    existing_solution['reuse_source'] = 'database'
-                    return existing_solution
+            # 같은 해시를 이미 분석 중이면 그 결과를 기다려 공유 (중복 AI 호출 방지)
+            analysis_result, shared = self.inflight.do(error_hash, self._analyze_by_hash, error_hash, error_data)
+            if shared and analysis_result:
+                self.logger.info(f"🔗 동일 에러 분석 진행 중 - 결과 공유 (해시: {error_hash[:12]})")
+                analysis_result = dict(analysis_result)
+                analysis_result['is_reused'] = True
+                analysis_result['reuse_source'] = 'inflight'
+                self._count_reuse()
+                
+            return analysis_result
+            
+        except Exception as e:
+            self.logger.error(f"에러 분석 실패: {e}")
+            return None
+    
+    def _analyze_by_hash(self, error_hash: str, error_data: Dict) -> Optional[Dict]:
+        """
+        기존 해결책 조회 후 없으면 AI 분석 (해시당 동시에 하나만 실행)
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            error_data: 에러 정보
+            
+        Returns:
+            분석 결과 및 해결책
+        """
+        try:
+            # 기존 해결책이 있는지 확인
+            existing_solution = self._reuse_existing(error_hash, error_data)
+            if existing_solution:
+                return existing_solution
+                
+            # 캐시 적중으로 연결하지 않았으면 해결책 저장 전에 연결
+            self.db.connect()
             
             # AI 분석 요청
             analysis_result = self._request_ai_analysis(error_data)
             
             if analysis_result:
-                # 해결책을 데이터베이스에 저장
-                solution_data = {
-                    'error_hash': error_hash,
-                    'solution_type': analysis_result['solution_type'],
-                    'solution_description': analysis_result['description'],
-                    'solution_commands': analysis_result['commands'],
-                    'ai_analysis': analysis_result['analysis']
-                }
-                
-                solution_id = self.db.insert_solution(solution_data)
-                if solution_id:
-                    analysis_result['solution_id'] = solution_id
-                    self.logger.info(f"🤖 새로운 해결책 저장됨: ID={solution_id} - AI 분석 결과")
-                
-                # 새로운 AI 분석 결과 표시
-                analysis_result['is_reused'] = False
-                analysis_result['reuse_source'] = 'ai_analysis'
-                
-                return analysis_result
+                return self._store_analysis(error_hash, analysis_result)
             
             return None
             
@@ -99,6 +221,205 @@ class AIAnalyzer:
         finally:
             self.db.disconnect()
     
+    def _reuse_existing(self, error_hash: str, error_data: Dict) -> Optional[Dict]:
+        """
+        재사용할 만한 기존 해결책 조회 (같은 해시의 성공률 50% 초과 해결책, 없으면 유사한 메시지의 해결책)
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            error_data: 에러 정보
+            
+        Returns:
+            재사용 표시가 된 해결책 또는 None
+        """
+        existing_solution = self._find_existing_solution(error_hash)
+        if existing_solution and existing_solution['success_rate'] > 50:
+            self.logger.info(f"📚 기존 해결책 발견 (성공률: {existing_solution['success_rate']}%) - AI 분석 없이 DB에서 재사용")
+            # 기존 해결책 재사용 표시
+            existing_solution['is_reused'] = True
+            existing_solution['reuse_source'] = 'database'
+            self._count_reuse()
+            return existing_solution
+            
+        similar_solution = self._find_similar_solution(error_hash, error_data)
+        if similar_solution:
+            self._count_reuse()
+            return similar_solution
+        return None
+    
+    def _find_similar_solution(self, error_hash: str, error_data: Dict) -> Optional[Dict]:
+        """
+        유사도 인덱스에서 메시지가 비슷한 에러의 해결책 조회
+        
+        Args:
+            error_hash: 에러 해시 시그니처 (자기 자신은 제외)
+            error_data: 에러 정보
+            
+        Returns:
+            재사용 표시가 된 해결책 또는 None (유사도/성공률 기준 미달)
+        """
+        index = self.similarity_index
+        if not index:
+            return None
+            
+        try:
+            self._refresh_similarity_index()
+            
+            min_similarity = self.similarity_config.get('min_similarity', 0.85)
+            min_success_rate = self.similarity_config.get('min_success_rate', 70)
+            matches = index.search(
+                error_data['error_type'],
+                error_data['error_message'],
+                top_k=self.similarity_config.get('top_k', 5)
+            )
+            
+            for matched_hash, similarity in matches:
+                if similarity < min_similarity:
+                    break
+                if matched_hash == error_hash:
+                    continue
+                    
+                solution = self._find_existing_solution(matched_hash)
+                if not solution:
+                    # 정리 작업 등으로 해결책이 삭제된 해시
+                    index.remove(matched_hash)
+                    continue
+                if solution['success_rate'] < min_success_rate:
+                    continue
+                    
+                self.logger.info(f"🔎 유사 에러 해결책 발견 (유사도: {similarity:.2f}, 성공률: {solution['success_rate']}%) - AI 분석 없이 재사용")
+                solution['is_reused'] = True
+                solution['reuse_source'] = 'similarity'
+                solution['similarity'] = round(similarity, 4)
+                solution['matched_error_hash'] = matched_hash
+                return solution
+                
+            return None
+            
+        except Exception as e:
+            self.logger.warning(f"유사 해결책 조회 실패: {e}")
+            return None
+    
+    def _refresh_similarity_index(self):
+        """유사도 인덱스 최초 구축 및 다른 프로세스에서 바뀐 해시 반영"""
+        index = self.similarity_index
+        if not index.built:
+            if not self.db.connect():
+                return
+            entries = self.db.get_solution_messages(limit=index.max_entries)
+            count = index.build(entries)
+            self.logger.info(f"해결책 유사도 인덱스 구축: {count}개")
+            
+        pending = index.take_pending()
+        if pending and self.db.connect():
+            for entry in self.db.get_solution_messages(pending, limit=len(pending)):
+                index.add(entry['error_hash'], entry['error_type'], entry['error_message'])
+    
+    def _store_analysis(self, error_hash: str, analysis_result: Dict) -> Dict:
+        """
+        AI 분석 결과를 해결책으로 저장 (연결된 상태에서 호출)
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            analysis_result: 파싱된 AI 분석 결과
+            
+        Returns:
+            solution_id와 AI 분석 표시가 추가된 분석 결과
+        """
+        # 해결책을 데이터베이스에 저장
+        solution_data = {
+            'error_hash': error_hash,
+            'solution_type': analysis_result['solution_type'],
+            'solution_description': analysis_result['description'],
+            'solution_commands': analysis_result['commands'],
+            'ai_analysis': analysis_result['analysis']
+        }
+        
+        solution_id = self.db.insert_solution(solution_data)
+        if solution_id:
+            # NOTIFY보다 먼저 이 프로세스의 캐시 무효화
+            if self.solution_cache:
+                self.solution_cache.invalidate(error_hash)
+            analysis_result['solution_id'] = solution_id
+            self.logger.info(f"🤖 새로운 해결책 저장됨: ID={solution_id} - AI 분석 결과")
+            # 이후 비슷한 메시지의 에러가 이 해결책을 찾을 수 있도록 인덱스에 추가
+            error_data = analysis_result.get('error_data')
+            if self.similarity_index and error_data:
+                self.similarity_index.add(error_hash, error_data['error_type'], error_data['error_message'])
+            
+        # 새로운 AI 분석 결과 표시
+        analysis_result['is_reused'] = False
+        analysis_result['reuse_source'] = 'ai_analysis'
+        
+        return analysis_result
+    
+    def _count_reuse(self):
+        """DB 재사용 횟수 누적 (reuse_flush_interval이 지났으면 기록)"""
+        with self._stats_lock:
+            self._pending_reuses += 1
+            due = time.monotonic() - self._last_reuse_flush >= self.reuse_flush_interval
+        if due:
+            self.flush_reuse_count()
+    
+    def flush_reuse_count(self) -> bool:
+        """
+        누적된 DB 재사용 횟수를 시간별 집계 테이블에 기록
+        
+        Returns:
+            성공 여부 (기록할 것이 없으면 True)
+        """
+        with self._stats_lock:
+            pending, self._pending_reuses = self._pending_reuses, 0
+            self._last_reuse_flush = time.monotonic()
+        if not pending:
+            return True
+            
+        if self.db.connect() and self.db.add_reuse_count(pending):
+            return True
+            
+        # 실패하면 다음 기록 때 다시 시도
+        with self._stats_lock:
+            self._pending_reuses += pending
+        return False
+    
+    def _call_ai(self, prompt: str, max_tokens: int) -> str:
+        """
+        퍼플렉시티 API 호출 (분당 요청/토큰 한도 적용)
+        
+        Args:
+            prompt: 사용자 프롬프트
+            max_tokens: 응답 최대 토큰 수
+            
+        Returns:
+            AI 응답 텍스트
+        """
+        # 분당 요청/토큰 한도 대기 (입력은 추정치, 출력은 최대치로 예약)
+        estimated_tokens = self.prompt_builder.estimate_tokens(prompt) + max_tokens
+        self.rate_limiter.acquire(estimated_tokens)
+        
+        # 퍼플렉시티 API 호출
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "당신은 Kubernetes와 ELK Stack 전문가입니다. 에러 로그를 분석하고 실행 가능한 해결책을 JSON 형태로 제공해주세요."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            temperature=0.1,
+            max_tokens=max_tokens
+        )
+        
+        usage = getattr(response, 'usage', None)
+        if usage is not None and getattr(usage, 'total_tokens', None):
+            self.rate_limiter.record_usage(estimated_tokens, usage.total_tokens)
+            
+        return response.choices[0].message.content
+    
     def _request_ai_analysis(self, error_data: Dict) -> Optional[Dict]:
         """
         퍼플렉시티 AI에 에러 분석 요청
@@ -113,25 +434,8 @@ class AIAnalyzer:
             # 프롬프트 구성
             prompt = self._build_analysis_prompt(error_data)
             
-            # 퍼플렉시티 API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 Kubernetes와 ELK Stack 전문가입니다. 에러 로그를 분석하고 실행 가능한 해결책을 JSON 형태로 제공해주세요."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            # 응답 파싱
-            ai_response = response.choices[0].message.content
+            # API 호출
+            ai_response = self._call_ai(prompt, self.max_tokens)
             self.logger.info("AI 분석 완료")
             
             # JSON 응답 파싱
@@ -141,6 +445,29 @@ class AIAnalyzer:
             self.logger.error(f"AI 분석 요청 실패: {e}")
             return None
     
+    def _request_ai_analysis_batch(self, errors: List[Dict]) -> Dict[int, Dict]:
+        """
+        여러 에러를 한 번의 요청으로 분석
+        
+        Args:
+            errors: 에러 리스트 (최대 batch_max_errors개)
+            
+        Returns:
+            에러 인덱스 → AI 분석 결과 (응답에서 빠지거나 잘못된 항목은 제외)
+        """
+        try:
+            prompt = self._build_batch_prompt(errors)
+            max_tokens = min(self.max_tokens * len(errors), self.batch_max_tokens)
+            
+            ai_response = self._call_ai(prompt, max_tokens)
+            self.logger.info(f"AI 일괄 분석 완료: {len(errors)}개 요청")
+            
+            return self._parse_ai_batch_response(ai_response, errors)
+            
+        except Exception as e:
+            self.logger.error(f"AI 일괄 분석 요청 실패: {e}")
+            return {}
+    
     def _build_analysis_prompt(self, error_data: Dict) -> str:
         """
         AI 분석용 프롬프트 구성
@@ -151,25 +478,20 @@ class AIAnalyzer:
         Returns:
             구성된 프롬프트
         """
+        # 원본 로그가 아직 없으면 필요한 시점에 조회
+        self._load_raw_logs([error_data])
+        
         prompt = f"""
 다음 에러를 분석하고 해결책을 제공해주세요:
 
 ## 에러 정보
 - **에러 타입**: {error_data['error_type']}
-- **에러 메시지**: {error_data['error_message']}
 - **소스 시스템**: {error_data['source_system']}
 - **심각도**: {error_data['severity']}
-
-## 추가 정보
 """
         
-        if error_data.get('stack_trace'):
-            prompt += f"- **스택 트레이스**: {error_data['stack_trace'][:500]}...\n"
-        
-        if error_data.get('raw_log_data'):
-            raw_data = error_data['raw_log_data']
-            if isinstance(raw_data, dict):
-                prompt += f"- **원시 로그**: {json.dumps(raw_data, indent=2)[:1000]}...\n"
+        # 메시지, 스택 트레이스, 원본 로그 필드를 토큰 예산 안에서 구성
+        prompt += '\n'.join(self.prompt_builder.build_details(error_data)) + '\n'
         
         prompt += """
 
@@ -203,10 +525,87 @@ class AIAnalyzer:
 5. 데이터 손실 방지에 우선순위
 
 최신 Kubernetes와 ELK Stack 지식을 바탕으로 분석해주세요.
+"""
+
+        return prompt
+    
+    def _build_batch_prompt(self, errors: List[Dict]) -> str:
+        """
+        여러 에러를 한 번에 분석하는 프롬프트 구성 (에러별 요약 + 공통 지시문 한 번)
+        
+        Args:
+            errors: 에러 리스트
+            
+        Returns:
+            구성된 프롬프트
+        """
+        prompt = f"""
+다음 {len(errors)}개의 에러를 각각 분석하고 해결책을 제공해주세요:
+"""
+
+        for index, error_data in enumerate(errors, 1):
+            prompt += f"""
+## E{index}
+- **에러 타입**: {error_data['error_type']}
+- **소스 시스템**: {error_data['source_system']}
+- **심각도**: {error_data['severity']}
+"""
+            details = self.prompt_builder.build_details(error_data, self.prompt_builder.batch_token_budget)
+            prompt += '\n'.join(details) + '\n'
+                
+        prompt += """
+
+## 요청사항
+에러마다 하나씩, 다음 JSON 배열 형식으로만 응답해주세요 (error_id는 위의 E1, E2 ...):
+
+```json
+[
+    {
+        "error_id": "E1",
+        "analysis": "에러의 원인과 상황에 대한 분석",
+        "solution_type": "kubernetes|config_fix|restart|scaling|network|storage",
+        "description": "해결책에 대한 설명",
+        "commands": [
+            {
+                "type": "kubectl|bash|config",
+                "command": "실행할 명령어",
+                "description": "명령어 설명",
+                "safe": true|false
+            }
+        ],
+        "priority": "high|medium|low",
+        "estimated_time": "예상 해결 시간 (분)",
+        "success_probability": "성공 확률 (0-100)"
+    }
+]
+```
+
+## 중요사항
+1. Kubernetes 환경 (네임스페이스: elk-stack)
+2. ELK Stack 컴포넌트 (Elasticsearch, Logstash, Kibana, Filebeat)
+3. 안전한 명령어만 제안 (safe_mode: true)
+4. 단계별 실행 가능한 명령어 제공
+5. 데이터 손실 방지에 우선순위
 """
         
         return prompt
     
+    def _load_raw_logs(self, errors: List[Dict]):
+        """
+        원본 로그 문서가 없는 에러들의 raw_log_data를 일괄 조회
+        
+        Args:
+            errors: 에러 리스트
+        """
+        missing = [e for e in errors if not e.get('raw_log_data') and e.get('raw_log_ref')]
+        if not missing or not self.raw_log_loader:
+            return
+            
+        try:
+            self.raw_log_loader(missing)
+        except Exception as e:
+            self.logger.warning(f"원본 로그 조회 실패: {e}")
+    
     def _parse_ai_response(self, ai_response: str, error_data: Dict) -> Optional[Dict]:
         """
         AI 응답 파싱
@@ -230,33 +629,9 @@ class AIAnalyzer:
             json_str = ai_response[json_start:json_end]
             analysis_result = json.loads(json_str)
             
-            # 필수 필드 검증
-            required_fields = ['analysis', 'solution_type', 'description', 'commands']
-            for field in required_fields:
-                if field not in analysis_result:
-                    self.logger.error(f"필수 필드 누락: {field}")
-                    return None
-            
-            # 명령어 안전성 검증
-            safe_commands = []
-            for cmd in analysis_result['commands']:
-                if self._is_safe_command(cmd):
-                    safe_commands.append(cmd)
-                else:
-                    self.logger.warning(f"안전하지 않은 명령어 제외: {cmd.get('command', '')}")
-            
-            analysis_result['commands'] = safe_commands
-            
-            # 기본값 설정
-            analysis_result.setdefault('priority', 'medium')
-            analysis_result.setdefault('estimated_time', '10')
-            analysis_result.setdefault('success_probability', '70')
-            
-            # AutoResolver가 필요로 하는 추가 필드 설정
-            analysis_result['error_data'] = error_data
-            analysis_result['has_solution'] = True  # 해결책이 있음을 명시
-            
-            self.logger.info("AI 응답 파싱 완료")
+            analysis_result = self._validate_analysis(analysis_result, error_data)
+            if analysis_result:
+                self.logger.info("AI 응답 파싱 완료")
             return analysis_result
             
         except json.JSONDecodeError as e:
@@ -266,6 +641,99 @@ class AIAnalyzer:
             self.logger.error(f"AI 응답 파싱 오류: {e}")
             return None
     
+    def _parse_ai_batch_response(self, ai_response: str, errors: List[Dict]) -> Dict[int, Dict]:
+        """
+        일괄 분석 AI 응답 파싱 (JSON 배열)
+        
+        배열 전체가 파싱되지 않아도(응답이 잘리거나 일부 항목이 깨진 경우) 읽을 수 있는 항목은 사용
+        
+        Args:
+            ai_response: AI 응답 텍스트
+            errors: 요청에 포함한 에러 리스트 (E1부터 순서대로)
+            
+        Returns:
+            에러 인덱스 → 파싱된 분석 결과
+        """
+        results = {}
+        array_start = ai_response.find('[')
+        if array_start == -1:
+            self.logger.error("AI 일괄 응답에서 JSON 배열을 찾을 수 없음")
+            return results
+            
+        # 객체를 하나씩 디코딩 - 깨진 항목은 건너뛰고 다음 '{'부터 다시 시도
+        # (깨진 항목 안의 commands 객체는 error_id가 없어 무시됨)
+        decoder = json.JSONDecoder()
+        position = ai_response.find('{', array_start)
+        while position != -1:
+            try:
+                item, end = decoder.raw_decode(ai_response, position)
+            except json.JSONDecodeError:
+                position = ai_response.find('{', position + 1)
+                continue
+            position = ai_response.find('{', end)
+            
+            if not isinstance(item, dict):
+                continue
+            error_id = str(item.pop('error_id', '')).strip().upper()
+            if not error_id.startswith('E') or not error_id[1:].isdigit():
+                continue
+            index = int(error_id[1:]) - 1
+            if index < 0 or index >= len(errors) or index in results:
+                continue
+                
+            try:
+                analysis_result = self._validate_analysis(item, errors[index])
+            except Exception as e:
+                self.logger.warning(f"AI 일괄 응답 항목 파싱 오류 ({error_id}): {e}")
+                continue
+            if analysis_result:
+                results[index] = analysis_result
+                
+        if len(results) < len(errors):
+            self.logger.warning(f"AI 일괄 응답 일부 누락: {len(results)}/{len(errors)}개 파싱")
+        else:
+            self.logger.info(f"AI 일괄 응답 파싱 완료: {len(results)}개")
+        return results
+    
+    def _validate_analysis(self, analysis_result: Dict, error_data: Dict) -> Optional[Dict]:
+        """
+        파싱된 분석 결과 검증 및 기본값 설정
+        
+        Args:
+            analysis_result: AI가 반환한 해결책 객체
+            error_data: 원본 에러 데이터
+            
+        Returns:
+            검증된 분석 결과 (필수 필드 누락 시 None)
+        """
+        # 필수 필드 검증
+        required_fields = ['analysis', 'solution_type', 'description', 'commands']
+        for field in required_fields:
+            if field not in analysis_result:
+                self.logger.error(f"필수 필드 누락: {field}")
+                return None
+                
+        # 명령어 안전성 검증
+        safe_commands = []
+        for cmd in analysis_result['commands']:
+            if self._is_safe_command(cmd):
+                safe_commands.append(cmd)
+            else:
+                self.logger.warning(f"안전하지 않은 명령어 제외: {cmd.get('command', '')}")
+                
+        analysis_result['commands'] = safe_commands
+        
+        # 기본값 설정
+        analysis_result.setdefault('priority', 'medium')
+        analysis_result.setdefault('estimated_time', '10')
+        analysis_result.setdefault('success_probability', '70')
+        
+        # AutoResolver가 필요로 하는 추가 필드 설정
+        analysis_result['error_data'] = error_data
+        analysis_result['has_solution'] = True  # 해결책이 있음을 명시
+        
+        return analysis_result
+    
     def _is_safe_command(self, command_info: Dict) -> bool:
         """
         명령어 안전성 검증
@@ -309,57 +777,258 @@ class AIAnalyzer:
         # 기본적으로 안전하지 않다고 판단
         return command_info.get('safe', False)
     
-    def analyze_multiple_errors(self, errors_list: List[Dict]) -> List[Dict]:
+    def _analyze_one(self, error_data: Dict) -> Optional[Dict]:
         """
-        여러 에러 일괄 분석
+        에러 하나 분석 (분석 스레드에서 실행, 예외는 기록 후 None)
+        
+        Args:
+            error_data: 에러 정보
+            
+        Returns:
+            error_data가 포함된 분석 결과 또는 None
+        """
+        try:
+            self.logger.info(f"에러 분석 중: {error_data['error_type']}")
+            
+            analysis_result = self.analyze_error(error_data)
+            
+            if analysis_result:
+                analysis_result['error_data'] = error_data
+                self.logger.info(f"에러 분석 완료: {error_data['error_type']}")
+                return analysis_result
+                
+            self.logger.warning(f"에러 분석 실패: {error_data['error_type']}")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"에러 분석 중 오류 발생: {e}")
+            return None
+    
+    def iter_analyses(self, errors_list: List[Dict]) -> Iterator[Dict]:
+        """
+        여러 에러를 동시에 분석하고 끝나는 순서대로 결과 반환
+        
+        max_concurrency개 스레드가 분석하며 API 호출은 rate_limiter 한도를 따름.
+        입력 순서가 아니라 완료 순서로 반환하므로 호출자는 빨리 끝난 것(DB 재사용 등)부터 해결을 시작할 수 있음
         
         Args:
             errors_list: 에러 리스트
             
         Returns:
-            분석 결과 리스트
+            분석 결과 이터레이터 (실패한 에러는 제외)
+        """
+        # 프롬프트에 필요한 원본 로그를 mget 한 번으로 미리 조회
+        self._load_raw_logs(errors_list)
+        
+        count = 0
+        try:
+            if self.batch_max_errors > 1 and len(errors_list) > 1:
+                for analysis_result in self._iter_batched(errors_list):
+                    count += 1
+                    yield analysis_result
+                return
+                
+            if self.max_concurrency <= 1 or len(errors_list) <= 1:
+                for error_data in errors_list:
+                    analysis_result = self._analyze_one(error_data)
+                    if analysis_result:
+                        count += 1
+                        yield analysis_result
+                return
+                
+            workers = min(self.max_concurrency, len(errors_list))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-analyzer") as executor:
+                futures = [executor.submit(self._analyze_one, error_data) for error_data in errors_list]
+                for future in as_completed(futures):
+                    analysis_result = future.result()
+                    if analysis_result:
+                        count += 1
+                        yield analysis_result
+                        
+        finally:
+            self.logger.info(f"총 {count}개 에러 분석 완료")
+            try:
+                self.flush_reuse_count()
+            finally:
+                self.db.disconnect()
+    
+    def _iter_batched(self, errors_list: List[Dict]) -> Iterator[Dict]:
         """
-        results = []
+        에러를 해시별로 묶고 batch_max_errors개씩 한 요청으로 분석
         
+        같은 해시의 에러는 대표 하나만 분석하고 나머지는 그 결과를 공유.
+        기존 해결책을 재사용할 수 있는 에러는 AI 요청 묶음을 보내기 전에 먼저 반환하고,
+        나머지만 묶어서 max_concurrency개 스레드에서 동시에 처리해 끝난 묶음부터 반환
+        
+        Args:
+            errors_list: 에러 리스트
+            
+        Returns:
+            분석 결과 이터레이터 (실패한 에러는 제외)
+        """
+        groups = {}  # 에러 해시 → 에러 리스트 (입력 순서 유지)
         for error_data in errors_list:
+            groups.setdefault(self.db.create_error_signature(error_data), []).append(error_data)
+            
+        # 재사용 가능한 해결책은 AI 요청을 기다리지 않고 바로 반환
+        hashes = []
+        for error_hash, group in groups.items():
             try:
-                self.logger.info(f"에러 분석 중: {error_data['error_type']}")
+                existing_solution = self._reuse_existing(error_hash, group[0])
+            except Exception as e:
+                self.logger.error(f"기존 해결책 조회 실패: {e}")
+                existing_solution = None
+            if existing_solution:
+                yield from self._share_result(existing_solution, group)
+            else:
+                hashes.append(error_hash)
+                
+        chunks = [
+            [(error_hash, groups[error_hash][0]) for error_hash in hashes[i:i + self.batch_max_errors]]
+            for i in range(0, len(hashes), self.batch_max_errors)
+        ]
+        self.logger.info(f"에러 일괄 분석: {len(errors_list)}개 (고유 {len(groups)}개, 재사용 {len(groups) - len(hashes)}개, "
+                         f"요청 묶음 {len(chunks)}개)")
+        if not chunks:
+            return
+            
+        workers = max(min(self.max_concurrency, len(chunks)), 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-analyzer") as executor:
+            futures = [executor.submit(self._analyze_batch, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for error_hash, analysis_result in future.result().items():
+                    yield from self._share_result(analysis_result, groups[error_hash])
+    
+    def _share_result(self, analysis_result: Dict, group: List[Dict]) -> Iterator[Dict]:
+        """
+        같은 해시 에러 묶음에 대표 분석 결과를 나눠 줌
+        
+        Args:
+            analysis_result: 대표 에러의 분석 결과
+            group: 같은 해시의 에러 리스트 (첫 번째가 대표)
+            
+        Returns:
+            에러별 분석 결과 이터레이터
+        """
+        for position, error_data in enumerate(group):
+            if position == 0:
+                result = analysis_result
+            else:
+                # 같은 주기의 중복 에러는 대표 분석 결과 공유
+                result = dict(analysis_result)
+                result['is_reused'] = True
+                result['reuse_source'] = 'inflight'
+                self._count_reuse()
+                self.inflight.record_coalesced()
+            result['error_data'] = error_data
+            yield result
+    
+    def _analyze_batch(self, items: List[Tuple[str, Dict]]) -> Dict[str, Dict]:
+        """
+        에러 묶음을 한 요청으로 AI에 분석 (분석 스레드에서 실행, 예외는 기록 후 빈 결과)
+        
+        각 해시는 single-flight로 등록해 다른 경로(analyze_error 등)에서 같은 해시를 이미
+        분석 중이면 요청에서 빼고 그 결과를 공유받음. 일괄 응답에서 빠지거나 깨진 항목은
+        단건 요청으로 다시 분석
+        
+        Args:
+            items: (에러 해시, 에러 정보) 리스트 - 재사용 가능한 해결책이 없는 에러
+            
+        Returns:
+            에러 해시 → 분석 결과 (실패한 에러는 제외)
+        """
+        results = {}
+        pending = []  # 이 묶음이 leader인 (에러 해시, 에러 정보)
+        waiting = []  # 다른 호출이 분석 중인 (에러 해시, Future)
+        for error_hash, error_data in items:
+            future, leader = self.inflight.claim(error_hash)
+            if leader:
+                pending.append((error_hash, error_data))
+            else:
+                waiting.append((error_hash, future))
                 
-                analysis_result = self.analyze_error(error_data)
+        try:
+            if pending:
+                # 해결책 저장 전에 연결
+                self.db.connect()
                 
-                if analysis_result:
-                    analysis_result['error_data'] = error_data
-                    results.append(analysis_result)
-                    self.logger.info(f"에러 분석 완료: {error_data['error_type']}")
-                else:
-                    self.logger.warning(f"에러 분석 실패: {error_data['error_type']}")
+                pending_errors = [error_data for _, error_data in pending]
+                batch_results = self._request_ai_analysis_batch(pending_errors) if len(pending) > 1 else {}
+                
+                for index, (error_hash, error_data) in enumerate(pending):
+                    analysis_result = batch_results.get(index)
+                    if analysis_result is None:
+                        if len(pending) > 1:
+                            self.logger.info(f"일괄 응답에 없는 에러 단건 재분석: {error_data['error_type']}")
+                        analysis_result = self._request_ai_analysis(error_data)
+                        
+                    if analysis_result:
+                        results[error_hash] = self._store_analysis(error_hash, analysis_result)
+                    else:
+                        self.logger.warning(f"에러 분석 실패: {error_data['error_type']}")
+                    self.inflight.resolve(error_hash, results.get(error_hash))
                     
+        except Exception as e:
+            self.logger.error(f"에러 일괄 분석 중 오류 발생: {e}")
+        finally:
+            # 결과를 내지 못한 해시도 대기 중인 호출이 멈추지 않도록 해제
+            for error_hash, _ in pending:
+                self.inflight.resolve(error_hash, results.get(error_hash))
+            self.db.disconnect()
+            
+        # 자기 몫을 모두 끝낸 뒤에 기다려야 서로의 해시를 기다리는 묶음끼리 교착되지 않음
+        for error_hash, future in waiting:
+            try:
+                analysis_result = future.result()
             except Exception as e:
-                self.logger.error(f"에러 분석 중 오류 발생: {e}")
+                self.logger.error(f"동일 에러 분석 결과 대기 중 오류 발생: {e}")
                 continue
-        
-        self.logger.info(f"총 {len(results)}개 에러 분석 완료")
+            if analysis_result:
+                self.logger.info(f"🔗 동일 에러 분석 진행 중 - 결과 공유 (해시: {error_hash[:12]})")
+                analysis_result = dict(analysis_result)
+                analysis_result['is_reused'] = True
+                analysis_result['reuse_source'] = 'inflight'
+                self._count_reuse()
+                results[error_hash] = analysis_result
+                
         return results
     
+    def analyze_multiple_errors(self, errors_list: List[Dict]) -> List[Dict]:
+        """
+        여러 에러 일괄 분석 (iter_analyses 결과를 모두 모아서 반환)
+        
+        Args:
+            errors_list: 에러 리스트
+            
+        Returns:
+            분석 결과 리스트 (완료 순서)
+        """
+        return list(self.iter_analyses(errors_list))
+    
     def get_analysis_stats(self) -> Dict:
         """
-        분석 통계 조회
+        분석 통계 조회 (시간별 집계 테이블 사용 - 이력이 쌓여도 조회 비용 일정)
         
         Returns:
-            통계 정보
+            통계 정보 (에러 타입/소스별 건수, AI 분석 대 DB 재사용, 해결 성공률 및 소요 시간)
         """
         try:
             if not self.db.connect():
                 return {}
+                
+            # 아직 기록되지 않은 재사용 횟수까지 반영
+            self.flush_reuse_count()
             
-            # 통계 쿼리는 여기서 구현
-            # 예: 해결책 성공률, 에러 타입별 통계 등
-            
-            stats = {
-                'total_solutions': 0,
-                'avg_success_rate': 0,
-                'top_error_types': []
-            }
+            stats = self.db.get_rollup_stats(
+                window_hours=self.stats_config.get('window_hours', 24),
+                top_n=self.stats_config.get('top_n', 5)
+            )
+            if self.solution_cache:
+                stats['solution_cache'] = self.solution_cache.get_stats()
+            if self.similarity_index:
+                stats['similarity_index'] = self.similarity_index.get_stats()
+            stats['single_flight'] = self.inflight.get_stats()
+            stats['rate_limit'] = self.rate_limiter.get_stats()
             
             return stats
             
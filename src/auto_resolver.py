@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from kubernetes import client, config
 from .database import DatabaseManager
+from .write_behind import get_write_behind_queue
 
 class AutoResolver:
     """자동 에러 해결 실행 클래스"""
@@ -42,6 +43,10 @@ class AutoResolver:
         self.timeout = self.config['resolver']['timeout']
         self.safe_mode = self.config['resolver']['safe_mode']
         
+        # 실행 이력은 백그라운드 write-behind 큐로 기록 (해결 루프가 DB 지연에 묶이지 않도록)
+        write_behind_config = self.config['database'].get('write_behind', {})
+        self.writer = get_write_behind_queue(config_path, write_behind_config) if write_behind_config.get('enabled', True) else None
+    
     def _load_config(self, config_path: str) -> Dict:
         """설정 파일 로드 (환경 변수 포함)"""
         try:
@@ -417,18 +422,22 @@ class AutoResolver:
     
     def _record_execution_result(self, analysis_result: Dict, execution_result: Dict):
         """실행 결과를 데이터베이스에 기록"""
+        execution_data = {
+            'error_log_id': analysis_result.get('error_data', {}).get('error_id'),
+            'solution_id': analysis_result.get('solution_id'),
+            'execution_status': execution_result['status'],
+            'execution_output': str(execution_result),
+            'execution_time': timedelta(seconds=execution_result['execution_time'])
+        }
+        
+        if self.writer and self.writer.record_execution(execution_data):
+            self.logger.info("실행 결과 기록 예약 완료 (write-behind)")
+            return
+            
         try:
             if not self.db.connect():
                 return
             
-            execution_data = {
-                'error_log_id': analysis_result.get('error_data', {}).get('error_id'),
-                'solution_id': analysis_result.get('solution_id'),
-                'execution_status': execution_result['status'],
-                'execution_output': str(execution_result),
-                'execution_time': timedelta(seconds=execution_result['execution_time'])
-            }
-            
             self.db.record_execution(execution_data)
             self.logger.info("실행 결과 데이터베이스 기록 완료")
             
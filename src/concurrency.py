@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+동시 실행 보조 모듈
+- TokenBucket: 분당 한도를 초당 보충 속도로 바꾼 토큰 버킷 (예약 방식 - 부족하면 기다릴 시간 반환)
+- RateLimiter: 요청 수/토큰 수 두 가지 한도를 함께 적용하는 API 호출 제한기
+- SingleFlight: 같은 키로 동시에 들어온 호출을 한 번의 실행으로 합침
+"""
+
+import time
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class TokenBucket:
+    """예약 방식 토큰 버킷 (잔량이 음수가 되면 그만큼 기다린 뒤 사용)"""
+    
+    def __init__(self, per_minute: float):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            per_minute: 분당 허용량 (버스트 용량도 같은 값)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0  # 초당 보충량
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 보충 (lock 보유 상태에서 호출)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, amount: float) -> float:
+        """
+        토큰 예약
+        
+        Args:
+            amount: 사용할 양 (용량보다 크면 용량으로 제한)
+            
+        Returns:
+            사용 전에 기다려야 하는 시간 (초)
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= min(amount, self.capacity)
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def adjust(self, delta: float):
+        """
+        실제 사용량 반영 (예약보다 적게 썼으면 양수로 돌려받음)
+        
+        Args:
+            delta: 잔량에 더할 값
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + delta)
+
+class RateLimiter:
+    """요청 수 / 토큰 수 분당 한도 제한기 (스레드 안전)"""
+    
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        제한기 초기화
+        
+        Args:
+            requests_per_minute: 분당 요청 수 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 한도 (0이면 제한 없음)
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.lock = threading.Lock()
+        self.stats = {
+            'acquired': 0,
+            'throttled': 0,
+            'wait_seconds_total': 0.0,
+            'max_wait_seconds': 0.0
+        }
+    
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        요청 한 건과 예상 토큰만큼 예약하고 한도에 맞을 때까지 대기
+        
+        Args:
+            estimated_tokens: 예상 토큰 수 (입력 + 최대 출력)
+            
+        Returns:
+            대기한 시간 (초)
+        """
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens and estimated_tokens:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+            
+        with self.lock:
+            self.stats['acquired'] += 1
+            if wait > 0:
+                self.stats['throttled'] += 1
+                self.stats['wait_seconds_total'] += wait
+                self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], wait)
+                
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """
+        응답의 실제 토큰 사용량으로 예약량 보정
+        
+        Args:
+            estimated_tokens: acquire 때 예약한 토큰 수
+            actual_tokens: 실제 사용 토큰 수
+        """
+        if self.tokens and estimated_tokens:
+            self.tokens.adjust(estimated_tokens - actual_tokens)
+    
+    def get_stats(self) -> Dict:
+        """대기 통계"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['wait_seconds_total'] = round(stats['wait_seconds_total'], 3)
+            stats['max_wait_seconds'] = round(stats['max_wait_seconds'], 3)
+            return stats
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 합침
+    
+    먼저 들어온 호출(leader)만 함수를 실행하고, 실행 중에 같은 키로 들어온 호출은
+    leader의 결과(또는 예외)를 공유받음. 실행이 끝나면 키를 지우므로 결과를 캐시하지는 않음
+    """
+    
+    def __init__(self):
+        """single-flight 초기화"""
+        self.lock = threading.Lock()
+        self.calls = {}  # 키 → 실행 중인 Future
+        self.stats = {
+            'leaders': 0,
+            'coalesced': 0,  # leader 결과를 기다려 받은 호출 수 (중복 실행을 피한 횟수)
+            'failures': 0
+        }
+    
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        키 단위로 함수 실행
+        
+        Args:
+            key: 합칠 기준 키
+            fn: 실행할 함수
+            
+        Returns:
+            (결과, 다른 호출의 결과를 공유받았는지 여부) - leader 예외는 대기 중인 호출에도 전달됨
+        """
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result(), True
+            
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self.resolve(key, exception=e)
+            raise
+        else:
+            self.resolve(key, result)
+            return result, False
+    
+    def claim(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        키 실행 권한 요청 (여러 키를 한 번에 처리하는 호출자용 - 예: 일괄 분석)
+        
+        leader가 되면 작업이 끝난 뒤 반드시 resolve()를 호출해야 하고,
+        아니면 반환된 Future로 leader의 결과를 기다림
+        
+        Args:
+            key: 합칠 기준 키
+            
+        Returns:
+            (키의 Future, leader 여부)
+        """
+        with self.lock:
+            future = self.calls.get(key)
+            if future is not None:
+                self.stats['coalesced'] += 1
+                return future, False
+            future = Future()
+            self.calls[key] = future
+            self.stats['leaders'] += 1
+            return future, True
+    
+    def resolve(self, key: Hashable, result: Any = None, exception: Optional[BaseException] = None):
+        """
+        leader 작업 완료 처리 (대기 중인 호출에 결과 또는 예외 전달 후 키 제거)
+        
+        Args:
+            key: claim()으로 leader가 된 키
+            result: 결과
+            exception: 실패한 경우 예외
+        """
+        with self.lock:
+            future = self.calls.pop(key, None)
+            if exception is not None:
+                self.stats['failures'] += 1
+        if future is None or future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    
+    def record_coalesced(self, count: int = 1):
+        """
+        다른 경로에서 미리 합친 호출 수 반영 (예: 일괄 분석에서 같은 키를 한 번만 요청한 경우)
+        
+        Args:
+            count: 합친 호출 수
+        """
+        with self.lock:
+            self.stats['coalesced'] += count
+    
+    def get_stats(self) -> Dict:
+        """합친 호출 통계"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['in_flight'] = len(self.calls)
+            return stats
@@ -5,12 +5,32 @@ PostgreSQL 데이터베이스 연결 및 관리 모듈
 
 import psycopg2
 import psycopg2.extras
+import io
 import yaml
 import hashlib
 import json
-from datetime import datetime
+import time
+import re
+from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Any
 import logging
+from .signature_cache import get_signature_cache
+from .db_pool import get_connection_pool
+from .prepared_statements import get_statement_registry
+
+# 시간 기준 range 파티션 대상 테이블 → 파티션 키
+PARTITIONED_TABLES = {
+    'error_logs': 'created_at',
+    'execution_history': 'executed_at'
+}
+
+# error_logs VARCHAR 컬럼 길이 (초과하면 배치 전체가 실패하므로 삽입 전에 잘라냄)
+ERROR_LOG_COLUMN_LIMITS = {
+    'error_type': 100,
+    'source_system': 50,
+    'severity': 20,
+    'elasticsearch_id': 100
+}
 
 class DatabaseManager:
     """PostgreSQL 데이터베이스 관리 클래스"""
@@ -24,8 +44,19 @@ class DatabaseManager:
         """
         self.config = self._load_config(config_path)
         self.conn = None
+        self.pool = None  # self.conn을 대여한 연결 풀 (반납은 반드시 같은 풀로)
         self.logger = logging.getLogger(__name__)
+        self.statements = get_statement_registry()
         
+        # 시간 기준 파티션 스키마 사용 여부 (sql/database_schema_partitioned.sql)
+        self.partition_config = self.config['database'].get('partitioning', {})
+        self.partitioned = self.partition_config.get('enabled', False)
+        self._partitions_ensured = False
+        
+        # 프로세스 공용 중복 시그니처 캐시 (Bloom 필터 + LRU)
+        cache_config = self.config['database'].get('signature_cache', {})
+        self.signature_cache = get_signature_cache(cache_config) if cache_config.get('enabled', True) else None
+    
     def _load_config(self, config_path: str) -> Dict:
         """설정 파일 로드 (환경 변수 포함)"""
         try:
@@ -35,34 +66,137 @@ class DatabaseManager:
             raise Exception(f"설정 파일을 읽을 수 없습니다: {e}")
     
     def connect(self) -> bool:
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (프로세스 공용 연결 풀에서 대여)"""
         try:
-            db_config = self.config['database']
-            self.conn = psycopg2.connect(
-                host=db_config['host'],
-                port=db_config['port'],
-                database=db_config['name'],
-                user=db_config['user'],
-                password=db_config['password']
-            )
-            self.conn.autocommit = False
-            self.logger.info("데이터베이스 연결 성공")
+            # 이미 대여한 연결이 있으면 그대로 사용 (끊어진 연결은 풀에서 제외)
+            if self.conn is not None:
+                if not self.conn.closed:
+                    return True
+                self.disconnect()
+                
+            self.pool = get_connection_pool(self.config['database'])
+            self.conn = self.pool.getconn()
+            self.logger.debug("데이터베이스 연결 대여")
+            
+            # 최초 연결 시 기존 시그니처로 캐시 채우기
+            if self.signature_cache and not self.signature_cache.warmed:
+                self.warm_signature_cache()
+                
+            # 최초 연결 시 앞으로 사용할 파티션 생성
+            if self.partitioned and not self._partitions_ensured:
+                self._partitions_ensured = self.ensure_partitions() is not None
             return True
         except Exception as e:
             self.logger.error(f"데이터베이스 연결 실패: {e}")
             return False
     
     def disconnect(self):
-        """데이터베이스 연결 해제"""
+        """데이터베이스 연결 해제 (연결 풀에 반납)"""
         if self.conn:
-            self.conn.close()
-            self.logger.info("데이터베이스 연결 해제")
+            conn, self.conn = self.conn, None
+            self.pool.putconn(conn)
+            self.logger.debug("데이터베이스 연결 반납")
+    
+    def get_statement_stats(self) -> Dict[str, Dict]:
+        """prepared statement별 PREPARE/EXECUTE 횟수 및 소요 시간"""
+        return self.statements.get_stats()
+    
+    def get_pool_metrics(self) -> Dict:
+        """연결 풀 사용량 지표"""
+        pool = self.pool or get_connection_pool(self.config['database'])
+        return pool.get_metrics()
+    
+    def warm_signature_cache(self) -> int:
+        """
+        error_logs의 기존 해시 시그니처로 중복 캐시 채우기
+        
+        Returns:
+            적재된 시그니처 수
+        """
+        if not self.signature_cache:
+            return 0
+            
+        try:
+            # 서버 사이드 커서로 나눠서 읽음 (테이블 전체를 메모리에 올리지 않음)
+            cursor = self.conn.cursor(name='signature_cache_warm')
+            cursor.itersize = 10000
+            if self.partitioned:
+                cursor.execute("SELECT hash_signature FROM error_signatures ORDER BY first_seen_at")
+            else:
+                cursor.execute("SELECT hash_signature FROM error_logs ORDER BY id")
+            
+            count = self.signature_cache.warm(row[0] for row in cursor)
+            cursor.close()
+            self.conn.commit()
+            
+            self.logger.info(f"시그니처 캐시 적재 완료: {count}개")
+            return count
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"시그니처 캐시 적재 실패: {e}")
+            return 0
+    
+    def get_signature_cache_stats(self) -> Dict:
+        """중복 시그니처 캐시 hit/miss 통계"""
+        if not self.signature_cache:
+            return {}
+        return self.signature_cache.get_stats()
     
     def create_hash_signature(self, error_type: str, error_message: str) -> str:
         """에러 해시 시그니처 생성 (중복 방지용)"""
         combined = f"{error_type}:{error_message}"
         return hashlib.sha256(combined.encode()).hexdigest()
     
+    def create_error_signature(self, error_data: Dict) -> str:
+        """
+        에러 데이터의 해시 시그니처 생성
+        
+        메시지 템플릿(TemplateMiner 마스킹 결과)이 있으면 원문 대신 템플릿을 사용하므로
+        파드 이름, IP, 요청 ID 등만 다른 에러는 같은 시그니처를 가짐
+        (클러스터 템플릿과 달리 이전에 본 메시지에 따라 바뀌지 않음)
+        
+        Args:
+            error_data: 에러 정보 딕셔너리
+            
+        Returns:
+            해시 시그니처
+        """
+        return self.create_hash_signature(
+            error_data['error_type'],
+            error_data.get('message_template') or error_data['error_message']
+        )
+    
+    def _error_log_params(self, error_data: Dict, hash_signature: str) -> tuple:
+        """
+        error_logs 삽입 파라미터 구성 (VARCHAR 컬럼은 길이 제한에 맞춰 자름)
+        
+        Args:
+            error_data: 에러 정보 딕셔너리
+            hash_signature: 해시 시그니처
+            
+        Returns:
+            (error_type, error_message, source_system, severity,
+             stack_trace, elasticsearch_id, raw_log_data, hash_signature)
+        """
+        def limited(column: str, value: Any) -> Optional[str]:
+            if value is None:
+                return None
+            return str(value)[:ERROR_LOG_COLUMN_LIMITS[column]]
+            
+        stack_trace = error_data.get('stack_trace')
+        return (
+            limited('error_type', error_data['error_type']),
+            str(error_data['error_message']),
+            limited('source_system', error_data.get('source_system') or 'unknown'),
+            limited('severity', error_data.get('severity') or 'ERROR'),
+            str(stack_trace) if stack_trace is not None else None,
+            limited('elasticsearch_id', error_data.get('elasticsearch_id')),
+            # 원본 문서 대신 Elasticsearch 참조(index/id)를 저장
+            json.dumps(error_data.get('raw_log_ref') or error_data.get('raw_log_data', {}), default=str),
+            hash_signature
+        )
+    
     def insert_error_log(self, error_data: Dict) -> Optional[int]:
         """
         에러 로그 삽입
@@ -74,46 +208,53 @@ class DatabaseManager:
             에러 로그 ID 또는 None
         """
         try:
-            cursor = self.conn.cursor()
-            
             # 해시 시그니처 생성
-            hash_signature = self.create_hash_signature(
-                error_data['error_type'], 
-                error_data['error_message']
-            )
+            hash_signature = self.create_error_signature(error_data)
             
-            # 중복 체크
-            cursor.execute(
-                "SELECT id FROM error_logs WHERE hash_signature = %s",
-                (hash_signature,)
-            )
-            
-            if cursor.fetchone():
-                self.logger.info(f"중복 에러 로그 무시: {hash_signature}")
+            # 최근에 확인된 시그니처는 DB 조회 없이 중복 처리
+            cache = self.signature_cache
+            if cache and cache.is_known_duplicate(hash_signature):
+                self.logger.debug(f"중복 에러 로그 무시 (캐시): {hash_signature}")
                 return None
             
-            # 에러 로그 삽입
-            insert_query = """
-                INSERT INTO error_logs (
-                    error_type, error_message, source_system, severity,
-                    stack_trace, elasticsearch_id, raw_log_data, hash_signature
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """
+            cursor = self.conn.cursor()
             
-            cursor.execute(insert_query, (
-                error_data['error_type'],
-                error_data['error_message'],
-                error_data.get('source_system', 'unknown'),
-                error_data.get('severity', 'ERROR'),
-                error_data.get('stack_trace'),
-                error_data.get('elasticsearch_id'),
-                json.dumps(error_data.get('raw_log_data', {})),
-                hash_signature
-            ))
+            # 중복 체크 (Bloom 필터에 없으면 새 시그니처가 확실하므로 생략)
+            bloom_positive = cache.might_exist(hash_signature) if cache else True
+            if bloom_positive:
+                exists_statement = 'error_signature_exists' if self.partitioned else 'error_log_exists'
+                self.statements.execute(cursor, exists_statement, (hash_signature,))
+                
+                if cursor.fetchone():
+                    if cache:
+                        cache.record(hash_signature, inserted=False)
+                    self.logger.info(f"중복 에러 로그 무시: {hash_signature}")
+                    return None
+                    
+            params = self._error_log_params(error_data, hash_signature)
             
-            error_id = cursor.fetchone()[0]
+            if self.partitioned:
+                # 시그니처 게이트에 먼저 등록 (이미 있으면 중복)
+                self.statements.execute(cursor, 'claim_error_signature', (hash_signature,))
+                row = cursor.fetchone()
+                if row is not None:
+                    self.statements.execute(cursor, 'insert_error_log_partitioned', params)
+                    row = cursor.fetchone()
+            else:
+                # 에러 로그 삽입 (다른 프로세스가 먼저 넣은 경우는 ON CONFLICT로 무시)
+                self.statements.execute(cursor, 'insert_error_log', params)
+                row = cursor.fetchone()
+                
             self.conn.commit()
+            
+            if cache:
+                cache.record(hash_signature, inserted=row is not None, bloom_positive=bloom_positive)
+                
+            if row is None:
+                self.logger.info(f"중복 에러 로그 무시: {hash_signature}")
+                return None
+                
+            error_id = row[0]
             self.logger.info(f"에러 로그 삽입 완료: ID={error_id}")
             return error_id
             
@@ -122,6 +263,164 @@ class DatabaseManager:
             self.logger.error(f"에러 로그 삽입 실패: {e}")
             return None
     
+    def insert_error_logs_bulk(self, errors: List[Dict]) -> List[Optional[int]]:
+        """
+        에러 로그 일괄 삽입 (한 번의 INSERT ... ON CONFLICT 또는 COPY + 커밋 한 번)
+        
+        bulk_copy_threshold 이상이면 임시 스테이징 테이블에 COPY로 적재한 뒤
+        INSERT ... SELECT로 옮김. 배치가 실패하면 한 건씩 다시 삽입해
+        문제가 있는 행만 실패로 처리함
+        
+        Args:
+            errors: 에러 정보 딕셔너리 리스트
+            
+        Returns:
+            입력 순서와 같은 에러 로그 ID 리스트 (중복/실패는 None)
+        """
+        if not errors:
+            return []
+            
+        try:
+            cache = self.signature_cache
+            signatures = [self.create_error_signature(error_data) for error_data in errors]
+            
+            # 캐시에서 중복으로 확인된 것과 배치 내 중복을 제외한 행 구성
+            rows = []
+            pending = set()
+            for error_data, hash_signature in zip(errors, signatures):
+                if hash_signature in pending:
+                    continue
+                if cache and cache.is_known_duplicate(hash_signature):
+                    continue
+                pending.add(hash_signature)
+                rows.append(self._error_log_params(error_data, hash_signature))
+                
+            if not rows:
+                return [None] * len(errors)
+                
+            cursor = self.conn.cursor()
+            copy_threshold = self.config['database'].get('bulk_copy_threshold', 5000)
+            conflict_clause = "ON CONFLICT (hash_signature) DO NOTHING"
+            
+            if self.partitioned:
+                # 시그니처 게이트에 새로 등록된 행만 삽입 (파티션 테이블에는 hash_signature UNIQUE가 없음)
+                claimed = psycopg2.extras.execute_values(
+                    cursor,
+                    """
+                    INSERT INTO error_signatures (hash_signature) VALUES %s
+                    ON CONFLICT (hash_signature) DO NOTHING
+                    RETURNING hash_signature
+                    """,
+                    [(row[7],) for row in rows],
+                    page_size=len(rows),
+                    fetch=True
+                )
+                claimed = {row[0] for row in claimed}
+                rows = [row for row in rows if row[7] in claimed]
+                conflict_clause = ""
+                
+            if not rows:
+                returned = []
+            elif len(rows) >= copy_threshold:
+                returned = self._copy_error_logs(cursor, rows, conflict_clause)
+            else:
+                returned = psycopg2.extras.execute_values(
+                    cursor,
+                    """
+                    INSERT INTO error_logs (
+                        error_type, error_message, source_system, severity,
+                        stack_trace, elasticsearch_id, raw_log_data, hash_signature
+                    ) VALUES %s
+                    {conflict_clause}
+                    RETURNING id, hash_signature
+                    """.format(conflict_clause=conflict_clause),
+                    rows,
+                    page_size=len(rows),
+                    fetch=True
+                )
+                
+            self.conn.commit()
+            inserted = {hash_signature: error_id for error_id, hash_signature in returned}
+            
+            if cache:
+                for hash_signature in pending:
+                    cache.record(hash_signature, inserted=hash_signature in inserted)
+                    
+            # 반환된 ID를 입력 순서에 맞춰 매핑 (같은 시그니처는 첫 번째 에러에만 부여)
+            error_ids = []
+            for hash_signature in signatures:
+                error_ids.append(inserted.pop(hash_signature, None))
+                
+            self.logger.info(f"에러 로그 일괄 삽입 완료: {len(returned)}개 삽입, {len(errors) - len(returned)}개 중복 무시")
+            return error_ids
+            
+        except Exception as e:
+            self.conn.rollback()
+            if len(errors) == 1 or self.conn.closed:
+                self.logger.error(f"에러 로그 일괄 삽입 실패: {e}")
+                return [None] * len(errors)
+                
+            # 일부 행 때문에 배치 전체가 실패한 경우 한 건씩 다시 삽입해 나머지는 저장
+            self.logger.warning(f"에러 로그 일괄 삽입 실패 - {len(errors)}건을 한 건씩 다시 삽입: {e}")
+            return [self.insert_error_log(error_data) for error_data in errors]
+    
+    def _copy_error_logs(self, cursor, rows: List[tuple], conflict_clause: str = "") -> List[tuple]:
+        """
+        COPY로 스테이징 테이블에 적재 후 error_logs로 이동
+        
+        Args:
+            cursor: 데이터베이스 커서
+            rows: 삽입할 행 리스트
+            conflict_clause: INSERT에 붙일 ON CONFLICT 절
+            
+        Returns:
+            (id, hash_signature) 리스트
+        """
+        # 트랜잭션이 끝나면 비워지는 세션 임시 테이블
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS error_logs_staging (
+                error_type VARCHAR(100),
+                error_message TEXT,
+                source_system VARCHAR(50),
+                severity VARCHAR(20),
+                stack_trace TEXT,
+                elasticsearch_id VARCHAR(100),
+                raw_log_data JSONB,
+                hash_signature VARCHAR(64)
+            ) ON COMMIT DELETE ROWS
+        """)
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(self._copy_value(value) for value in row))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        cursor.copy_expert("COPY error_logs_staging FROM STDIN", buffer)
+        cursor.execute("""
+            INSERT INTO error_logs (
+                error_type, error_message, source_system, severity,
+                stack_trace, elasticsearch_id, raw_log_data, hash_signature
+            )
+            SELECT error_type, error_message, source_system, severity,
+                   stack_trace, elasticsearch_id, raw_log_data, hash_signature
+            FROM error_logs_staging
+            {conflict_clause}
+            RETURNING id, hash_signature
+        """.format(conflict_clause=conflict_clause))
+        return cursor.fetchall()
+    
+    @staticmethod
+    def _copy_value(value) -> str:
+        """COPY text 형식 값 변환 (NULL 및 특수문자 이스케이프)"""
+        if value is None:
+            return '\\N'
+        return (str(value)
+                .replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+    
     def get_solution_by_error_hash(self, error_hash: str) -> Optional[Dict]:
         """
         에러 해시로 해결책 조회
@@ -135,14 +434,7 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
-            query = """
-                SELECT * FROM solutions 
-                WHERE error_hash = %s 
-                ORDER BY success_rate DESC, execution_count DESC
-                LIMIT 1
-            """
-            
-            cursor.execute(query, (error_hash,))
+            self.statements.execute(cursor, 'solution_by_error_hash', (error_hash,))
             result = cursor.fetchone()
             
             if result:
@@ -153,6 +445,77 @@ class DatabaseManager:
             self.logger.error(f"해결책 조회 실패: {e}")
             return None
     
+    def get_best_solutions(self, limit: int = 5000) -> List[Dict]:
+        """
+        에러 해시별 최적 해결책 조회 (해결책 캐시 적재용)
+        
+        Args:
+            limit: 최대 개수 (최근 갱신된 해시 우선)
+            
+        Returns:
+            해결책 리스트 (오래 갱신되지 않은 것부터)
+        """
+        try:
+            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            
+            # get_solution_by_error_hash와 같은 순서로 해시별 1개 선택
+            query = """
+                SELECT * FROM (
+                    SELECT * FROM (
+                        SELECT DISTINCT ON (error_hash)
+                               id, error_hash, solution_type, solution_description, solution_commands,
+                               success_rate, execution_count, last_success_at, ai_analysis,
+                               created_at, updated_at
+                        FROM solutions
+                        ORDER BY error_hash, success_rate DESC, execution_count DESC
+                    ) best
+                    ORDER BY updated_at DESC
+                    LIMIT %s
+                ) recent
+                ORDER BY updated_at ASC
+            """
+            
+            cursor.execute(query, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
+            
+        except Exception as e:
+            self.logger.error(f"해결책 목록 조회 실패: {e}")
+            return []
+    
+    def get_solution_messages(self, error_hashes: Optional[List[str]] = None, limit: int = 5000) -> List[Dict]:
+        """
+        해결책이 있는 에러 해시의 대표 에러 메시지 조회 (유사도 인덱스 구축용)
+        
+        Args:
+            error_hashes: 조회할 해시 목록 (None이면 전체)
+            limit: 최대 개수 (최근 에러 우선)
+            
+        Returns:
+            {error_hash, error_type, error_message} 리스트
+        """
+        try:
+            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            
+            # hash_signature는 UNIQUE이므로 해시당 1행
+            query = """
+                SELECT e.hash_signature AS error_hash, e.error_type, e.error_message
+                FROM error_logs e
+                WHERE EXISTS (SELECT 1 FROM solutions s WHERE s.error_hash = e.hash_signature)
+            """
+            params = []
+            if error_hashes is not None:
+                query += " AND e.hash_signature = ANY(%s)"
+                params.append(list(error_hashes))
+            query += " ORDER BY e.id DESC LIMIT %s"
+            params.append(limit)
+            
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+            
+        except Exception as e:
+            self.logger.error(f"해결책 에러 메시지 조회 실패: {e}")
+            return []
+    
     def insert_solution(self, solution_data: Dict) -> Optional[int]:
         """
         해결책 삽입
@@ -205,14 +568,7 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor()
             
-            insert_query = """
-                INSERT INTO execution_history (
-                    error_log_id, solution_id, execution_status,
-                    execution_output, execution_time
-                ) VALUES (%s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
+            self.statements.execute(cursor, 'insert_execution', (
                 execution_data['error_log_id'],
                 execution_data['solution_id'],
                 execution_data['execution_status'],
@@ -229,6 +585,240 @@ class DatabaseManager:
             self.logger.error(f"실행 이력 기록 실패: {e}")
             return False
     
+    def record_executions_bulk(self, executions: List[Dict]) -> Optional[int]:
+        """
+        실행 이력 일괄 기록 (한 번의 INSERT와 커밋)
+        
+        일괄 INSERT가 실패하면 한 건씩 savepoint로 다시 넣어 문제가 있는 행
+        (정리로 삭제된 에러 로그/해결책 참조, 길이 초과 등)만 건너뛰고 나머지는 기록함
+        
+        Args:
+            executions: 실행 정보 리스트
+            
+        Returns:
+            기록된 행 수 또는 None (연결 장애 등으로 아무것도 기록되지 않음 - 다시 시도 가능)
+        """
+        if not executions:
+            return 0
+            
+        rows = [
+            (
+                execution_data['error_log_id'],
+                execution_data['solution_id'],
+                execution_data['execution_status'],
+                execution_data.get('execution_output', ''),
+                execution_data.get('execution_time')
+            )
+            for execution_data in executions
+        ]
+        insert_sql = """
+            INSERT INTO execution_history (
+                error_log_id, solution_id, execution_status,
+                execution_output, execution_time
+            ) VALUES %s
+        """
+        
+        try:
+            cursor = self.conn.cursor()
+            psycopg2.extras.execute_values(cursor, insert_sql, rows, page_size=len(rows))
+            self.conn.commit()
+            self.logger.info(f"실행 이력 일괄 기록 완료: {len(rows)}개")
+            return len(rows)
+            
+        except Exception as e:
+            if self.conn.closed:
+                self.logger.error(f"실행 이력 일괄 기록 실패 (연결 끊김): {e}")
+                return None
+            self.conn.rollback()
+            self.logger.warning(f"실행 이력 일괄 기록 실패 - {len(rows)}건을 한 건씩 다시 기록: {e}")
+            
+        try:
+            cursor = self.conn.cursor()
+            written = 0
+            for row in rows:
+                cursor.execute("SAVEPOINT execution_row")
+                try:
+                    psycopg2.extras.execute_values(cursor, insert_sql, [row])
+                except (psycopg2.DataError, psycopg2.IntegrityError) as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT execution_row")
+                    self.logger.error(f"실행 이력 기록 건너뜀 (error_log_id={row[0]}, solution_id={row[1]}): {e}")
+                    continue
+                cursor.execute("RELEASE SAVEPOINT execution_row")
+                written += 1
+                
+            self.conn.commit()
+            self.logger.info(f"실행 이력 기록 완료: {written}개 (건너뜀 {len(rows) - written}개)")
+            return written
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"실행 이력 기록 실패: {e}")
+            return None
+    
+    def reconcile_solution_stats(self) -> Optional[int]:
+        """
+        실행 이력에서 해결책 통계(execution_count, success_count, success_rate, last_success_at) 재계산
+        
+        트리거는 카운터를 증분으로만 갱신하므로 마이그레이션 직후나 수동 수정으로
+        값이 어긋났을 때 한 번 실행함 (보관 기간 정리로 삭제된 이력은 집계에서 빠짐)
+        
+        Returns:
+            값이 바뀐 해결책 수 또는 None
+        """
+        try:
+            cursor = self.conn.cursor()
+            
+            reconcile_query = """
+                WITH stats AS (
+                    SELECT
+                        s.id,
+                        COUNT(h.solution_id) AS execution_count,
+                        COUNT(h.solution_id) FILTER (WHERE h.execution_status = 'success') AS success_count,
+                        MAX(h.executed_at) FILTER (WHERE h.execution_status = 'success') AS last_success_at
+                    FROM solutions s
+                    LEFT JOIN execution_history h ON h.solution_id = s.id
+                    GROUP BY s.id
+                )
+                UPDATE solutions s
+                SET
+                    execution_count = stats.execution_count,
+                    success_count = stats.success_count,
+                    success_rate = CASE
+                        WHEN stats.execution_count = 0 THEN 0
+                        ELSE stats.success_count * 100.0 / stats.execution_count
+                    END,
+                    last_success_at = COALESCE(stats.last_success_at, s.last_success_at),
+                    updated_at = CURRENT_TIMESTAMP
+                FROM stats
+                WHERE s.id = stats.id
+                AND (s.execution_count IS DISTINCT FROM stats.execution_count
+                     OR s.success_count IS DISTINCT FROM stats.success_count)
+            """
+            
+            cursor.execute(reconcile_query)
+            updated = cursor.rowcount
+            self.conn.commit()
+            self.logger.info(f"해결책 통계 재계산 완료: {updated}개 갱신")
+            return updated
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"해결책 통계 재계산 실패: {e}")
+            return None
+    
+    def add_reuse_count(self, count: int) -> bool:
+        """
+        DB 해결책 재사용 횟수를 현재 시간 집계에 더함
+        
+        Args:
+            count: 재사용 횟수
+            
+        Returns:
+            성공 여부
+        """
+        try:
+            cursor = self.conn.cursor()
+            
+            cursor.execute("""
+                INSERT INTO resolution_rollup_hourly (bucket, db_reuses)
+                VALUES (date_trunc('hour', CURRENT_TIMESTAMP), %s)
+                ON CONFLICT (bucket)
+                DO UPDATE SET db_reuses = resolution_rollup_hourly.db_reuses + EXCLUDED.db_reuses
+            """, (count,))
+            
+            self.conn.commit()
+            return True
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"재사용 횟수 기록 실패: {e}")
+            return False
+    
+    def get_rollup_stats(self, window_hours: int = 24, top_n: int = 5) -> Dict:
+        """
+        시간별 집계 테이블에서 분석 통계 조회 (조회 비용은 이력 크기와 무관하게 구간 시간 수에 비례)
+        
+        Args:
+            window_hours: 집계 구간 (최근 N시간)
+            top_n: 상위 에러 타입/소스 개수
+            
+        Returns:
+            통계 정보 (실패 시 빈 딕셔너리)
+        """
+        try:
+            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            # 문자열 리터럴 안에 파라미터를 넣지 않고 정수 × 1시간 간격으로 계산
+            since = "date_trunc('hour', CURRENT_TIMESTAMP) - %s * INTERVAL '1 hour'"
+            window_hours = int(window_hours)
+            
+            cursor.execute(f"""
+                SELECT error_type, SUM(error_count) AS count
+                FROM error_rollup_hourly
+                WHERE bucket >= {since}
+                GROUP BY error_type
+                ORDER BY count DESC
+            """, (window_hours,))
+            error_types = [{'error_type': row['error_type'], 'count': int(row['count'])} for row in cursor.fetchall()]
+            
+            cursor.execute(f"""
+                SELECT source_system, SUM(error_count) AS count
+                FROM error_rollup_hourly
+                WHERE bucket >= {since}
+                GROUP BY source_system
+                ORDER BY count DESC
+                LIMIT %s
+            """, (window_hours, top_n))
+            top_sources = [{'source_system': row['source_system'], 'count': int(row['count'])} for row in cursor.fetchall()]
+            
+            cursor.execute(f"""
+                SELECT
+                    COALESCE(SUM(ai_analyses), 0) AS ai_analyses,
+                    COALESCE(SUM(db_reuses), 0) AS db_reuses,
+                    COALESCE(SUM(executions), 0) AS executions,
+                    COALESCE(SUM(successes), 0) AS successes,
+                    COALESCE(SUM(execution_seconds_total), 0) AS execution_seconds_total,
+                    COALESCE(MAX(execution_seconds_max), 0) AS execution_seconds_max
+                FROM resolution_rollup_hourly
+                WHERE bucket >= {since}
+            """, (window_hours,))
+            resolution = cursor.fetchone()
+            
+            # 해결책은 에러 해시당 하나씩 쌓이므로 이력과 달리 직접 집계
+            cursor.execute("""
+                SELECT COUNT(*) AS total_solutions, COALESCE(AVG(success_rate), 0) AS avg_success_rate
+                FROM solutions
+            """)
+            solutions = cursor.fetchone()
+            self.conn.commit()
+            
+            ai_analyses = int(resolution['ai_analyses'])
+            db_reuses = int(resolution['db_reuses'])
+            executions = int(resolution['executions'])
+            successes = int(resolution['successes'])
+            analyses = ai_analyses + db_reuses
+            
+            return {
+                'total_solutions': int(solutions['total_solutions']),
+                'avg_success_rate': round(float(solutions['avg_success_rate']), 2),
+                'window_hours': window_hours,
+                'total_errors': sum(row['count'] for row in error_types),
+                'top_error_types': error_types[:top_n],
+                'top_sources': top_sources,
+                'ai_analyses': ai_analyses,
+                'db_reuses': db_reuses,
+                'reuse_rate': round(db_reuses * 100.0 / analyses, 2) if analyses else 0,
+                'executions': executions,
+                'successful_executions': successes,
+                'resolution_success_rate': round(successes * 100.0 / executions, 2) if executions else 0,
+                'avg_execution_seconds': round(float(resolution['execution_seconds_total']) / executions, 3) if executions else 0,
+                'max_execution_seconds': round(float(resolution['execution_seconds_max']), 3)
+            }
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"집계 통계 조회 실패: {e}")
+            return {}
+    
     def get_error_patterns(self) -> List[Dict]:
         """에러 패턴 조회"""
         try:
@@ -246,6 +836,25 @@ class DatabaseManager:
             self.logger.error(f"에러 패턴 조회 실패: {e}")
             return []
     
+    def get_error_patterns_version(self) -> Optional[str]:
+        """
+        에러 패턴 버전 조회 (행 수 + 최신 updated_at - 추가/수정/삭제 시 바뀜)
+        
+        Returns:
+            버전 문자열 또는 None
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM error_patterns")
+            count, updated_at = cursor.fetchone()
+            self.conn.commit()
+            return f"{count}:{updated_at.isoformat() if updated_at else '-'}"
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"에러 패턴 버전 조회 실패: {e}")
+            return None
+    
     def update_system_status(self, component: str, status: str, error_count: int = 0) -> bool:
         """
         시스템 상태 업데이트
@@ -261,21 +870,11 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor()
             
-            update_query = """
-                UPDATE system_status 
-                SET status = %s, error_count = %s, last_check = CURRENT_TIMESTAMP
-                WHERE component_name = %s
-            """
-            
-            cursor.execute(update_query, (status, error_count, component))
+            self.statements.execute(cursor, 'update_system_status', (status, error_count, component))
             
             if cursor.rowcount == 0:
                 # 컴포넌트가 없으면 삽입
-                insert_query = """
-                    INSERT INTO system_status (component_name, status, error_count)
-                    VALUES (%s, %s, %s)
-                """
-                cursor.execute(insert_query, (component, status, error_count))
+                self.statements.execute(cursor, 'insert_system_status', (component, status, error_count))
             
             self.conn.commit()
             return True
@@ -285,6 +884,36 @@ class DatabaseManager:
             self.logger.error(f"시스템 상태 업데이트 실패: {e}")
             return False
     
+    def update_system_statuses(self, statuses: Dict[str, tuple]) -> bool:
+        """
+        여러 컴포넌트 상태를 한 트랜잭션으로 업데이트
+        
+        Args:
+            statuses: {컴포넌트 명: (상태, 에러 카운트)}
+            
+        Returns:
+            성공 여부
+        """
+        if not statuses:
+            return True
+            
+        try:
+            cursor = self.conn.cursor()
+            
+            for component, (status, error_count) in statuses.items():
+                self.statements.execute(cursor, 'update_system_status', (status, error_count, component))
+                if cursor.rowcount == 0:
+                    # 컴포넌트가 없으면 삽입
+                    self.statements.execute(cursor, 'insert_system_status', (component, status, error_count))
+                    
+            self.conn.commit()
+            return True
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"시스템 상태 일괄 업데이트 실패: {e}")
+            return False
+    
     def get_system_status(self) -> List[Dict]:
         """전체 시스템 상태 조회"""
         try:
@@ -299,12 +928,41 @@ class DatabaseManager:
             self.logger.error(f"시스템 상태 조회 실패: {e}")
             return []
     
-    def cleanup_old_error_logs(self, retention_days: int = 7) -> bool:
+    def get_search_cursor(self, cursor_name: str) -> Optional[List]:
         """
-        오래된 에러 로그 및 관련 데이터 정리
+        저장된 증분 검색 커서 조회
         
         Args:
-            retention_days: 보관 기간 (일)
+            cursor_name: 커서 이름
+            
+        Returns:
+            search_after 정렬값 리스트 또는 None
+        """
+        try:
+            cursor = self.conn.cursor()
+            
+            cursor.execute(
+                "SELECT sort_values FROM search_cursors WHERE cursor_name = %s",
+                (cursor_name,)
+            )
+            result = cursor.fetchone()
+            
+            if result:
+                return result[0]
+            return None
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"검색 커서 조회 실패: {e}")
+            return None
+    
+    def save_search_cursor(self, cursor_name: str, sort_values: List) -> bool:
+        """
+        증분 검색 커서 저장 (upsert)
+        
+        Args:
+            cursor_name: 커서 이름
+            sort_values: 마지막으로 처리한 문서의 정렬값
             
         Returns:
             성공 여부
@@ -312,37 +970,335 @@ class DatabaseManager:
         try:
             cursor = self.conn.cursor()
             
-            # 오래된 실행 이력 삭제 (가장 오래된 데이터부터)
-            delete_execution_query = """
-                DELETE FROM execution_history 
-                WHERE created_at < NOW() - INTERVAL '%s days'
+            upsert_query = """
+                INSERT INTO search_cursors (cursor_name, sort_values, updated_at)
+                VALUES (%s, %s, CURRENT_TIMESTAMP)
+                ON CONFLICT (cursor_name) DO UPDATE
+                SET sort_values = EXCLUDED.sort_values, updated_at = CURRENT_TIMESTAMP
             """
-            cursor.execute(delete_execution_query, (retention_days,))
-            execution_deleted = cursor.rowcount
             
-            # 오래된 해결책 삭제 (참조되지 않는 것만)
-            delete_solutions_query = """
-                DELETE FROM solutions 
-                WHERE created_at < NOW() - INTERVAL '%s days'
-                AND id NOT IN (
-                    SELECT DISTINCT solution_id FROM execution_history 
-                    WHERE solution_id IS NOT NULL
-                )
-            """
-            cursor.execute(delete_solutions_query, (retention_days,))
-            solutions_deleted = cursor.rowcount
+            cursor.execute(upsert_query, (cursor_name, json.dumps(sort_values)))
+            self.conn.commit()
+            return True
             
-            # 오래된 에러 로그 삭제 (가장 오래된 데이터부터)
-            delete_errors_query = """
-                DELETE FROM error_logs 
-                WHERE created_at < NOW() - INTERVAL '%s days'
-            """
-            cursor.execute(delete_errors_query, (retention_days,))
-            errors_deleted = cursor.rowcount
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"검색 커서 저장 실패: {e}")
+            return False
+    
+    def _partition_step(self) -> timedelta:
+        """파티션 하나의 기간 (daily 또는 weekly)"""
+        return timedelta(weeks=1) if self.partition_config.get('interval', 'daily') == 'weekly' else timedelta(days=1)
+    
+    def ensure_partitions(self, premake: Optional[int] = None) -> Optional[int]:
+        """
+        어제부터 premake개 구간 앞까지의 파티션 생성 (이미 있으면 건너뜀)
+        
+        기준 날짜는 파티션 키 기본값(CURRENT_TIMESTAMP)과 같은 DB 세션 시간대의 날짜를 사용하고,
+        시간대 차이로 DEFAULT 파티션에 들어가는 행이 없도록 하루 앞 구간부터 생성함
+        
+        Args:
+            premake: 미리 만들 파티션 수 (기본값: partitioning.premake)
+            
+        Returns:
+            새로 생성된 파티션 수 또는 None (실패)
+        """
+        premake = self.partition_config.get('premake', 7) if premake is None else premake
+        step = self._partition_step()
+            
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT CURRENT_DATE - 1")
+            start = cursor.fetchone()[0]
+            if step.days == 7:
+                start -= timedelta(days=start.weekday())  # 주별 파티션은 월요일 시작
+            created = 0
+            
+            for table in PARTITIONED_TABLES:
+                existing = set(self._list_partitions(cursor, table))
+                for i in range(premake + 2):
+                    lower = start + step * i
+                    name = f"{table}_p{lower:%Y%m%d}"
+                    if name in existing:
+                        continue
+                    self._create_partition(cursor, table, name, lower, lower + step)
+                    created += 1
+                    
+            self.conn.commit()
+            if created:
+                self.logger.info(f"파티션 {created}개 생성 완료")
+            return created
             
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"파티션 생성 실패: {e}")
+            return None
+    
+    def _create_partition(self, cursor, table: str, name: str, lower: date, upper: date):
+        """
+        범위 파티션 생성 (DEFAULT 파티션에 해당 범위의 행이 있으면 새 파티션으로 옮긴 뒤 연결)
+        
+        DEFAULT 파티션에 범위가 겹치는 행이 남아 있으면 PARTITION OF 생성이 실패하므로
+        같은 트랜잭션에서 별도 테이블로 만들어 행을 옮기고 ATTACH 함
+        
+        Args:
+            cursor: 데이터베이스 커서
+            table: 파티션 부모 테이블
+            name: 새 파티션 이름
+            lower: 하한 (포함)
+            upper: 상한 (제외)
+        """
+        key = PARTITIONED_TABLES[table]
+        bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        default = f"{table}_default"
+        
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (default,))
+        if cursor.fetchone()[0]:
+            cursor.execute(
+                f"SELECT 1 FROM {default} WHERE {key} >= %s AND {key} < %s LIMIT 1",
+                (lower, upper)
+            )
+            if cursor.fetchone():
+                cursor.execute(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+                cursor.execute(f"""
+                    WITH moved AS (
+                        DELETE FROM {default} WHERE {key} >= %s AND {key} < %s RETURNING *
+                    )
+                    INSERT INTO {name} SELECT * FROM moved
+                """, (lower, upper))
+                self.logger.info(f"DEFAULT 파티션의 행 {cursor.rowcount}개를 {name}로 이동")
+                cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {name} {bounds}")
+                return
+                
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} {bounds}")
+    
+    def _list_partitions(self, cursor, table: str) -> Dict[str, Optional[datetime]]:
+        """
+        파티션 목록과 각 파티션의 상한(TO) 조회
+        
+        Args:
+            cursor: 데이터베이스 커서
+            table: 파티션 부모 테이블
+            
+        Returns:
+            {파티션 이름: 상한 시각}
+        """
+        cursor.execute("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = %s
+        """, (table,))
+        
+        partitions = {}
+        for name, bound in cursor.fetchall():
+            # 예: FOR VALUES FROM ('2024-01-01 00:00:00') TO ('2024-01-02 00:00:00')
+            match = re.search(r"TO \('([^']+)'\)", bound or '')
+            partitions[name] = datetime.fromisoformat(match.group(1)) if match else None
+        return partitions
+    
+    def drop_expired_partitions(self, table: str, retention_days: int) -> int:
+        """
+        보존 기간이 지난 파티션을 분리(DETACH) 후 삭제 - 행 단위 DELETE 없이 정리
+        
+        파티션의 모든 행이 보존 기간을 넘었을 때(상한 <= 기준 시각)만 삭제하므로
+        최대 파티션 하나 기간만큼 더 보관될 수 있음
+        
+        Args:
+            table: 파티션 부모 테이블 (error_logs 또는 execution_history)
+            retention_days: 보관 기간 (일)
+            
+        Returns:
+            삭제된 파티션 수
+        """
+        if table not in PARTITIONED_TABLES:
+            raise ValueError(f"파티션 테이블이 아닙니다: {table}")
+            
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        
+        try:
+            cursor = self.conn.cursor()
+            dropped = 0
+            
+            for name, upper in sorted(self._list_partitions(cursor, table).items()):
+                # DEFAULT 파티션 등 상한이 없는 파티션은 건드리지 않음
+                if upper is None or upper > cutoff:
+                    continue
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+                cursor.execute(f"DROP TABLE {name}")
+                self.conn.commit()
+                dropped += 1
+                self.logger.info(f"만료 파티션 삭제: {name}")
+                
+            return dropped
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"만료 파티션 삭제 실패 ({table}): {e}")
+            return 0
+    
+    def _purge_in_chunks(self, table: str, key: str, condition: str, params: tuple) -> int:
+        """
+        조건에 맞는 행을 키 기준으로 batch_size개씩 나눠서 삭제 (청크마다 커밋)
+        
+        한 번에 잡는 잠금과 트랜잭션 크기를 제한해 정리 중에도 삽입이 막히지 않게 함
+        
+        Args:
+            table: 대상 테이블
+            key: 청크를 나눌 키 컬럼
+            condition: 삭제 조건 (대상 테이블 별칭은 t)
+            params: 조건 파라미터
+            
+        Returns:
+            삭제된 행 수
+        """
+        cleanup_config = self.config['database'].get('cleanup', {})
+        batch_size = cleanup_config.get('batch_size', 5000)
+        pause = cleanup_config.get('pause_seconds', 0)
+        
+        query = f"""
+            DELETE FROM {table}
+            WHERE {key} IN (
+                SELECT t.{key} FROM {table} t
+                WHERE {condition}
+                ORDER BY t.{key}
+                LIMIT %s
+            )
+        """
+        
+        cursor = self.conn.cursor()
+        deleted = 0
+        started = time.monotonic()
+        
+        while True:
+            cursor.execute(query, params + (batch_size,))
+            chunk = cursor.rowcount
             self.conn.commit()
+            deleted += chunk
+            
+            if chunk < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+                
+        elapsed = time.monotonic() - started
+        rate = deleted / elapsed if elapsed > 0 else 0
+        self.logger.info(f"{table} 정리: {deleted}행 삭제, {elapsed:.2f}초 ({rate:,.0f}행/초)")
+        return deleted
+    
+    def _cleanup_partitioned(self, retention_days: int, solutions_retention_days: int,
+                             execution_history_retention_days: int) -> bool:
+        """
+        파티션 스키마 정리 (파티션 DROP + 참조되지 않는 해결책/시그니처 삭제)
+        
+        Args:
+            retention_days: 에러 로그 보관 기간 (일)
+            solutions_retention_days: 해결책 보관 기간 (일)
+            execution_history_retention_days: 실행 이력 보관 기간 (일)
+            
+        Returns:
+            성공 여부
+        """
+        # 정리 주기마다 앞으로 사용할 파티션도 미리 생성
+        self.ensure_partitions()
+        
+        execution_dropped = self.drop_expired_partitions('execution_history', execution_history_retention_days)
+        errors_dropped = self.drop_expired_partitions('error_logs', retention_days)
+        
+        try:
+            # 오래된 해결책 삭제 (참조되지 않는 것만)
+            solutions_deleted = self._purge_in_chunks(
+                'solutions', 'id',
+                """t.created_at < NOW() - INTERVAL '%s days'
+                AND NOT EXISTS (SELECT 1 FROM execution_history h WHERE h.solution_id = t.id)""",
+                (solutions_retention_days,)
+            )
+            
+            # 남은 에러 로그와 해결책이 없는 시그니처 삭제 (같은 에러가 다시 기록될 수 있도록)
+            signatures_deleted = self._purge_in_chunks(
+                'error_signatures', 'hash_signature',
+                """t.first_seen_at < NOW() - INTERVAL '%s days'
+                AND NOT EXISTS (SELECT 1 FROM solutions s WHERE s.error_hash = t.hash_signature)
+                AND NOT EXISTS (SELECT 1 FROM error_logs e WHERE e.hash_signature = t.hash_signature)""",
+                (retention_days,)
+            )
+            
+            self.logger.info(f"데이터베이스 정리 완료: 에러로그 파티션 {errors_dropped}개, 실행이력 파티션 {execution_dropped}개, "
+                             f"해결책 {solutions_deleted}개, 시그니처 {signatures_deleted}개 삭제")
+                             
+            # 삭제된 시그니처가 중복으로 처리되지 않도록 캐시 재생성
+            if signatures_deleted and self.signature_cache:
+                self.warm_signature_cache()
+            return True
+            
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.error(f"데이터베이스 정리 실패: {e}")
+            return False
+    
+    def cleanup_old_error_logs(self, retention_days: int = 7,
+                               solutions_retention_days: Optional[int] = None,
+                               execution_history_retention_days: Optional[int] = None) -> bool:
+        """
+        오래된 에러 로그 및 관련 데이터 정리
+        
+        테이블별로 batch_size개씩 나눠서 삭제하고 청크마다 커밋함.
+        다른 행이 참조 중인 행은 NOT EXISTS로 건너뛰므로 FK 위반으로 전체가 실패하지 않음
+        
+        Args:
+            retention_days: 에러 로그 보관 기간 (일)
+            solutions_retention_days: 해결책 보관 기간 (일, 기본값: retention_days)
+            execution_history_retention_days: 실행 이력 보관 기간 (일, 기본값: retention_days)
+            
+        Returns:
+            성공 여부
+        """
+        if solutions_retention_days is None:
+            solutions_retention_days = retention_days
+        if execution_history_retention_days is None:
+            execution_history_retention_days = retention_days
+            
+        if self.partitioned:
+            return self._cleanup_partitioned(retention_days, solutions_retention_days,
+                                             execution_history_retention_days)
+            
+        try:
+            started = time.monotonic()
+            
+            # 오래된 실행 이력 삭제 (가장 오래된 데이터부터)
+            execution_deleted = self._purge_in_chunks(
+                'execution_history', 'id',
+                "t.executed_at < NOW() - INTERVAL '%s days'",
+                (execution_history_retention_days,)
+            )
+            
+            # 오래된 해결책 삭제 (실행 이력이 참조하지 않는 것만)
+            solutions_deleted = self._purge_in_chunks(
+                'solutions', 'id',
+                """t.created_at < NOW() - INTERVAL '%s days'
+                AND NOT EXISTS (SELECT 1 FROM execution_history h WHERE h.solution_id = t.id)""",
+                (solutions_retention_days,)
+            )
+            
+            # 오래된 에러 로그 삭제 (해결책/실행 이력이 참조하지 않는 것만)
+            errors_deleted = self._purge_in_chunks(
+                'error_logs', 'id',
+                """t.created_at < NOW() - INTERVAL '%s days'
+                AND NOT EXISTS (SELECT 1 FROM solutions s WHERE s.error_hash = t.hash_signature)
+                AND NOT EXISTS (SELECT 1 FROM execution_history h WHERE h.error_log_id = t.id)""",
+                (retention_days,)
+            )
+            
+            elapsed = time.monotonic() - started
+            total = errors_deleted + solutions_deleted + execution_deleted
+            rate = total / elapsed if elapsed > 0 else 0
+            self.logger.info(f"데이터베이스 정리 완료: 에러로그 {errors_deleted}개, 해결책 {solutions_deleted}개, 실행이력 {execution_deleted}개 삭제 "
+                             f"({elapsed:.2f}초, {rate:,.0f}행/초)")
             
-            self.logger.info(f"데이터베이스 정리 완료: 에러로그 {errors_deleted}개, 해결책 {solutions_deleted}개, 실행이력 {execution_deleted}개 삭제")
+            # 삭제된 시그니처가 중복으로 처리되지 않도록 캐시 재생성
+            if errors_deleted and self.signature_cache:
+                self.warm_signature_cache()
             return True
             
         except Exception as e:
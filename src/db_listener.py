@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+PostgreSQL LISTEN/NOTIFY 수신 모듈
+- 전용 연결(autocommit)로 채널을 LISTEN 하고 백그라운드 스레드에서 알림을 콜백으로 전달
+- 연결이 끊기면 재연결 후 다시 LISTEN (끊긴 동안 놓친 알림은 재연결 콜백으로 보정)
+- 알림은 커밋 시점에 모든 세션으로 전달되므로 여러 프로세스가 같은 캐시 무효화를 받음
+"""
+
+import re
+import select
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+CHANNEL_NAME = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+class NotificationListener:
+    """백그라운드 LISTEN 스레드 (채널별 콜백 호출)"""
+    
+    def __init__(self, db_config: Dict, listener_config: Optional[Dict] = None):
+        """
+        알림 수신기 초기화
+        
+        Args:
+            db_config: database 설정 (host, port, name, user, password)
+            listener_config: database.notifications 설정
+        """
+        listener_config = listener_config or {}
+        self.logger = logging.getLogger(__name__)
+        self.db_config = db_config
+        self.poll_interval = listener_config.get('poll_interval', 1.0)
+        self.reconnect_delay = listener_config.get('reconnect_delay', 5)
+        
+        self.lock = threading.Lock()
+        self.handlers = {}  # 채널 → 콜백 목록
+        self.reconnect_handlers = []
+        self.listening = set()  # 현재 연결에서 LISTEN 중인 채널
+        self.conn = None
+        self.connected_once = False
+        self.stop_event = threading.Event()
+        self.thread = None
+        
+        self.stats = {
+            'notifications': 0,
+            'handler_errors': 0,
+            'reconnects': 0
+        }
+    
+    def subscribe(self, channel: str, callback: Callable[[str], None]):
+        """
+        채널 구독 (실행 중이면 다음 폴링 주기에 LISTEN)
+        
+        Args:
+            channel: NOTIFY 채널 이름
+            callback: 알림 payload를 받는 함수
+        """
+        if not CHANNEL_NAME.match(channel):
+            raise ValueError(f"잘못된 채널 이름: {channel}")
+        with self.lock:
+            handlers = self.handlers.setdefault(channel, [])
+            if callback not in handlers:
+                handlers.append(callback)
+    
+    def on_reconnect(self, callback: Callable[[], None]):
+        """
+        연결 수립 콜백 등록 (LISTEN 전이나 연결이 끊긴 동안 놓친 알림 보정용)
+        
+        Args:
+            callback: 인자 없는 함수
+        """
+        with self.lock:
+            if callback not in self.reconnect_handlers:
+                self.reconnect_handlers.append(callback)
+    
+    def start(self):
+        """수신 스레드 시작"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="db-notification-listener", daemon=True)
+        self.thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        """수신 스레드 종료 및 연결 닫기"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+        self._close()
+    
+    def _connect(self):
+        """LISTEN 전용 연결 생성 (autocommit - 트랜잭션 밖에서만 알림이 전달됨)"""
+        conn = psycopg2.connect(
+            host=self.db_config['host'],
+            port=self.db_config['port'],
+            database=self.db_config['name'],
+            user=self.db_config['user'],
+            password=self.db_config['password']
+        )
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        self.conn = conn
+        self.listening = set()
+        # 보정 콜백은 LISTEN 이후에 호출해야 그 사이 변경을 놓치지 않음
+        self._listen_new_channels()
+        
+        with self.lock:
+            if self.connected_once:
+                self.stats['reconnects'] += 1
+            handlers = list(self.reconnect_handlers)
+        if self.connected_once:
+            self.logger.info("알림 수신 연결 재수립")
+        self.connected_once = True
+        
+        for handler in handlers:
+            self._call(handler)
+    
+    def _close(self):
+        """연결 닫기"""
+        conn, self.conn = self.conn, None
+        if conn is not None and not conn.closed:
+            try:
+                conn.close()
+            except Exception as e:
+                self.logger.debug(f"알림 수신 연결 종료 중 오류: {e}")
+    
+    def _listen_new_channels(self):
+        """새로 구독된 채널 LISTEN"""
+        with self.lock:
+            channels = [channel for channel in self.handlers if channel not in self.listening]
+        if not channels:
+            return
+        cursor = self.conn.cursor()
+        for channel in channels:
+            cursor.execute(f"LISTEN {channel}")
+            self.listening.add(channel)
+            self.logger.info(f"알림 채널 구독: {channel}")
+    
+    def _dispatch(self):
+        """수신된 알림을 채널별 콜백으로 전달"""
+        self.conn.poll()
+        while self.conn.notifies:
+            notify = self.conn.notifies.pop(0)
+            with self.lock:
+                self.stats['notifications'] += 1
+                handlers = list(self.handlers.get(notify.channel, []))
+            for handler in handlers:
+                self._call(handler, notify.payload)
+    
+    def _call(self, handler: Callable, *args):
+        """콜백 실행 (예외는 기록만 하고 수신은 계속)"""
+        try:
+            handler(*args)
+        except Exception as e:
+            with self.lock:
+                self.stats['handler_errors'] += 1
+            self.logger.warning(f"알림 처리 콜백 실패: {e}")
+    
+    def _run(self):
+        """수신 루프"""
+        while not self.stop_event.is_set():
+            try:
+                if self.conn is None or self.conn.closed:
+                    self._connect()
+                self._listen_new_channels()
+                
+                # 알림이 오거나 poll_interval이 지날 때까지 대기
+                readable, _, _ = select.select([self.conn], [], [], self.poll_interval)
+                if readable:
+                    self._dispatch()
+                    
+            except Exception as e:
+                self.logger.warning(f"알림 수신 연결 오류 ({self.reconnect_delay}초 후 재연결): {e}")
+                self._close()
+                self.stop_event.wait(self.reconnect_delay)
+    
+    def get_stats(self) -> Dict:
+        """수신 통계"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['channels'] = sorted(self.handlers)
+            stats['connected'] = self.conn is not None and not self.conn.closed
+            return stats
+
+_listener = None
+_listener_lock = threading.Lock()
+
+def get_notification_listener(db_config: Dict) -> NotificationListener:
+    """
+    프로세스 공용 알림 수신기 반환 (최초 호출 시 생성 후 시작)
+    
+    Args:
+        db_config: database 설정 (notifications 하위 설정 포함)
+        
+    Returns:
+        NotificationListener 인스턴스
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = NotificationListener(db_config, db_config.get('notifications'))
+            _listener.start()
+        return _listener
+
+def close_notification_listener():
+    """프로세스 공용 알림 수신기 종료"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
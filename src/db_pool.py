@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+PostgreSQL 연결 풀 모듈
+- 프로세스 전체에서 공유하는 스레드 안전 연결 풀 (최소/최대 크기)
+- 대여 시 상태 점검(health check) 및 대기 시간 제한
+- 풀 사용량 지표 제공
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+class PoolTimeoutError(Exception):
+    """연결 대여 대기 시간 초과"""
+    pass
+
+class PooledConnection(psycopg2.extensions.connection):
+    """풀에서 관리되는 연결 (생성/마지막 사용 시각 기록)"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.prepared_statements = set()  # 이 세션에서 PREPARE된 statement 이름
+
+class ConnectionPool:
+    """스레드 안전 PostgreSQL 연결 풀"""
+    
+    def __init__(self, db_config: Dict, pool_config: Optional[Dict] = None):
+        """
+        연결 풀 초기화
+        
+        Args:
+            db_config: database 설정 (host, port, name, user, password)
+            pool_config: database.pool 설정
+        """
+        pool_config = pool_config or {}
+        self.logger = logging.getLogger(__name__)
+        self.db_config = db_config
+        self.min_size = pool_config.get('min_size', 1)
+        self.max_size = max(pool_config.get('max_size', 10), self.min_size, 1)
+        self.checkout_timeout = pool_config.get('checkout_timeout', 30)
+        # 이 시간(초) 이상 쉬고 있던 연결은 대여 전에 SELECT 1로 점검
+        self.health_check_idle_seconds = pool_config.get('health_check_idle_seconds', 30)
+        # 이 시간(초) 이상 된 연결은 반납 시 닫고 새로 생성 (0이면 제한 없음)
+        self.max_lifetime = pool_config.get('max_lifetime', 3600)
+        
+        self.condition = threading.Condition()
+        self.idle = deque()
+        self.size = 0  # 열려 있는 전체 연결 수 (대여 중 + 유휴)
+        self.closed = False
+        
+        self.metrics = {
+            'checkouts': 0,
+            'checkins': 0,
+            'connections_created': 0,
+            'connections_closed': 0,
+            'health_check_failures': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'timeouts': 0,
+            'max_in_use': 0
+        }
+        
+        # 최소 연결 수만큼 미리 생성
+        for _ in range(self.min_size):
+            try:
+                self.idle.append(self._open())
+                self.size += 1
+            except Exception as e:
+                self.logger.warning(f"초기 연결 생성 실패: {e}")
+                break
+    
+    def _open(self) -> PooledConnection:
+        """새 연결 생성"""
+        conn = psycopg2.connect(
+            host=self.db_config['host'],
+            port=self.db_config['port'],
+            database=self.db_config['name'],
+            user=self.db_config['user'],
+            password=self.db_config['password'],
+            connection_factory=PooledConnection
+        )
+        conn.autocommit = False
+        with self.condition:
+            self.metrics['connections_created'] += 1
+        return conn
+    
+    def _close(self, conn: PooledConnection):
+        """연결 종료 (풀 크기에서 제외)"""
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception as e:
+            self.logger.debug(f"연결 종료 중 오류: {e}")
+        with self.condition:
+            self.size -= 1
+            self.metrics['connections_closed'] += 1
+            self.condition.notify()
+    
+    def _is_healthy(self, conn: PooledConnection) -> bool:
+        """연결 상태 점검 (오래 쉬었던 연결만 실제 쿼리로 확인)"""
+        if conn.closed:
+            return False
+        if time.monotonic() - conn.last_used < self.health_check_idle_seconds:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+    
+    def getconn(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        연결 대여 (유휴 연결이 없고 최대 크기에 도달했으면 반납될 때까지 대기)
+        
+        Args:
+            timeout: 최대 대기 시간(초) - 기본값은 checkout_timeout
+            
+        Returns:
+            점검을 통과한 연결
+            
+        Raises:
+            PoolTimeoutError: 대기 시간 초과
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            conn = None
+            create = False
+            with self.condition:
+                if self.closed:
+                    raise PoolTimeoutError("연결 풀이 종료되었습니다")
+                    
+                waited_from = None
+                while not self.idle and self.size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.metrics['timeouts'] += 1
+                        raise PoolTimeoutError(f"연결 대여 대기 시간 초과 ({timeout}초)")
+                    if waited_from is None:
+                        waited_from = time.monotonic()
+                        self.metrics['waits'] += 1
+                    self.condition.wait(remaining)
+                if waited_from is not None:
+                    self.metrics['wait_time_total'] += time.monotonic() - waited_from
+                    
+                if self.idle:
+                    # 최근 반납된 연결부터 사용 (LIFO)
+                    conn = self.idle.pop()
+                else:
+                    self.size += 1
+                    create = True
+                    
+            if create:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self.condition:
+                        self.size -= 1
+                        self.condition.notify()
+                    raise
+            elif not self._is_healthy(conn):
+                with self.condition:
+                    self.metrics['health_check_failures'] += 1
+                self.logger.warning("끊어진 연결 감지 - 새 연결로 교체")
+                self._close(conn)
+                continue
+                
+            with self.condition:
+                self.metrics['checkouts'] += 1
+                in_use = self.size - len(self.idle)
+                self.metrics['max_in_use'] = max(self.metrics['max_in_use'], in_use)
+            return conn
+    
+    def putconn(self, conn: PooledConnection, discard: bool = False):
+        """
+        연결 반납 (진행 중인 트랜잭션은 롤백)
+        
+        Args:
+            conn: 대여했던 연결
+            discard: True면 풀에 넣지 않고 닫음
+        """
+        if not discard and not conn.closed:
+            try:
+                status = conn.get_transaction_status()
+                if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+                
+        expired = self.max_lifetime and time.monotonic() - conn.created_at > self.max_lifetime
+        if discard or conn.closed or expired or self.closed:
+            self._close(conn)
+            return
+            
+        conn.last_used = time.monotonic()
+        with self.condition:
+            self.idle.append(conn)
+            self.metrics['checkins'] += 1
+            self.condition.notify()
+    
+    def closeall(self):
+        """모든 유휴 연결 종료 (대여 중인 연결은 반납 시 종료)"""
+        with self.condition:
+            self.closed = True
+            idle, self.idle = list(self.idle), deque()
+        for conn in idle:
+            self._close(conn)
+    
+    def get_metrics(self) -> Dict:
+        """풀 사용량 지표"""
+        with self.condition:
+            metrics = dict(self.metrics)
+            metrics['size'] = self.size
+            metrics['idle'] = len(self.idle)
+            metrics['in_use'] = self.size - len(self.idle)
+            metrics['min_size'] = self.min_size
+            metrics['max_size'] = self.max_size
+            return metrics
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool(db_config: Dict) -> ConnectionPool:
+    """
+    프로세스 공용 연결 풀 반환 (최초 호출 시 생성)
+    
+    close_connection_pool() 이후에는 새 풀을 만들지 않고 종료된 풀을 그대로 반환하므로
+    종료 중에 늦게 도착한 대여 요청은 PoolTimeoutError로 실패하고 반납된 연결은 닫힘
+    
+    Args:
+        db_config: database 설정 (pool 하위 설정 포함)
+        
+    Returns:
+        ConnectionPool 인스턴스
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(db_config, db_config.get('pool'))
+        return _pool
+
+def close_connection_pool():
+    """프로세스 공용 연결 풀 종료 (종료된 풀은 다시 생성되지 않음)"""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+에러 메시지 분류 엔진
+- DB 에러 패턴 정규식을 한 번만 컴파일해 우선순위 순으로 매칭
+- 키워드 분류표는 소문자 튜플로 한 번만 구성해 우선순위 순으로 부분 문자열 검사
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional, Iterable, Tuple
+
+# 기본 분류 규칙 - 더 구체적인 키워드들 추가 (먼저 나온 카테고리가 우선)
+KEYWORD_CLASSIFICATIONS = {
+    'memory': ['memory', 'oom', 'out of memory', 'oomkilled', 'killed', 'segmentation fault', 'segfault'],
+    'network': ['connection', 'network', 'timeout', 'refused', 'unreachable', 'dns', 'resolve', 'connect'],
+    'storage': ['disk', 'storage', 'space', 'filesystem', 'no space left', 'quota', 'volume'],
+    'kubernetes': ['kubernetes', 'pod', 'container', 'deployment', 'service', 'namespace', 'kubectl'],
+    'database': ['database', 'sql', 'query', 'mysql', 'postgres', 'elasticsearch', 'connection pool'],
+    'system': ['kernel', 'system', 'driver', 'hardware', 'cpu', 'thermal'],
+    'security': ['permission', 'access', 'denied', 'unauthorized', 'forbidden', 'authentication'],
+    'configuration': ['config', 'configuration', 'invalid', 'missing', 'not found', 'syntax error']
+}
+
+# 키워드/패턴에 걸리지 않았을 때 일반 로그로 분류하는 레벨 문자열
+INFO_LEVEL_KEYWORDS = ('info', 'debug', 'trace')
+
+class ErrorClassifier:
+    """사전 컴파일된 다중 패턴 에러 분류기"""
+    
+    def __init__(self, error_patterns: Optional[List[Dict]] = None,
+                 keyword_classifications: Optional[Dict[str, List[str]]] = None):
+        """
+        분류기 초기화 (패턴 로드 시 한 번만 생성)
+        
+        Args:
+            error_patterns: error_patterns 테이블 행 목록 (priority 오름차순)
+            keyword_classifications: 카테고리별 키워드 목록 (기본값: KEYWORD_CLASSIFICATIONS)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.keyword_classifications = keyword_classifications or KEYWORD_CLASSIFICATIONS
+        self.compiled_patterns = self._compile_patterns(error_patterns or [])
+        self.keyword_table = self._build_keyword_table()
+    
+    def _compile_patterns(self, error_patterns: List[Dict]) -> List[Tuple[re.Pattern, str]]:
+        """
+        DB 패턴 정규식 컴파일 (잘못된 정규식은 한 번만 경고하고 제외)
+        
+        Args:
+            error_patterns: error_patterns 테이블 행 목록
+            
+        Returns:
+            (컴파일된 정규식, 에러 카테고리) 목록 - 우선순위 순서 유지
+        """
+        compiled = []
+        for pattern in error_patterns:
+            try:
+                compiled.append((re.compile(pattern['pattern_regex'], re.IGNORECASE), pattern['error_category']))
+            except (re.error, KeyError, TypeError) as e:
+                self.logger.warning(f"에러 패턴 컴파일 실패 ({pattern.get('pattern_name', '?')}): {e}")
+        return compiled
+    
+    def _build_keyword_table(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """(카테고리, 소문자 키워드 튜플) 테이블 - 카테고리 우선순위 순서 유지"""
+        return tuple(
+            (category, tuple(keyword.lower() for keyword in keywords))
+            for category, keywords in self.keyword_classifications.items()
+        )
+    
+    def _match_keywords(self, message_lower: str) -> Optional[str]:
+        """
+        키워드 기반 분류 (먼저 나온 카테고리가 우선)
+        
+        Args:
+            message_lower: 소문자로 변환된 에러 메시지
+            
+        Returns:
+            카테고리 또는 None
+        """
+        for category, keywords in self.keyword_table:
+            for keyword in keywords:
+                if keyword in message_lower:
+                    return category
+        return None
+    
+    def classify(self, error_message: str) -> str:
+        """
+        에러 메시지를 분류하여 에러 타입 결정
+        
+        Args:
+            error_message: 에러 메시지
+            
+        Returns:
+            에러 타입
+        """
+        # 빈 메시지 처리
+        if not error_message or not isinstance(error_message, str):
+            return 'unknown'
+            
+        # 패턴 매칭으로 에러 타입 분류 (priority 순)
+        for regex, category in self.compiled_patterns:
+            if regex.search(error_message):
+                return category
+                
+        error_message_lower = error_message.lower()
+        
+        # 키워드 기반 분류
+        category = self._match_keywords(error_message_lower)
+        if category:
+            return category
+            
+        # 로그 레벨이 INFO나 DEBUG면 일반 로그로 분류
+        for level in INFO_LEVEL_KEYWORDS:
+            if level in error_message_lower:
+                return 'info'
+                
+        # 기본값
+        return 'application'
+    
+    def classify_many(self, messages: Iterable[str]) -> List[str]:
+        """
+        여러 메시지 일괄 분류
+        
+        Args:
+            messages: 에러 메시지 목록
+            
+        Returns:
+            입력 순서와 같은 에러 타입 목록
+        """
+        classify = self.classify
+        return [classify(message) for message in messages]
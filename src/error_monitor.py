@@ -5,14 +5,56 @@ Elasticsearch에서 실시간으로 에러 로그를 감지하고 분석
 """
 
 import time
-import re
+import random
 import yaml
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from elasticsearch import Elasticsearch
 from .database import DatabaseManager
 from .slack_notifier import SlackNotifier
+from .query_builder import ErrorQueryBuilder, DEFAULT_SOURCE_FIELDS
+from .error_classifier import ErrorClassifier, KEYWORD_CLASSIFICATIONS
+from .pattern_set import PatternSetManager
+from .write_behind import get_write_behind_queue
+from .template_miner import TemplateMiner
+
+# Slack 알림에 표시되는 타입별 샘플 수
+ALERT_SAMPLE_SIZE = 3
+
+class ErrorGroup:
+    """에러 타입별 버킷 (개수, 알림용 샘플 저장소, 저장 대기 중인 에러)"""
+    
+    __slots__ = ('error_type', 'count', 'samples', 'members', 'sample_size')
+    
+    def __init__(self, error_type: str, sample_size: int = ALERT_SAMPLE_SIZE):
+        self.error_type = error_type
+        self.count = 0
+        self.samples = []
+        self.members = []
+        self.sample_size = sample_size
+    
+    def add(self, error: Dict):
+        """
+        에러 추가 (샘플은 reservoir sampling으로 윈도우 전체에서 고르게 유지)
+        
+        Args:
+            error: 파싱된 에러 데이터
+        """
+        self.count += 1
+        self.members.append(error)
+        
+        if len(self.samples) < self.sample_size:
+            self.samples.append(error['error_message'])
+        else:
+            index = random.randrange(self.count)
+            if index < self.sample_size:
+                self.samples[index] = error['error_message']
+    
+    def drain(self) -> List[Dict]:
+        """저장 대기 중인 에러를 꺼내고 비움"""
+        members, self.members = self.members, []
+        return members
 
 class ErrorMonitor:
     """ELK Stack 에러 모니터링 클래스"""
@@ -29,10 +71,36 @@ class ErrorMonitor:
         self.db = DatabaseManager(config_path)
         self.slack = SlackNotifier(config_path)
         self.logger = logging.getLogger(__name__)
-        self.error_patterns = []
         self.last_check_time = datetime.now()
         self.running = True  # 종료 제어용 플래그
         
+        # 증분 검색 커서 ([마지막 @timestamp 정렬값, 그 시각에 처리한 문서 _id 목록])
+        monitoring_config = self.config.get('monitoring', {})
+        self.incremental_search = monitoring_config.get('incremental_search', False)
+        self.cursor_name = f"error_monitor:{self.config['elasticsearch']['index_pattern']}"
+        self.aggregation_mode = monitoring_config.get('aggregation_mode', False)
+        self._index_cache = {}  # (시작 날짜, 종료 날짜) → 검색 대상 인덱스 목록
+        
+        # 시스템 상태는 백그라운드 write-behind 큐로 기록 (컴포넌트별 최신 값만 반영)
+        write_behind_config = self.config['database'].get('write_behind', {})
+        self.writer = get_write_behind_queue(config_path, write_behind_config) if write_behind_config.get('enabled', True) else None
+        
+        # 컴파일된 에러 패턴 세트 (DB 패턴 변경 시 백그라운드에서 재컴파일 후 교체)
+        self.pattern_manager = PatternSetManager(config_path, monitoring_config.get('pattern_reload'))
+        
+        # 에러 탐지 쿼리 빌더 (탐지 조건은 한 번만 구성해 재사용)
+        self.query_builder = ErrorQueryBuilder(monitoring_config.get('detection_query'))
+        
+        # 메시지 템플릿 (가변 토큰을 마스킹한 템플릿으로 중복 판정 및 해결책 조회)
+        template_config = monitoring_config.get('template_mining', {})
+        self.template_miner = TemplateMiner(template_config) if template_config.get('enabled', True) else None
+        
+        # 검색 시 파이프라인에서 사용하는 필드만 가져옴 (전체 문서는 필요할 때 mget으로 조회)
+        self.source_fields = self.config['elasticsearch'].get('source_fields', DEFAULT_SOURCE_FIELDS)
+        self.search_cursor = None
+        self._pending_cursor = None
+        self._cursor_loaded = False
+    
     def _load_config(self, config_path: str) -> Dict:
         """설정 파일 로드 (환경 변수 포함)"""
         try:
@@ -138,122 +206,295 @@ class ErrorMonitor:
             self.logger.error(f"Kubernetes 서비스 연결 오류: {e}")
             return False
     
+    @property
+    def classifier(self) -> ErrorClassifier:
+        """현재 패턴 세트의 분류기 (핫 리로드 시 교체됨)"""
+        return self.pattern_manager.classifier
+    
+    @property
+    def error_patterns(self) -> List[Dict]:
+        """현재 패턴 세트의 에러 패턴 목록"""
+        return self.pattern_manager.error_patterns
+    
     def load_error_patterns(self) -> bool:
-        """데이터베이스에서 에러 패턴 로드"""
-        try:
-            if not self.db.connect():
-                return False
-                
-            self.error_patterns = self.db.get_error_patterns()
-            self.logger.info(f"{len(self.error_patterns)}개의 에러 패턴 로드됨")
-            return True
+        """데이터베이스에서 에러 패턴 로드 (이후 변경은 백그라운드에서 자동 반영)"""
+        # 패턴은 PatternSetManager 전용 연결로 읽지만, 에러 저장/커서 기록용 모니터 연결도 여기서 연결
+        if not self.db.connect():
+            return False
             
-        except Exception as e:
-            self.logger.error(f"에러 패턴 로드 실패: {e}")
+        if not self.pattern_manager.load(force=True):
             return False
+        self.pattern_manager.start()
+        return True
+    
+    def get_pattern_metrics(self) -> Dict:
+        """에러 패턴 세트 지표 (패턴 수, 컴파일 시간, 리로드 횟수)"""
+        return self.pattern_manager.get_metrics()
+    
+    def _build_error_query(self, time_filter: Dict) -> Dict:
+        """
+        에러 탐지용 쿼리 구성 (ErrorQueryBuilder에 위임)
+        
+        Args:
+            time_filter: @timestamp range 조건 (gte/lte/format)
+            
+        Returns:
+            Elasticsearch query 절
+        """
+        return self.query_builder.build(time_filter)
     
     def search_errors(self, time_range: int = 60) -> List[Dict]:
         """
         Elasticsearch에서 에러 로그 검색 (시간 필터링 적용)
         
+        모든 페이지를 리스트로 모아서 반환하므로 대량 결과에는 iter_errors() 사용
+        
         Args:
             time_range: 검색 시간 범위 (초)
             
         Returns:
             에러 로그 리스트
         """
+        return list(self.iter_errors(time_range))
+    
+    def iter_errors(self, time_range: int = 60) -> Iterator[Dict]:
+        """
+        Point-in-time + search_after로 검색 범위의 모든 에러 로그를 페이지 단위로 순회
+        
+        monitoring.page_size 단위로 가져와 파싱된 에러를 하나씩 yield 하므로
+        버스트 상황에서도 결과가 잘리지 않고 메모리 사용량은 페이지 크기로 제한됨.
+        증분 검색 모드에서는 yield 할 때마다 대기 커서가 갱신됨.
+        
+        Args:
+            time_range: 검색 시간 범위 (초), 증분 검색 모드에서는 커서가 없을 때만 사용
+            
+        Yields:
+            파싱된 에러 데이터
+        """
+        monitoring_config = self.config.get('monitoring', {})
+        page_size = monitoring_config.get('page_size', 500)
+        keep_alive = monitoring_config.get('pit_keep_alive', '1m')
+        
+        pit_id = None
+        found = 0
+        
         try:
-            # 최대 검색 시간 제한 (설정에서 가져오거나 기본값 사용)
-            max_search_time = self.config.get('log_management', {}).get('max_search_hours', 24) * 3600
-            time_range = min(time_range, max_search_time)
+            index, time_filter, sort, search_after = self._build_search_window(time_range)
+            cursor_millis, seen_ids = None, set()
+            if self.incremental_search and self.search_cursor:
+                cursor_millis = self.search_cursor[0]
+                seen_ids = set(self._cursor_ids(self.search_cursor))
             
-            # 검색 시간 범위 설정
-            end_time = datetime.now()
-            start_time = end_time - timedelta(seconds=time_range)
+            pit_id = self.es.open_point_in_time(
+                index=index,
+                keep_alive=keep_alive,
+                ignore_unavailable=True
+            )['id']
             
-            self.logger.info(f"에러 검색 시간 범위: {start_time.isoformat()} ~ {end_time.isoformat()}")
+            while self.running:
+                query = {
+                    "query": self._build_error_query(time_filter),
+                    "sort": sort,
+                    "size": page_size,
+                    "_source": {"includes": self.source_fields},
+                    "pit": {"id": pit_id, "keep_alive": keep_alive}
+                }
+                if search_after:
+                    query["search_after"] = search_after
+                    
+                response = self.es.search(body=query)
+                pit_id = response.get('pit_id', pit_id)
+                hits = response['hits']['hits']
+                
+                for hit in hits:
+                    if self.incremental_search:
+                        timestamp = hit['sort'][0]
+                        # 커서 시각은 포함해서 다시 검색하므로 이미 처리한 문서는 _id로 건너뜀
+                        if timestamp == cursor_millis and hit['_id'] in seen_ids:
+                            continue
+                        # 파싱 실패 문서도 다시 검색하지 않도록 hit 기준으로 커서 이동
+                        self._advance_cursor(timestamp, hit['_id'])
+                        
+                    error_data = self._parse_log_entry(hit)
+                    if error_data:
+                        found += 1
+                        yield error_data
+                        
+                if len(hits) < page_size:
+                    break
+                search_after = hits[-1]['sort']
             
-            # Elasticsearch 쿼리 구성 - 실제 ELK 데이터 구조에 맞게 수정
-            query = {
-                "query": {
-                    "bool": {
-                        "must": [
-                            {
-                                "range": {
-                                    "@timestamp": {
-                                        "gte": start_time.isoformat(),
-                                        "lte": end_time.isoformat()
-                                    }
-                                }
-                            }
-                        ],
-                        "should": [
-                            # 로그 레벨 기반 필터링
-                            {"match": {"log.level": "ERROR"}},
-                            {"match": {"log.level": "FATAL"}},
-                            {"match": {"log.level": "CRITICAL"}},
-                            {"match": {"level": "ERROR"}},
-                            {"match": {"level": "FATAL"}},
-                            {"match": {"level": "CRITICAL"}},
-                            
-                            # 메시지 내용 기반 필터링 (배열 필드 고려)
-                            {"match": {"message": "error"}},
-                            {"match": {"message": "exception"}},
-                            {"match": {"message": "failed"}},
-                            {"match": {"message": "crash"}},
-                            {"match": {"message": "panic"}},
-                            {"match": {"message": "fatal"}},
-                            {"match": {"message": "killed"}},
-                            {"match": {"message": "segmentation fault"}},
-                            {"match": {"message": "out of memory"}},
-                            {"match": {"message": "connection refused"}},
-                            {"match": {"message": "timeout"}},
-                            {"match": {"message": "permission denied"}},
-                            
-                            # 이벤트 원본 메시지 기반 필터링
-                            {"match": {"event.original": "error"}},
-                            {"match": {"event.original": "exception"}},
-                            {"match": {"event.original": "failed"}},
-                            
-                            # 특정 프로그램의 심각한 로그
-                            {"bool": {
-                                "must": [
-                                    {"match": {"program": "kernel"}},
-                                    {"wildcard": {"message": "*error*"}}
-                                ]
-                            }},
-                            {"bool": {
-                                "must": [
-                                    {"match": {"program": "systemd"}},
-                                    {"wildcard": {"message": "*failed*"}}
-                                ]
-                            }}
-                        ],
-                        "minimum_should_match": 1
-                    }
-                },
-                "sort": [
-                    {"@timestamp": {"order": "desc"}}
-                ],
-                "size": 100
-            }
+            if self.incremental_search:
+                cursor = self._pending_cursor or self.search_cursor
+                position = f"{cursor[0]} (+{len(self._cursor_ids(cursor))}개 문서)" if cursor else "없음"
+                self.logger.info(f"{found}개의 에러 로그 발견 (증분 검색, 커서: {position})")
+            else:
+                self.logger.info(f"{found}개의 에러 로그 발견 (최근 {time_range//60}분간)")
+            
+        except Exception as e:
+            self.logger.error(f"에러 검색 실패: {e}")
+        finally:
+            if pit_id:
+                try:
+                    self.es.close_point_in_time(id=pit_id)
+                except Exception as e:
+                    self.logger.warning(f"Point-in-time 종료 실패: {e}")
+    
+    def _build_search_window(self, time_range: int) -> Tuple[str, Dict, List, Optional[List]]:
+        """
+        검색 대상 인덱스, 검색 범위 조건, 정렬 조건, 시작 search_after 값 구성
+        
+        증분 검색 모드에서는 마지막으로 처리한 @timestamp부터(해당 시각 포함) 이어서
+        검색하고, 그 시각에 이미 처리한 문서는 커서에 저장된 _id로 건너뛰므로 사이클
+        지연에 의한 누락이나 중복 재검색이 발생하지 않음. 같은 밀리초에 나중에 색인된
+        문서도 다음 검색에서 처리됨 (문서마다 고유한 정렬 보조 필드가 필요 없음).
+        페이지 사이는 PIT가 암묵적으로 붙이는 _shard_doc 정렬값으로 search_after 함.
+        첫 실행 시(저장된 커서 없음)에는 time_range 만큼 과거부터 시작하며,
+        새 커서는 commit_search_cursor() 호출 시 저장됨.
+        
+        Args:
+            time_range: 검색 시간 범위 (초)
             
-            # 검색 실행
-            index_pattern = self.config['elasticsearch']['index_pattern']
-            response = self.es.search(index=index_pattern, body=query)
+        Returns:
+            (검색 대상 인덱스, @timestamp range 조건, sort 조건, search_after 시작값)
+        """
+        # 최대 검색 시간 제한 (설정에서 가져오거나 기본값 사용)
+        max_search_time = self.config.get('log_management', {}).get('max_search_hours', 24) * 3600
+        
+        if not self.incremental_search:
+            index, time_filter = self._sliding_window(time_range)
+            return index, time_filter, [{"@timestamp": {"order": "desc"}}], None
             
-            errors = []
-            for hit in response['hits']['hits']:
-                error_data = self._parse_log_entry(hit)
-                if error_data:
-                    errors.append(error_data)
+        if not self._cursor_loaded:
+            self.search_cursor = self.db.get_search_cursor(self.cursor_name)
+            self._cursor_loaded = True
+            if self.search_cursor:
+                self.logger.info(f"저장된 검색 커서에서 재개: {self.search_cursor[0]}")
+                
+        # 커서가 너무 오래된 경우에도 최대 검색 시간 이전은 검색하지 않음
+        now_millis = int(time.time() * 1000)
+        lower_bound = now_millis - max_search_time * 1000
+        
+        sort = [{"@timestamp": {"order": "asc"}}]
+        
+        search_after = None
+        if self.search_cursor:
+            # 커서 시각 포함 (gte) - 같은 밀리초에 나중에 색인된 문서도 다시 확인
+            start_millis = max(int(self.search_cursor[0]), lower_bound)
+        else:
+            start_millis = now_millis - min(time_range, max_search_time) * 1000
             
-            self.logger.info(f"{len(errors)}개의 에러 로그 발견 (최근 {time_range//60}분간)")
-            return errors
+        time_filter = {
+            "gte": start_millis,
+            "format": "epoch_millis"
+        }
+        index = self._resolve_indices(
+            datetime.fromtimestamp(start_millis / 1000, tz=timezone.utc),
+            datetime.now(timezone.utc)
+        )
+        return index, time_filter, sort, search_after
+    
+    def _sliding_window(self, time_range: int) -> Tuple[str, Dict]:
+        """
+        현재 시각 기준 최근 time_range 초의 검색 대상 인덱스와 @timestamp range 조건 구성
+        
+        Args:
+            time_range: 검색 시간 범위 (초)
             
-        except Exception as e:
-            self.logger.error(f"에러 검색 실패: {e}")
-            return []
+        Returns:
+            (검색 대상 인덱스, @timestamp range 조건)
+        """
+        # 최대 검색 시간 제한 (설정에서 가져오거나 기본값 사용)
+        max_search_time = self.config.get('log_management', {}).get('max_search_hours', 24) * 3600
+        time_range = min(time_range, max_search_time)
+        
+        # 검색 시간 범위 설정 (@timestamp 및 일별 인덱스 이름은 UTC 기준)
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(seconds=time_range)
+        
+        self.logger.info(f"에러 검색 시간 범위: {start_time.isoformat()} ~ {end_time.isoformat()}")
+        
+        time_filter = {
+            "gte": start_time.isoformat(),
+            "lte": end_time.isoformat()
+        }
+        return self._resolve_indices(start_time, end_time), time_filter
+    
+    def _resolve_indices(self, start_time: datetime, end_time: datetime) -> str:
+        """
+        검색 시간 범위가 걸치는 일별 인덱스(logstash-YYYY.MM.DD)만 검색 대상으로 지정
+        
+        자정을 넘는 범위는 이틀치 인덱스가 모두 포함되며, 결과는 날짜 범위별로
+        캐시되어 날짜가 바뀔 때만 새로 계산됨. 시간 라우팅이 꺼져 있거나
+        index_pattern이 '*'로 끝나지 않으면 기존 패턴을 그대로 사용함.
+        
+        Args:
+            start_time: 검색 시작 시각 (timezone 포함)
+            end_time: 검색 종료 시각 (timezone 포함)
+            
+        Returns:
+            콤마로 구분된 인덱스 목록 또는 인덱스 패턴
+        """
+        es_config = self.config['elasticsearch']
+        index_pattern = es_config['index_pattern']
+        
+        if not es_config.get('time_routed_indices', False) or not index_pattern.endswith('*'):
+            return index_pattern
+            
+        start_day = start_time.astimezone(timezone.utc).date()
+        end_day = end_time.astimezone(timezone.utc).date()
+        cache_key = (start_day, end_day)
+        
+        if cache_key not in self._index_cache:
+            prefix = index_pattern[:-1]
+            date_format = es_config.get('index_date_format', '%Y.%m.%d')
+            days = (end_day - start_day).days + 1
+            
+            # 지난 날짜 범위는 다시 쓰이지 않으므로 날짜가 바뀌면 캐시 정리
+            self._index_cache = {
+                key: value for key, value in self._index_cache.items()
+                if key[1] >= end_day
+            }
+            self._index_cache[cache_key] = ",".join(
+                f"{prefix}{(start_day + timedelta(days=i)).strftime(date_format)}"
+                for i in range(days)
+            )
+            
+        return self._index_cache[cache_key]
+    
+    @staticmethod
+    def _cursor_ids(cursor: List) -> List[str]:
+        """커서 시각에 처리한 문서 _id 목록 (이전 형식 [@timestamp, tiebreaker] 커서는 빈 목록)"""
+        return cursor[1] if len(cursor) > 1 and isinstance(cursor[1], list) else []
+    
+    def _advance_cursor(self, timestamp: int, doc_id: str):
+        """
+        대기 커서를 처리한 문서 위치로 이동
+        
+        Args:
+            timestamp: 문서의 @timestamp 정렬값
+            doc_id: 문서 _id
+        """
+        if self._pending_cursor and self._pending_cursor[0] == timestamp:
+            self._pending_cursor[1].append(doc_id)
+        elif self._pending_cursor is None and self.search_cursor and self.search_cursor[0] == timestamp:
+            self._pending_cursor = [timestamp, self._cursor_ids(self.search_cursor) + [doc_id]]
+        else:
+            self._pending_cursor = [timestamp, [doc_id]]
+    
+    def commit_search_cursor(self) -> bool:
+        """
+        마지막 검색의 커서를 확정하고 PostgreSQL에 저장 (재시작 시 이어서 검색)
+        
+        Returns:
+            저장 성공 여부
+        """
+        if not self.incremental_search or self._pending_cursor is None:
+            return True
+            
+        self.search_cursor = self._pending_cursor
+        self._pending_cursor = None
+        return self.db.save_search_cursor(self.cursor_name, self.search_cursor)
     
     def _parse_log_entry(self, hit: Dict) -> Optional[Dict]:
         """
@@ -290,19 +531,23 @@ class ErrorMonitor:
             elif isinstance(host_info, str):
                 host_name = host_info
             
-            # 기본 정보 추출
+            # 기본 정보 추출 (원본 문서는 참조만 저장하고 필요할 때 fetch_raw_logs로 조회)
             error_data = {
                 'elasticsearch_id': hit['_id'],
                 'timestamp': source.get('@timestamp'),
                 'error_message': final_message,
                 'source_system': host_name,
                 'severity': source.get('log', {}).get('level', source.get('level', 'INFO')),
-                'raw_log_data': source
+                'raw_log_ref': {'index': hit.get('_index'), 'id': hit['_id']}
             }
             
             # 에러 타입 분류
             error_data['error_type'] = self._classify_error(error_data['error_message'])
             
+            # 메시지 템플릿 추출 (해시 시그니처는 원문 대신 마스킹된 템플릿 기준으로 생성됨)
+            if self.template_miner:
+                error_data['message_template'] = self.template_miner.template(final_message)
+                
             # 스택 트레이스 추출
             if 'exception' in source:
                 error_data['stack_trace'] = str(source['exception'])
@@ -322,9 +567,46 @@ class ErrorMonitor:
             self.logger.debug(f"문제가 된 데이터: {hit}")
             return None
     
+    def fetch_raw_logs(self, errors: List[Dict]) -> int:
+        """
+        원본 로그 문서를 mget 한 번으로 일괄 조회하여 raw_log_data에 채움
+        
+        Args:
+            errors: raw_log_ref가 있는 에러 리스트
+            
+        Returns:
+            조회된 문서 개수
+        """
+        targets = [
+            error for error in errors
+            if not error.get('raw_log_data') and error.get('raw_log_ref', {}).get('index')
+        ]
+        if not targets:
+            return 0
+            
+        try:
+            docs = [
+                {'_index': error['raw_log_ref']['index'], '_id': error['raw_log_ref']['id']}
+                for error in targets
+            ]
+            response = self.es.mget(docs=docs)
+            
+            fetched = 0
+            for error, doc in zip(targets, response['docs']):
+                if doc.get('found'):
+                    error['raw_log_data'] = doc['_source']
+                    fetched += 1
+                    
+            self.logger.info(f"원본 로그 {fetched}/{len(targets)}개 조회")
+            return fetched
+            
+        except Exception as e:
+            self.logger.error(f"원본 로그 조회 실패: {e}")
+            return 0
+    
     def _classify_error(self, error_message: str) -> str:
         """
-        에러 메시지를 분류하여 에러 타입 결정
+        에러 메시지를 분류하여 에러 타입 결정 (사전 컴파일된 ErrorClassifier에 위임)
         
         Args:
             error_message: 에러 메시지
@@ -332,44 +614,7 @@ class ErrorMonitor:
         Returns:
             에러 타입
         """
-        # 빈 메시지 처리
-        if not error_message or not isinstance(error_message, str):
-            return 'unknown'
-            
-        error_message_lower = error_message.lower()
-        
-        # 패턴 매칭으로 에러 타입 분류
-        for pattern in self.error_patterns:
-            try:
-                if re.search(pattern['pattern_regex'], error_message, re.IGNORECASE):
-                    return pattern['error_category']
-            except Exception as e:
-                self.logger.warning(f"패턴 매칭 오류: {e}")
-                continue
-        
-        # 기본 분류 규칙 - 더 구체적인 키워드들 추가
-        keyword_classifications = {
-            'memory': ['memory', 'oom', 'out of memory', 'oomkilled', 'killed', 'segmentation fault', 'segfault'],
-            'network': ['connection', 'network', 'timeout', 'refused', 'unreachable', 'dns', 'resolve', 'connect'],
-            'storage': ['disk', 'storage', 'space', 'filesystem', 'no space left', 'quota', 'volume'],
-            'kubernetes': ['kubernetes', 'pod', 'container', 'deployment', 'service', 'namespace', 'kubectl'],
-            'database': ['database', 'sql', 'query', 'mysql', 'postgres', 'elasticsearch', 'connection pool'],
-            'system': ['kernel', 'system', 'driver', 'hardware', 'cpu', 'thermal'],
-            'security': ['permission', 'access', 'denied', 'unauthorized', 'forbidden', 'authentication'],
-            'configuration': ['config', 'configuration', 'invalid', 'missing', 'not found', 'syntax error']
-        }
-        
-        # 키워드 기반 분류
-        for category, keywords in keyword_classifications.items():
-            if any(keyword in error_message_lower for keyword in keywords):
-                return category
-        
-        # 로그 레벨이 INFO나 DEBUG면 일반 로그로 분류
-        if any(level in error_message_lower for level in ['info', 'debug', 'trace']):
-            return 'info'
-        
-        # 기본값
-        return 'application'
+        return self.classifier.classify(error_message)
     
     def check_error_threshold(self, error_type: str, count: int) -> bool:
         """
@@ -388,48 +633,267 @@ class ErrorMonitor:
             return True
         return False
     
-    def process_errors(self, errors: List[Dict]) -> List[Dict]:
+    def process_errors(self, errors: Iterable[Dict]) -> List[Dict]:
         """
         에러 리스트 처리 및 필터링
         
+        에러를 한 번만 순회하며 타입별 ErrorGroup에 모으므로 iter_errors()의 제너레이터를
+        그대로 받을 수 있음. 임계값에 도달한 타입은 insert_batch_size 단위로 묶어서 저장함.
+        
         Args:
-            errors: 에러 리스트
+            errors: 에러 리스트 또는 이터러블
             
         Returns:
             처리해야 할 에러 리스트
         """
         processed_errors = []
-        error_counts = {}
+        groups = {}
+        threshold = self.config['monitoring']['error_threshold']
+        
+        # 검색 커서 조회/에러 저장 전에 연결 확인 (끊어졌으면 다시 대여)
+        if not self.db.connect():
+            self.logger.error("데이터베이스 연결 실패 - 에러 처리 건너뜀")
+            return processed_errors
+        batch_size = self.config['monitoring'].get('insert_batch_size', 500)
         
-        # 에러 카운팅
         for error in errors:
-            error_type = error['error_type']
-            error_counts[error_type] = error_counts.get(error_type, 0) + 1
+            group = groups.get(error['error_type'])
+            if group is None:
+                group = groups[error['error_type']] = ErrorGroup(error['error_type'])
+            group.add(error)
+            
+            # 임계값에 도달한 타입은 배치가 찰 때마다 저장 (메모리 사용량 제한)
+            if group.count >= threshold and len(group.members) >= batch_size:
+                processed_errors.extend(self._store_error_group(group))
+                
+        for group in groups.values():
+            # 임계값 체크 및 알림 (동일 타입에 대해 한 번만 전송)
+            if not self.check_error_threshold(group.error_type, group.count):
+                continue
+                
+            processed_errors.extend(self._store_error_group(group))
+            self.slack.send_error_detected(
+                error_type=group.error_type,
+                error_count=group.count,
+                error_samples=group.samples
+            )
         
-        # 임계값 체크 및 처리 대상 선별
-        notified_types = set()  # 이미 알림을 보낸 에러 타입 추적
+        cache_stats = self.db.get_signature_cache_stats()
+        if cache_stats:
+            self.logger.debug(f"시그니처 캐시 통계: {cache_stats}")
+            
+        return processed_errors
+    
+    def _store_error_group(self, group: ErrorGroup) -> List[Dict]:
+        """
+        에러 그룹의 대기 중인 에러를 한 번에 저장
         
-        for error in errors:
-            error_type = error['error_type']
-            
-            # 임계값 체크
-            if self.check_error_threshold(error_type, error_counts[error_type]):
-                # 동일 타입에 대해 한 번만 알림 전송
-                if error_type not in notified_types:
-                    error_samples = [e['error_message'] for e in errors if e['error_type'] == error_type]
-                    self.slack.send_error_detected(
-                        error_type=error_type,
-                        error_count=error_counts[error_type],
-                        error_samples=error_samples
-                    )
-                    notified_types.add(error_type)
+        Args:
+            group: 임계값에 도달한 에러 그룹
+            
+        Returns:
+            새로 저장된 에러 리스트 (error_id 포함)
+        """
+        batch = group.drain()
+        if not batch:
+            return []
+            
+        stored = []
+        for error, error_id in zip(batch, self.db.insert_error_logs_bulk(batch)):
+            if error_id:
+                error['error_id'] = error_id
+                stored.append(error)
+        return stored
+    
+    def _category_filters(self, categories: Optional[List[str]] = None) -> Dict:
+        """
+        키워드 분류 규칙을 Elasticsearch filters 집계 조건으로 변환
+        
+        탐지 쿼리와 같은 매칭 조건(ErrorQueryBuilder.message_clauses - match/match_phrase)을
+        사용하고, _classify_error와 같이 먼저 나온 카테고리가 우선하도록 각 카테고리 조건에
+        앞선 카테고리의 키워드를 must_not으로 추가해 버킷이 서로 겹치지 않게 함
+        
+        토큰 단위로 매칭하므로 토큰 안의 부분 문자열(예: 'oomkilled' 안의 'oom')과
+        DB 에러 패턴(정규식)은 반영되지 않아 버킷 개수는 _classify_error 결과의 근사치임
+        
+        Args:
+            categories: 포함할 카테고리 (None이면 전체)
+            
+        Returns:
+            카테고리별 filter 조건
+        """
+        filters = {}
+        previous_keywords = []
+        for category, keywords in KEYWORD_CLASSIFICATIONS.items():
+            if categories is None or category in categories:
+                filters[category] = {
+                    "bool": {
+                        "should": self.query_builder.message_clauses(keywords),
+                        "minimum_should_match": 1,
+                        "must_not": self.query_builder.message_clauses(previous_keywords)
+                    }
+                }
+            previous_keywords = previous_keywords + keywords
+            
+        return filters
+    
+    def search_error_aggregates(self, time_range: int = 60) -> Dict[str, Dict]:
+        """
+        size: 0 집계 요청 한 번으로 에러 타입별·호스트별 개수만 조회
+        
+        키워드 규칙에 해당하지 않는 에러는 'application' 버킷으로 집계됨
+        (DB 에러 패턴은 반영되지 않으므로 타입별 개수는 근사치 - _category_filters 참고)
+        
+        Args:
+            time_range: 검색 시간 범위 (초)
+            
+        Returns:
+            {에러 타입: {'count': 개수, 'hosts': {호스트: 개수}}}
+        """
+        try:
+            host_field = self.config['monitoring'].get('aggregation_host_field', 'host.name')
+            index, time_filter = self._sliding_window(time_range)
+            
+            query = {
+                "size": 0,
+                "query": self._build_error_query(time_filter),
+                "aggs": {
+                    "categories": {
+                        "filters": {
+                            "filters": self._category_filters(),
+                            "other_bucket_key": "application"
+                        },
+                        "aggs": {
+                            "hosts": {"terms": {"field": host_field, "size": 10}}
+                        }
+                    }
+                }
+            }
+            
+            response = self.es.search(index=index, body=query, ignore_unavailable=True)
+            
+            aggregates = {}
+            for error_type, bucket in response['aggregations']['categories']['buckets'].items():
+                if bucket['doc_count'] == 0:
+                    continue
+                aggregates[error_type] = {
+                    'count': bucket['doc_count'],
+                    'hosts': {b['key']: b['doc_count'] for b in bucket['hosts']['buckets']}
+                }
                 
-                # 데이터베이스에 저장
+            total = sum(a['count'] for a in aggregates.values())
+            self.logger.info(f"{total}개의 에러 로그 집계 (최근 {time_range//60}분간, {len(aggregates)}개 타입, 키워드 기준 근사치)")
+            return aggregates
+            
+        except Exception as e:
+            self.logger.error(f"에러 집계 실패: {e}")
+            return {}
+    
+    def fetch_error_samples(self, categories: List[str], time_range: int = 60) -> Dict[str, List[Dict]]:
+        """
+        지정한 에러 타입에 대해서만 top_hits 샘플 문서 조회
+        
+        Args:
+            categories: 샘플을 가져올 에러 타입 목록
+            time_range: 검색 시간 범위 (초)
+            
+        Returns:
+            {에러 타입: 파싱된 에러 샘플 리스트}
+        """
+        try:
+            sample_size = self.config['monitoring'].get('aggregation_sample_size', 25)
+            index, time_filter = self._sliding_window(time_range)
+            filters = self._category_filters(categories)
+            
+            # 'application'은 다른 모든 카테고리에 해당하지 않는 문서
+            if 'application' in categories:
+                filters['application'] = {
+                    "bool": {"must_not": list(self._category_filters().values())}
+                }
+                
+            query = {
+                "size": 0,
+                "query": self._build_error_query(time_filter),
+                "aggs": {
+                    "categories": {
+                        "filters": {"filters": filters},
+                        "aggs": {
+                            "samples": {
+                                "top_hits": {
+                                    "size": sample_size,
+                                    "sort": [{"@timestamp": {"order": "desc"}}],
+                                    "_source": {"includes": self.source_fields}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+            
+            response = self.es.search(index=index, body=query, ignore_unavailable=True)
+            
+            samples = {}
+            for error_type, bucket in response['aggregations']['categories']['buckets'].items():
+                samples[error_type] = []
+                for hit in bucket['samples']['hits']['hits']:
+                    error_data = self._parse_log_entry(hit)
+                    if error_data:
+                        # 집계 버킷과 저장되는 에러 타입을 일치시킴
+                        error_data['error_type'] = error_type
+                        samples[error_type].append(error_data)
+                        
+            return samples
+            
+        except Exception as e:
+            self.logger.error(f"에러 샘플 조회 실패: {e}")
+            return {}
+    
+    def process_error_aggregates(self, time_range: int = 60) -> List[Dict]:
+        """
+        집계 모드 에러 처리 - 개수는 Elasticsearch 집계로 계산하고
+        임계값을 넘은 타입의 샘플 문서만 가져와 알림 및 저장
+        
+        Args:
+            time_range: 검색 시간 범위 (초)
+            
+        Returns:
+            처리해야 할 에러 리스트
+        """
+        # 에러 저장 전에 연결 확인 (끊어졌으면 다시 대여)
+        if not self.db.connect():
+            self.logger.error("데이터베이스 연결 실패 - 에러 처리 건너뜀")
+            return []
+            
+        aggregates = self.search_error_aggregates(time_range)
+        
+        exceeded = [
+            error_type for error_type, aggregate in aggregates.items()
+            if self.check_error_threshold(error_type, aggregate['count'])
+        ]
+        if not exceeded:
+            return []
+            
+        samples = self.fetch_error_samples(exceeded, time_range)
+        
+        processed_errors = []
+        for error_type in exceeded:
+            aggregate = aggregates[error_type]
+            type_samples = samples.get(error_type, [])
+            
+            self.logger.info(f"{error_type} 호스트별 에러 개수: {aggregate['hosts']}")
+            self.slack.send_error_detected(
+                error_type=error_type,
+                error_count=aggregate['count'],
+                error_samples=[e['error_message'] for e in type_samples[:3]]
+            )
+            
+            # 데이터베이스에 저장
+            for error in type_samples:
                 error_id = self.db.insert_error_log(error)
                 if error_id:
                     error['error_id'] = error_id
                     processed_errors.append(error)
-        
+                    
         return processed_errors
     
     def monitor_loop(self):
@@ -458,17 +922,20 @@ class ErrorMonitor:
                     self.cleanup_old_logs()
                     last_cleanup = datetime.now()
                 
-                # 에러 검색 (제한된 시간 범위)
-                errors = self.search_errors(check_interval)
-                
-                if errors:
-                    # 에러 처리
+                # 에러 검색 및 처리 (집계 모드 또는 페이지 단위 스트리밍)
+                if self.aggregation_mode:
+                    processed_errors = self.process_error_aggregates(check_interval)
+                else:
+                    errors = self.iter_errors(check_interval)
                     processed_errors = self.process_errors(errors)
-                    
-                    if processed_errors:
-                        self.logger.info(f"{len(processed_errors)}개의 에러가 처리 대기 중")
-                        # 여기서 AI Analyzer로 전달
-                        yield processed_errors
+                
+                # 처리 완료된 위치까지 증분 검색 커서 저장
+                self.commit_search_cursor()
+                
+                if processed_errors:
+                    self.logger.info(f"{len(processed_errors)}개의 에러가 처리 대기 중")
+                    # 여기서 AI Analyzer로 전달
+                    yield processed_errors
                 
                 # 종료 체크
                 if not self.running:
@@ -496,6 +963,7 @@ class ErrorMonitor:
             self.running = False
         finally:
             self.logger.info("모니터링 루프 종료 - 리소스 정리")
+            self.pattern_manager.stop()
             try:
                 if self.db:
                     self.db.disconnect()
@@ -537,8 +1005,14 @@ class ErrorMonitor:
             except Exception as e:
                 self.logger.warning(f"패턴 기반 삭제 실패: {e}")
             
-            # 데이터베이스의 오래된 에러 로그도 정리
-            self.db.cleanup_old_error_logs(retention_days)
+            # 데이터베이스의 오래된 에러 로그도 정리 (테이블별 보존 기간)
+            db_cleanup_config = log_config.get('database_cleanup', {})
+            error_retention = db_cleanup_config.get('error_logs_retention_days', retention_days)
+            self.db.cleanup_old_error_logs(
+                error_retention,
+                solutions_retention_days=db_cleanup_config.get('solutions_retention_days', error_retention),
+                execution_history_retention_days=db_cleanup_config.get('execution_history_retention_days', error_retention)
+            )
             
             self.logger.info(f"로그 정리 완료: {deleted_count}개 인덱스 삭제, {retention_days}일 이전 데이터 정리")
             
@@ -549,10 +1023,11 @@ class ErrorMonitor:
         """시스템 상태 업데이트"""
         try:
             # Elasticsearch 상태 체크
-            if self.es.ping():
-                self.db.update_system_status('elasticsearch', 'healthy', 0)
+            status, error_count = ('healthy', 0) if self.es.ping() else ('error', 1)
+            if self.writer:
+                self.writer.update_system_status('elasticsearch', status, error_count)
             else:
-                self.db.update_system_status('elasticsearch', 'error', 1)
+                self.db.update_system_status('elasticsearch', status, error_count)
                 
         except Exception as e:
             self.logger.error(f"시스템 상태 업데이트 실패: {e}")
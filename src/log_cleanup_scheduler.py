@@ -148,11 +148,13 @@ class LogCleanupScheduler:
             # 각 테이블별 보존 기간 설정
             db_config = self.log_config.get('database_cleanup', {})
             
-            # 에러 로그 정리
+            # 에러 로그/해결책/실행 이력 정리 (테이블별 보존 기간)
             error_retention = db_config.get('error_logs_retention_days', self.retention_days)
-            self.db_manager.cleanup_old_error_logs(error_retention)
-            
-            return True
+            return self.db_manager.cleanup_old_error_logs(
+                error_retention,
+                solutions_retention_days=db_config.get('solutions_retention_days', error_retention),
+                execution_history_retention_days=db_config.get('execution_history_retention_days', error_retention)
+            )
             
         except Exception as e:
             self.logger.error(f"데이터베이스 정리 실패: {e}")
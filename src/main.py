@@ -16,6 +16,9 @@ from error_monitor import ErrorMonitor
 from ai_analyzer import AIAnalyzer
 from auto_resolver import AutoResolver
 from database import DatabaseManager
+from db_pool import close_connection_pool
+from db_listener import close_notification_listener
+from write_behind import close_write_behind_queue
 
 class ELKAutoResolver:
     """ELK Auto Resolver 메인 클래스"""
@@ -41,6 +44,9 @@ class ELKAutoResolver:
             self.auto_resolver = AutoResolver(config_path)
             self.db = DatabaseManager(config_path)
             
+            # AI 분석 시 원본 로그 문서를 Elasticsearch에서 일괄 조회
+            self.ai_analyzer.raw_log_loader = self.error_monitor.fetch_raw_logs
+            
             self.logger.info("ELK Auto Resolver 초기화 완료")
             
         except Exception as e:
@@ -117,6 +123,15 @@ class ELKAutoResolver:
         self.logger.info("ELK Auto Resolver 중지 중...")
         self.running = False
         
+        # 에러 패턴 핫 리로드 스레드 종료
+        if self.error_monitor:
+            self.error_monitor.pattern_manager.stop()
+            
+        # 남은 write-behind 쓰기 기록 후 알림 수신 스레드 및 데이터베이스 연결 풀 종료
+        close_write_behind_queue()
+        close_notification_listener()
+        close_connection_pool()
+        
         # 최종 통계 출력
         self._print_final_stats()
     
@@ -159,18 +174,18 @@ class ELKAutoResolver:
         try:
             self.logger.info(f"에러 분석 시작: {len(detected_errors)}개")
             
-            # AI 분석 실행
-            analysis_results = self.ai_analyzer.analyze_multiple_errors(detected_errors)
-            self.stats['analyzed_errors'] += len(analysis_results)
-            
-            if not analysis_results:
+            # AI 분석은 동시에 진행하고, 분석이 끝난 에러부터 바로 자동 해결 실행
+            analyzed_count = 0
+            for analysis_result in self.ai_analyzer.iter_analyses(detected_errors):
+                analyzed_count += 1
+                self.stats['analyzed_errors'] += 1
+                self._execute_resolutions([analysis_result])
+                
+            if not analyzed_count:
                 self.logger.warning("분석된 에러가 없음")
                 return
             
-            self.logger.info(f"AI 분석 완료: {len(analysis_results)}개")
-            
-            # 자동 해결 실행
-            self._execute_resolutions(analysis_results)
+            self.logger.info(f"AI 분석 완료: {analyzed_count}개")
             
         except Exception as e:
             self.logger.error(f"에러 처리 중 오류: {e}")
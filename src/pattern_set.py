@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+에러 패턴 세트 관리 모듈
+- error_patterns 테이블로 ErrorClassifier를 만들고 백그라운드에서 다시 컴파일해 원자적으로 교체
+- 변경 감지: NOTIFY(error_patterns_changed) 즉시 반영 + 주기적 버전(행 수, 최신 updated_at) 확인
+- 분류 중인 스레드는 교체 전 분류기를 계속 사용하므로 재컴파일 동안 막히지 않음
+"""
+
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from .database import DatabaseManager
+from .error_classifier import ErrorClassifier
+from .db_listener import get_notification_listener
+
+# error_patterns 변경 트리거가 알림을 보내는 채널 (sql/database_schema.sql)
+PATTERN_CHANNEL = 'error_patterns_changed'
+
+class PatternSetManager:
+    """핫 리로드되는 컴파일된 에러 패턴 세트"""
+    
+    def __init__(self, config_path: str = None, reload_config: Optional[Dict] = None):
+        """
+        패턴 세트 관리자 초기화
+        
+        Args:
+            config_path: 설정 파일 경로 (백그라운드 스레드 전용 DatabaseManager 생성용)
+            reload_config: monitoring.pattern_reload 설정
+        """
+        reload_config = reload_config or {}
+        self.logger = logging.getLogger(__name__)
+        self.db = DatabaseManager(config_path)
+        self.enabled = reload_config.get('enabled', True)
+        # NOTIFY를 놓쳐도 이 주기(초)마다 버전을 확인해 변경 반영
+        self.poll_interval = reload_config.get('poll_interval', 60)
+        
+        # 분류는 이 참조만 읽고, 교체는 참조 대입 한 번으로 끝남
+        self.classifier = ErrorClassifier()
+        self.error_patterns = []
+        self.version = None
+        
+        self.reload_lock = threading.Lock()  # 재컴파일은 한 번에 하나만
+        self.reload_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        
+        self.metrics = {
+            'pattern_count': 0,
+            'compiled_count': 0,
+            'compile_ms': 0.0,
+            'reloads': 0,
+            'reload_failures': 0,
+            'version_checks': 0,
+            'notifications': 0,
+            'last_reload_at': None
+        }
+    
+    def load(self, force: bool = False) -> bool:
+        """
+        패턴을 조회해 새 분류기를 컴파일하고 교체 (버전이 같으면 건너뜀)
+        
+        Args:
+            force: 버전이 같아도 다시 컴파일
+            
+        Returns:
+            성공 여부 (변경이 없어 건너뛴 경우도 True)
+        """
+        with self.reload_lock:
+            try:
+                if not self.db.connect():
+                    self.metrics['reload_failures'] += 1
+                    return False
+                    
+                version = self.db.get_error_patterns_version()
+                self.metrics['version_checks'] += 1
+                if not force and version is not None and version == self.version:
+                    return True
+                    
+                error_patterns = self.db.get_error_patterns()
+                
+                started = time.perf_counter()
+                classifier = ErrorClassifier(error_patterns)
+                compile_ms = (time.perf_counter() - started) * 1000
+                
+                # 원자적 교체 - 진행 중인 분류는 이전 분류기로 끝까지 수행
+                self.classifier = classifier
+                self.error_patterns = error_patterns
+                self.version = version
+                
+                self.metrics.update({
+                    'pattern_count': len(error_patterns),
+                    'compiled_count': len(classifier.compiled_patterns),
+                    'compile_ms': round(compile_ms, 3),
+                    'last_reload_at': datetime.now().isoformat()
+                })
+                self.metrics['reloads'] += 1
+                self.logger.info(f"{len(error_patterns)}개의 에러 패턴 로드됨 (컴파일 {compile_ms:.1f}ms, 버전 {version})")
+                return True
+                
+            except Exception as e:
+                self.metrics['reload_failures'] += 1
+                self.logger.error(f"에러 패턴 로드 실패: {e}")
+                return False
+            finally:
+                self.db.disconnect()
+    
+    def request_reload(self, payload: Optional[str] = None):
+        """다음 루프에서 재컴파일하도록 요청 (NOTIFY 콜백)"""
+        self.metrics['notifications'] += 1
+        self.reload_event.set()
+    
+    def start(self):
+        """백그라운드 재컴파일 스레드 시작 (NOTIFY 구독 포함)"""
+        if not self.enabled or (self.thread and self.thread.is_alive()):
+            return
+            
+        if self.db.config['database'].get('notifications', {}).get('enabled', True):
+            try:
+                listener = get_notification_listener(self.db.config['database'])
+                listener.subscribe(PATTERN_CHANNEL, self.request_reload)
+                # 끊긴 동안의 변경은 버전 확인으로 반영
+                listener.on_reconnect(self.request_reload)
+            except Exception as e:
+                self.logger.warning(f"에러 패턴 변경 알림 구독 실패 - 주기적 확인만 사용: {e}")
+                
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="pattern-set-reloader", daemon=True)
+        self.thread.start()
+        self.logger.info(f"에러 패턴 핫 리로드 시작 (버전 확인 주기: {self.poll_interval}초)")
+    
+    def stop(self, timeout: float = 5.0):
+        """백그라운드 재컴파일 스레드 종료"""
+        self.stop_event.set()
+        self.reload_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+            self.thread = None
+    
+    def _run(self):
+        """알림 또는 주기마다 버전을 확인하고 바뀌었으면 재컴파일"""
+        while not self.stop_event.is_set():
+            self.reload_event.wait(self.poll_interval)
+            if self.stop_event.is_set():
+                break
+            self.reload_event.clear()
+            self.load()
+    
+    def get_metrics(self) -> Dict:
+        """패턴 세트 지표 (패턴 수, 컴파일 시간, 리로드 횟수 등)"""
+        metrics = dict(self.metrics)
+        metrics['version'] = self.version
+        metrics['hot_reload'] = bool(self.thread and self.thread.is_alive())
+        return metrics
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Prepared statement 레지스트리 모듈
+- 자주 실행되는 쿼리를 연결(세션)마다 한 번만 PREPARE하고 이후에는 이름으로 EXECUTE
+- 쿼리별 PREPARE / EXECUTE 횟수와 소요 시간 집계
+"""
+
+import re
+import time
+import threading
+from typing import Dict, Optional, Sequence
+
+# DatabaseManager에서 반복 실행되는 쿼리 (psycopg2 %s 자리표시자 사용)
+HOT_STATEMENTS = {
+    'error_log_exists': """
+        SELECT id FROM error_logs WHERE hash_signature = %s
+    """,
+    'insert_error_log': """
+        INSERT INTO error_logs (
+            error_type, error_message, source_system, severity,
+            stack_trace, elasticsearch_id, raw_log_data, hash_signature
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (hash_signature) DO NOTHING
+        RETURNING id
+    """,
+    # 파티션 스키마: error_signatures 게이트 테이블로 중복 판정 후 error_logs에 삽입
+    'error_signature_exists': """
+        SELECT 1 FROM error_signatures WHERE hash_signature = %s
+    """,
+    'claim_error_signature': """
+        INSERT INTO error_signatures (hash_signature) VALUES (%s)
+        ON CONFLICT (hash_signature) DO NOTHING
+        RETURNING hash_signature
+    """,
+    'insert_error_log_partitioned': """
+        INSERT INTO error_logs (
+            error_type, error_message, source_system, severity,
+            stack_trace, elasticsearch_id, raw_log_data, hash_signature
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+    """,
+    # PREPARE된 SELECT *는 테이블 컬럼이 바뀌면 실패하므로 컬럼을 명시
+    'solution_by_error_hash': """
+        SELECT id, error_hash, solution_type, solution_description, solution_commands,
+               success_rate, execution_count, last_success_at, ai_analysis,
+               created_at, updated_at
+        FROM solutions
+        WHERE error_hash = %s
+        ORDER BY success_rate DESC, execution_count DESC
+        LIMIT 1
+    """,
+    'insert_execution': """
+        INSERT INTO execution_history (
+            error_log_id, solution_id, execution_status,
+            execution_output, execution_time
+        ) VALUES (%s, %s, %s, %s, %s)
+    """,
+    'update_system_status': """
+        UPDATE system_status
+        SET status = %s, error_count = %s, last_check = CURRENT_TIMESTAMP
+        WHERE component_name = %s
+    """,
+    'insert_system_status': """
+        INSERT INTO system_status (component_name, status, error_count)
+        VALUES (%s, %s, %s)
+    """
+}
+
+class PreparedStatementRegistry:
+    """연결별 prepared statement 관리 및 실행 시간 집계"""
+    
+    def __init__(self, statements: Optional[Dict[str, str]] = None):
+        """
+        레지스트리 초기화
+        
+        Args:
+            statements: {이름: SQL} (기본값: HOT_STATEMENTS)
+        """
+        self.lock = threading.Lock()
+        self.statements = {}
+        self.stats = {}
+        for name, sql in (statements or HOT_STATEMENTS).items():
+            self.register(name, sql)
+    
+    def register(self, name: str, sql: str):
+        """
+        쿼리 등록 (%s 자리표시자를 PREPARE용 $1, $2 ...로 변환)
+        
+        Args:
+            name: statement 이름
+            sql: psycopg2 형식 SQL
+        """
+        counter = iter(range(1, sql.count('%s') + 1))
+        prepared_sql = re.sub(r'%s', lambda _: f"${next(counter)}", sql)
+        param_count = sql.count('%s')
+        placeholders = f"({', '.join(['%s'] * param_count)})" if param_count else ""
+        
+        with self.lock:
+            self.statements[name] = {
+                'sql': sql,
+                'prepare': f"PREPARE {name} AS {prepared_sql.strip()}",
+                'execute': f"EXECUTE {name}{placeholders}"
+            }
+            self.stats[name] = {
+                'prepare_count': 0,
+                'prepare_time': 0.0,
+                'execute_count': 0,
+                'execute_time': 0.0
+            }
+    
+    def execute(self, cursor, name: str, params: Sequence = ()):
+        """
+        이름으로 쿼리 실행 (해당 연결에서 처음이면 PREPARE 먼저 실행)
+        
+        풀 연결(PooledConnection)이 아니면 PREPARE 상태를 기록할 곳이 없으므로
+        원래 SQL을 그대로 실행함
+        
+        Args:
+            cursor: 데이터베이스 커서
+            name: statement 이름
+            params: 쿼리 파라미터
+        """
+        statement = self.statements[name]
+        stats = self.stats[name]
+        prepared = getattr(cursor.connection, 'prepared_statements', None)
+        
+        if prepared is None:
+            start = time.perf_counter()
+            cursor.execute(statement['sql'], params)
+            self._record(stats, 'execute', time.perf_counter() - start)
+            return
+            
+        if name not in prepared:
+            # PREPARE는 트랜잭션과 무관하게 세션이 끝날 때까지 유지됨
+            start = time.perf_counter()
+            cursor.execute(statement['prepare'])
+            self._record(stats, 'prepare', time.perf_counter() - start)
+            prepared.add(name)
+            
+        start = time.perf_counter()
+        cursor.execute(statement['execute'], params)
+        self._record(stats, 'execute', time.perf_counter() - start)
+    
+    def _record(self, stats: Dict, kind: str, elapsed: float):
+        """소요 시간 누적"""
+        with self.lock:
+            stats[f'{kind}_count'] += 1
+            stats[f'{kind}_time'] += elapsed
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        쿼리별 통계
+        
+        prepare_time은 파싱/분석 시간, execute_time은 계획 수립(custom plan 포함)과 실행 시간
+        
+        Returns:
+            {이름: {prepare_count, prepare_time, execute_count, execute_time, avg_execute_ms}}
+        """
+        with self.lock:
+            result = {}
+            for name, stats in self.stats.items():
+                entry = dict(stats)
+                count = stats['execute_count']
+                entry['avg_execute_ms'] = round(stats['execute_time'] / count * 1000, 3) if count else 0.0
+                result[name] = entry
+            return result
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_statement_registry() -> PreparedStatementRegistry:
+    """프로세스 공용 prepared statement 레지스트리 반환"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PreparedStatementRegistry()
+        return _registry
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+토큰 예산 기반 프롬프트 구성 모듈
+- 원본 로그 문서에서 우선순위 필드(k8s 파드/네임스페이스/컨테이너, 로그 레벨, 프로그램)부터 골라 압축 JSON으로 포함
+- 스택 트레이스는 반복 프레임을 제거하고, 예산을 넘으면 앞부분과 마지막 원인(Caused by) 쪽을 남김
+- 글자 수 대신 추정 토큰 수로 잘라 필드 중간이 잘리거나 공백에 예산을 쓰지 않음
+"""
+
+import re
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 우선순위 순 필드 (점 경로 - 중첩 문서와 평탄화된 키 모두 지원)
+PRIORITY_FIELDS = [
+    'kubernetes.namespace',
+    'kubernetes.pod.name',
+    'kubernetes.container.name',
+    'log.level',
+    'level',
+    'program',
+    'kubernetes.labels.app',
+    'kubernetes.node.name',
+    'container.image.name',
+    'host.name',
+    'service.name',
+    'log.logger',
+    'log.file.path',
+    'error.type',
+    'error.message',
+    'event.dataset',
+]
+
+# 분석에 도움이 되지 않는 수집기 메타데이터 (접두사 일치)
+NOISE_PREFIXES = (
+    'agent.', 'ecs.', 'input.', 'log.offset', 'log.flags', '@version', '@timestamp',
+    'host.os.', 'host.mac', 'host.ip', 'host.id', 'host.architecture', 'host.containerized', 'host.hostname',
+    'event.original', 'message', 'stack_trace', 'exception', 'error.stack_trace',
+    'kubernetes.pod.uid', 'kubernetes.replicaset.', 'kubernetes.namespace_uid', 'kubernetes.node.uid',
+    'kubernetes.namespace_labels.', 'kubernetes.node.labels.', 'kubernetes.labels.pod-template-hash',
+    'container.id', 'container.runtime', 'cloud.',
+    'fields.', 'tags',
+)
+
+# 스택 프레임 줄 (Java "at ...", Python "File ...", Go "pkg.func(...)" 다음 줄 경로 등)
+FRAME_LINE = re.compile(r'^\s*(at\s|File\s"|\S+\.go:\d+|#\d+\s)')
+PYTHON_FRAME = re.compile(r'^\s*File\s"')
+
+class PromptBuilder:
+    """토큰 예산에 맞춰 에러 상세 정보를 구성"""
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        프롬프트 빌더 초기화
+        
+        Args:
+            config: perplexity.prompt 설정
+        """
+        config = config or {}
+        # 단건 분석 프롬프트의 에러 상세 정보 예산 (메시지 + 스택 트레이스 + 원본 로그 필드)
+        self.token_budget = config.get('token_budget', 800)
+        # 일괄 분석 프롬프트의 에러당 예산
+        self.batch_token_budget = config.get('batch_token_budget', 250)
+        self.max_field_length = config.get('max_field_length', 200)
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        토큰 수 추정 (ASCII는 약 4글자당 1토큰, 한글 등은 글자당 1토큰)
+        
+        Args:
+            text: 문자열
+            
+        Returns:
+            추정 토큰 수
+        """
+        if not text:
+            return 0
+        non_ascii = sum(1 for ch in text if ord(ch) > 127)
+        return (len(text) - non_ascii + 3) // 4 + non_ascii
+    
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        추정 토큰 수 기준으로 자르기
+        
+        Args:
+            text: 문자열
+            max_tokens: 최대 토큰 수
+            
+        Returns:
+            잘린 문자열 (잘렸으면 끝에 '…')
+        """
+        if self.estimate_tokens(text) <= max_tokens:
+            return text
+            
+        budget = max(max_tokens - 1, 0) * 4
+        for index, ch in enumerate(text):
+            budget -= 1 if ord(ch) <= 127 else 4
+            if budget < 0:
+                return text[:index] + '…'
+        return text
+    
+    @staticmethod
+    def compact_json(value: Any) -> str:
+        """공백 없는 JSON (한글은 이스케이프하지 않음)"""
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+    
+    @staticmethod
+    def _get_path(document: Dict, path: str) -> Any:
+        """점 경로 값 조회 (평탄화된 키 'a.b'와 중첩 {'a': {'b': ...}} 모두 지원)"""
+        if path in document:
+            return document[path]
+        head, _, rest = path.partition('.')
+        value = document.get(head)
+        if rest and isinstance(value, dict):
+            return PromptBuilder._get_path(value, rest)
+        return None if rest else value
+    
+    @staticmethod
+    def _flatten(document: Dict, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+        """중첩 문서를 (점 경로, 스칼라 값)으로 펼침 (스칼라 리스트는 값으로 유지)"""
+        for key, value in document.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                yield from PromptBuilder._flatten(value, f"{path}.")
+            elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+                continue
+            else:
+                yield path, value
+    
+    def select_fields(self, raw_data: Dict, max_tokens: int) -> Dict:
+        """
+        원본 로그 문서에서 예산 안에 들어가는 필드 선택 (우선순위 필드 먼저, 나머지는 문서 순서)
+        
+        Args:
+            raw_data: Elasticsearch 원본 문서 (_source)
+            max_tokens: 필드에 쓸 최대 토큰 수
+            
+        Returns:
+            점 경로 → 값 (압축 JSON으로 직렬화할 평탄한 딕셔너리)
+        """
+        candidates = []
+        for path in PRIORITY_FIELDS:
+            value = self._get_path(raw_data, path)
+            if value not in (None, '', [], {}):
+                candidates.append((path, value))
+                
+        chosen_paths = {path for path, _ in candidates}
+        chosen_values = {value for _, value in candidates if isinstance(value, str)}
+        for path, value in self._flatten(raw_data):
+            if path in chosen_paths or path.startswith(NOISE_PREFIXES) or value in (None, '', []):
+                continue
+            # 나머지 필드 중 이미 포함된 값과 같은 것(host.name과 같은 노드 이름 등)은 생략
+            if isinstance(value, str) and value in chosen_values:
+                continue
+            candidates.append((path, value))
+            
+        selected = {}
+        used = 2  # {}
+        for path, value in candidates:
+            if isinstance(value, str):
+                value = self.truncate(value, self.max_field_length // 4)
+            cost = self.estimate_tokens(self.compact_json({path: value})) - 1
+            if used + cost > max_tokens:
+                # 우선순위 필드가 예산을 넘으면 다음 (더 짧은) 필드는 계속 시도
+                continue
+            selected[path] = value
+            used += cost
+        return selected
+    
+    def compact_stack_trace(self, stack_trace: str, max_tokens: int) -> str:
+        """
+        스택 트레이스 압축 (중복 프레임 제거 후 예산 초과 시 앞부분과 끝부분 유지)
+        
+        Args:
+            stack_trace: 스택 트레이스
+            max_tokens: 최대 토큰 수
+            
+        Returns:
+            압축된 스택 트레이스
+        """
+        lines = []
+        seen = set()
+        skipped = 0
+        skip_code_line = False
+        
+        for raw_line in stack_trace.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+                
+            if skip_code_line and not FRAME_LINE.match(raw_line):
+                # 생략한 Python 프레임의 소스 코드 줄
+                skip_code_line = False
+                continue
+            skip_code_line = False
+            
+            if FRAME_LINE.match(raw_line):
+                if line in seen:
+                    skipped += 1
+                    skip_code_line = bool(PYTHON_FRAME.match(raw_line))
+                    continue
+                seen.add(line)
+                
+            if skipped:
+                lines.append(f"... (중복 프레임 {skipped}개 생략)")
+                skipped = 0
+            lines.append(line)
+            
+        if skipped:
+            lines.append(f"... (중복 프레임 {skipped}개 생략)")
+            
+        text = '\n'.join(lines)
+        if self.estimate_tokens(text) <= max_tokens:
+            return text
+            
+        # 예산 초과: 앞부분(예외와 최상위 프레임) 60%, 끝부분(마지막 원인) 40%
+        head, tail = [], []
+        head_budget = max_tokens * 6 // 10
+        tail_budget = max_tokens - head_budget - 10  # 생략 표시 몫
+        used = 0
+        for line in lines:
+            cost = self.estimate_tokens(line) + 1
+            if used + cost > head_budget:
+                break
+            head.append(line)
+            used += cost
+            
+        # 끝부분은 마지막 예외 줄(Caused by 등)부터 - 없으면 마지막 줄부터 거꾸로
+        rest = lines[len(head):]
+        cause = max((i for i, line in enumerate(rest) if not FRAME_LINE.match(line) and not line.startswith('...')), default=None)
+        used = 0
+        if cause is not None:
+            for line in rest[cause:]:
+                cost = self.estimate_tokens(line) + 1
+                if used + cost > tail_budget:
+                    break
+                tail.append(line)
+                used += cost
+        else:
+            for line in reversed(rest):
+                cost = self.estimate_tokens(line) + 1
+                if used + cost > tail_budget:
+                    break
+                tail.insert(0, line)
+                used += cost
+                
+        if not head:
+            return self.truncate(lines[0], max_tokens)
+        omitted = len(lines) - len(head) - len(tail)
+        return '\n'.join(head + [f"... ({omitted}줄 생략)"] + tail)
+    
+    def build_details(self, error_data: Dict, max_tokens: Optional[int] = None) -> List[str]:
+        """
+        에러 상세 정보 줄 구성 (메시지 → 스택 트레이스 → 원본 로그 필드 순으로 예산 배분)
+        
+        메시지와 스택 트레이스가 예산을 다 쓰지 않으면 남은 몫은 다음 항목으로 넘어감
+        
+        Args:
+            error_data: 에러 정보 (raw_log_data가 있으면 필드 선택에 사용)
+            max_tokens: 전체 예산 (None이면 token_budget)
+            
+        Returns:
+            프롬프트에 넣을 줄 리스트
+        """
+        budget = self.token_budget if max_tokens is None else max_tokens
+        lines = []
+        
+        message = self.truncate(error_data.get('error_message') or '', budget * 4 // 10)
+        lines.append(f"- **에러 메시지**: {message}")
+        budget -= self.estimate_tokens(lines[-1])
+        
+        if error_data.get('stack_trace'):
+            stack_trace = self.compact_stack_trace(str(error_data['stack_trace']), max(budget // 2, 20))
+            lines.append(f"- **스택 트레이스**:\n```\n{stack_trace}\n```")
+            budget -= self.estimate_tokens(lines[-1])
+            
+        raw_data = error_data.get('raw_log_data')
+        if isinstance(raw_data, dict) and budget > 20:
+            fields = self.select_fields(raw_data, budget - 10)
+            if fields:
+                lines.append(f"- **로그 필드**: {self.compact_json(fields)}")
+                
+        return lines
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+에러 탐지 쿼리 빌더 모듈
+점수 계산이 필요 없는 filter context와 keyword terms 조건으로 에러 로그 검색 쿼리 구성
+"""
+
+import copy
+import logging
+from typing import Dict, List, Optional
+
+# 기본 탐지 조건 (monitoring.detection_query 설정으로 변경 가능)
+DEFAULT_LEVEL_FIELDS = ['log.level', 'level']
+DEFAULT_LEVELS = ['ERROR', 'FATAL', 'CRITICAL']
+DEFAULT_MESSAGE_FIELDS = ['message', 'event.original']
+DEFAULT_KEYWORDS = ['error', 'exception', 'failed', 'crash', 'panic', 'fatal', 'killed', 'timeout']
+DEFAULT_PHRASES = ['segmentation fault', 'out of memory', 'connection refused', 'permission denied']
+
+# 검색 결과로 가져올 _source 필드 (elasticsearch.source_fields 설정으로 변경 가능)
+# 'host'는 syslog/logstash처럼 host가 문자열인 문서용 (객체인 ECS 문서는 host 하위 필드 전체가 포함됨)
+DEFAULT_SOURCE_FIELDS = [
+    '@timestamp', 'message', 'event.original', 'host', 'host.name', 'host.hostname',
+    'log.level', 'level', 'program', 'exception', 'stack_trace', 'error.stack_trace'
+]
+
+class ErrorQueryBuilder:
+    """에러 탐지 쿼리 빌더 클래스"""
+    
+    def __init__(self, query_config: Optional[Dict] = None):
+        """
+        쿼리 빌더 초기화
+        
+        Args:
+            query_config: monitoring.detection_query 설정
+        """
+        query_config = query_config or {}
+        self.logger = logging.getLogger(__name__)
+        
+        self.level_fields = query_config.get('level_fields', DEFAULT_LEVEL_FIELDS)
+        self.levels = query_config.get('levels', DEFAULT_LEVELS)
+        self.message_fields = query_config.get('message_fields', DEFAULT_MESSAGE_FIELDS)
+        self.keywords = query_config.get('keywords', DEFAULT_KEYWORDS)
+        self.phrases = query_config.get('phrases', DEFAULT_PHRASES)
+        
+        # 시간 범위를 제외한 탐지 조건은 한 번만 구성해 재사용
+        self._detection_clause = self._build_detection_clause()
+    
+    def _build_detection_clause(self) -> Dict:
+        """
+        로그 레벨/메시지 키워드 기반 탐지 조건 구성
+        
+        - 로그 레벨: 필드별 terms 한 개 (keyword/text 매핑 모두 매칭되도록 대소문자 값 포함)
+        - 메시지: 키워드 목록을 하나의 match(OR)로, 여러 단어 표현만 match_phrase 사용
+        - leading wildcard 쿼리는 사용하지 않음
+        
+        Returns:
+            탐지 조건 bool 절
+        """
+        level_values = []
+        for level in self.levels:
+            for value in (level.upper(), level.lower()):
+                if value not in level_values:
+                    level_values.append(value)
+                    
+        should = [{"terms": {field: level_values}} for field in self.level_fields]
+        should.extend(self.message_clauses(self.keywords, self.phrases))
+        
+        return {
+            "bool": {
+                "should": should,
+                "minimum_should_match": 1
+            }
+        }
+    
+    def message_clauses(self, keywords: List[str], phrases: Optional[List[str]] = None) -> List[Dict]:
+        """
+        메시지 필드 매칭 조건 구성 (탐지 쿼리와 집계 모드 카테고리 필터가 공유)
+        
+        한 단어 키워드는 하나의 multi_match(OR)로 묶고, 공백이 있는 키워드와 phrases는
+        multi_match phrase로 매칭 (분석된 토큰 단위 일치이며 wildcard는 사용하지 않음)
+        
+        Args:
+            keywords: 키워드 목록
+            phrases: 여러 단어 표현 목록
+            
+        Returns:
+            should 절에 넣을 조건 리스트
+        """
+        words = [keyword for keyword in keywords if ' ' not in keyword]
+        phrases = [keyword for keyword in keywords if ' ' in keyword] + list(phrases or [])
+        
+        clauses = []
+        if words:
+            clauses.append({
+                "multi_match": {
+                    "query": " ".join(words),
+                    "fields": self.message_fields,
+                    "operator": "or"
+                }
+            })
+            
+        for phrase in phrases:
+            clauses.append({
+                "multi_match": {
+                    "query": phrase,
+                    "fields": self.message_fields,
+                    "type": "phrase"
+                }
+            })
+        return clauses
+    
+    def build(self, time_filter: Dict) -> Dict:
+        """
+        에러 탐지 쿼리 구성 (모든 조건이 filter context로 실행되어 점수 계산 및 캐시 활용)
+        
+        Args:
+            time_filter: @timestamp range 조건 (gte/lte/format)
+            
+        Returns:
+            Elasticsearch query 절
+        """
+        return {
+            "bool": {
+                "filter": [
+                    {"range": {"@timestamp": time_filter}},
+                    copy.deepcopy(self._detection_clause)
+                ]
+            }
+        }
\ No newline at end of file
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+에러 시그니처 캐시 모듈
+- Bloom 필터: DB에 없는 시그니처를 확실하게 판별 (중복 조회 SELECT 생략)
+- LRU: 최근 확인된 시그니처는 DB 왕복 없이 중복으로 처리 (TTL이 지나면 DB에서 다시 확인)
+- 프로세스 단위로 공유되며 error_logs 정리 후 다시 채움(warm)
+  (다른 프로세스의 정리로 삭제된 시그니처는 LRU TTL이 지나면 캐시에서 빠짐)
+"""
+
+import math
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (삭제 미지원 - 정리 후에는 다시 생성)"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Bloom 필터 초기화
+        
+        Args:
+            capacity: 예상 원소 수
+            error_rate: 목표 오탐률
+        """
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: str):
+        """이중 해싱으로 비트 위치 계산"""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, key: str):
+        """원소 추가"""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        for position in self._positions(key):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+class SignatureCache:
+    """Bloom 필터 + LRU 기반 중복 시그니처 캐시"""
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        시그니처 캐시 초기화
+        
+        Args:
+            config: database.signature_cache 설정
+        """
+        config = config or {}
+        self.bloom_capacity = config.get('bloom_capacity', 1000000)
+        self.bloom_error_rate = config.get('bloom_error_rate', 0.01)
+        self.lru_size = config.get('lru_size', 10000)
+        # LRU 항목 유효 시간(초) - 보존 기간보다 짧아야 다른 프로세스가 정리한 시그니처를 중복으로 오판하지 않음
+        self.lru_ttl = config.get('lru_ttl', 3600)
+        
+        self.lock = threading.Lock()
+        self.bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        self.lru = OrderedDict()  # 시그니처 → DB에서 확인된 시각 (monotonic)
+        self.warmed = False
+        
+        # 캐시 크기 조정용 카운터
+        self.stats = {
+            'lru_hits': 0,            # DB 왕복 없이 중복 처리
+            'lru_expired': 0,         # TTL이 지나 DB에서 다시 확인
+            'bloom_negatives': 0,     # 새 시그니처 확정 (SELECT 생략)
+            'bloom_positives': 0,     # DB 확인 필요
+            'bloom_false_positives': 0,
+            'db_duplicates': 0,       # DB 확인 결과 중복
+            'inserts': 0,
+            'warm_count': 0
+        }
+    
+    def warm(self, signatures: Iterable[str]) -> int:
+        """
+        기존 시그니처로 캐시 채우기 (Bloom 필터와 LRU 재생성)
+        
+        Args:
+            signatures: error_logs의 hash_signature (오래된 것부터)
+            
+        Returns:
+            적재된 시그니처 수
+        """
+        bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        lru = OrderedDict()
+        now = time.monotonic()
+        for signature in signatures:
+            bloom.add(signature)
+            lru[signature] = now
+            if len(lru) > self.lru_size:
+                lru.popitem(last=False)
+                
+        with self.lock:
+            self.bloom = bloom
+            self.lru = lru
+            self.warmed = True
+            self.stats['warm_count'] = bloom.count
+        return bloom.count
+    
+    def is_known_duplicate(self, signature: str) -> bool:
+        """LRU에 있고 TTL이 지나지 않았으면 DB 확인 없이 중복"""
+        with self.lock:
+            confirmed_at = self.lru.get(signature)
+            if confirmed_at is None:
+                return False
+            if self.lru_ttl and time.monotonic() - confirmed_at > self.lru_ttl:
+                del self.lru[signature]
+                self.stats['lru_expired'] += 1
+                return False
+            self.lru.move_to_end(signature)
+            self.stats['lru_hits'] += 1
+            return True
+    
+    def might_exist(self, signature: str) -> bool:
+        """
+        Bloom 필터 조회
+        
+        Returns:
+            False면 DB에 없는 것이 확실함 (캐시가 채워지지 않았으면 항상 True)
+        """
+        with self.lock:
+            if not self.warmed:
+                return True
+            if signature in self.bloom:
+                self.stats['bloom_positives'] += 1
+                return True
+            self.stats['bloom_negatives'] += 1
+            return False
+    
+    def record(self, signature: str, inserted: bool, bloom_positive: bool = False):
+        """
+        DB 처리 결과 반영
+        
+        Args:
+            signature: 해시 시그니처
+            inserted: 새로 삽입되었는지 여부 (False면 DB에 이미 존재)
+            bloom_positive: Bloom 필터가 존재 가능으로 판단했었는지 여부
+        """
+        with self.lock:
+            if inserted:
+                self.stats['inserts'] += 1
+                if bloom_positive:
+                    self.stats['bloom_false_positives'] += 1
+            else:
+                self.stats['db_duplicates'] += 1
+            self.bloom.add(signature)
+            self.lru[signature] = time.monotonic()
+            self.lru.move_to_end(signature)
+            if len(self.lru) > self.lru_size:
+                self.lru.popitem(last=False)
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 (hit/miss 카운터 및 Bloom 필터 사용량)"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['lru_entries'] = len(self.lru)
+            stats['bloom_entries'] = self.bloom.count
+            stats['bloom_fill_ratio'] = round(self.bloom.count / self.bloom.capacity, 4)
+            return stats
+
+_signature_cache = None
+_signature_cache_lock = threading.Lock()
+
+def get_signature_cache(config: Optional[Dict] = None) -> SignatureCache:
+    """
+    프로세스 공용 시그니처 캐시 반환 (여러 DatabaseManager 인스턴스가 공유)
+    
+    Args:
+        config: database.signature_cache 설정 (최초 생성 시에만 사용)
+        
+    Returns:
+        SignatureCache 인스턴스
+    """
+    global _signature_cache
+    with _signature_cache_lock:
+        if _signature_cache is None:
+            _signature_cache = SignatureCache(config)
+        return _signature_cache
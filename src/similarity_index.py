@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+해결책 유사도 인덱스 모듈
+- 해결책이 있는 에러 메시지를 해시된 문자 n-gram 벡터(L2 정규화)로 메모리에 보관
+- 새 에러와 같은 에러 타입 안에서 코사인 유사도 top-k 검색 (행렬 × 벡터 한 번)
+- 해시가 정확히 일치하지 않는 거의 같은 메시지도 기존 해결책을 재사용해 AI 호출 생략
+- NumPy(선택 의존성)가 없으면 비활성화
+"""
+
+import re
+import zlib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np  # 선택 의존성
+except ImportError:
+    np = None
+
+# 파드 이름, IP, 요청 ID 등 값만 다른 메시지가 같은 벡터가 되도록 숫자/16진수를 치환
+VOLATILE_TOKENS = re.compile(r'0x[0-9a-f]+|[0-9a-f]{8,}|\d+')
+WHITESPACE = re.compile(r'\s+')
+
+class SolutionSimilarityIndex:
+    """해시된 n-gram 코사인 유사도 인덱스 (스레드 안전)"""
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        유사도 인덱스 초기화
+        
+        Args:
+            config: database.similarity_index 설정
+        """
+        config = config or {}
+        self.dimensions = config.get('dimensions', 1024)
+        self.ngram = config.get('ngram', 3)
+        self.max_entries = config.get('max_entries', 5000)
+        self.max_message_length = config.get('max_message_length', 1000)
+        
+        self.lock = threading.Lock()
+        self.vectors = np.zeros((0, self.dimensions), dtype=np.float32)
+        self.size = 0
+        self.hashes = []  # 행 번호 → error_hash
+        self.rows = {}  # error_hash → 행 번호
+        self.type_ids = np.zeros(0, dtype=np.int32)  # 행 번호 → 에러 타입 ID
+        self.types = {}  # 에러 타입 → ID
+        self.built = False
+        self.pending = set()  # 다른 프로세스에서 추가/변경되어 메시지를 다시 읽어야 하는 해시
+        
+        self.stats = {
+            'searches': 0,
+            'nonempty_searches': 0,  # 유사도 0 초과 후보가 하나라도 있었던 검색
+            'additions': 0,
+            'removals': 0,
+            'builds': 0
+        }
+    
+    def vectorize(self, message: str) -> 'np.ndarray':
+        """
+        메시지를 해시된 문자 n-gram 벡터로 변환
+        
+        Args:
+            message: 에러 메시지
+            
+        Returns:
+            L2 정규화된 벡터 (n-gram이 없으면 0 벡터)
+        """
+        text = WHITESPACE.sub(' ', VOLATILE_TOKENS.sub('0', (message or '')[:self.max_message_length].lower())).strip()
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        if not text:
+            return vector
+            
+        padded = f" {text} "
+        buckets = [zlib.crc32(padded[i:i + self.ngram].encode('utf-8')) % self.dimensions
+                   for i in range(max(len(padded) - self.ngram + 1, 1))]
+        np.add.at(vector, buckets, 1.0)
+        
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+    
+    def build(self, entries: Iterable[Dict]) -> int:
+        """
+        전체 인덱스 구축 (기존 항목 교체)
+        
+        Args:
+            entries: {error_hash, error_type, error_message} 목록 (get_solution_messages 결과)
+            
+        Returns:
+            인덱스 항목 수
+        """
+        entries = list(entries)[:self.max_entries]
+        vectors = np.zeros((max(len(entries), 1), self.dimensions), dtype=np.float32)
+        hashes, rows, types = [], {}, {}
+        type_ids = np.zeros(max(len(entries), 1), dtype=np.int32)
+        
+        for entry in entries:
+            if entry['error_hash'] in rows:
+                continue
+            row = len(hashes)
+            vectors[row] = self.vectorize(entry['error_message'])
+            type_ids[row] = types.setdefault(entry['error_type'], len(types))
+            rows[entry['error_hash']] = row
+            hashes.append(entry['error_hash'])
+            
+        with self.lock:
+            self.vectors, self.type_ids = vectors, type_ids
+            self.hashes, self.rows, self.types = hashes, rows, types
+            self.size = len(hashes)
+            self.built = True
+            self.stats['builds'] += 1
+            return self.size
+    
+    def add(self, error_hash: str, error_type: str, error_message: str):
+        """
+        항목 추가 또는 교체 (새 해결책 저장 시)
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            error_type: 에러 타입
+            error_message: 에러 메시지
+        """
+        vector = self.vectorize(error_message)
+        with self.lock:
+            self.pending.discard(error_hash)
+            row = self.rows.get(error_hash)
+            if row is None:
+                if self.size >= self.max_entries:
+                    return
+                if self.size >= len(self.vectors):
+                    self._grow()
+                row = self.size
+                self.size += 1
+                self.rows[error_hash] = row
+                self.hashes.append(error_hash)
+            self.vectors[row] = vector
+            self.type_ids[row] = self.types.setdefault(error_type, len(self.types))
+            self.stats['additions'] += 1
+    
+    def _grow(self):
+        """행렬 용량 두 배로 확장 (lock 보유 상태에서 호출)"""
+        capacity = min(max(len(self.vectors) * 2, 64), self.max_entries)
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[:self.size] = self.vectors[:self.size]
+        type_ids = np.zeros(capacity, dtype=np.int32)
+        type_ids[:self.size] = self.type_ids[:self.size]
+        self.vectors, self.type_ids = vectors, type_ids
+    
+    def remove(self, error_hash: str):
+        """
+        항목 제거 (해결책이 삭제된 해시) - 마지막 행을 빈 자리로 옮김
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+        """
+        with self.lock:
+            row = self.rows.pop(error_hash, None)
+            if row is None:
+                return
+            last = self.size - 1
+            if row != last:
+                moved = self.hashes[last]
+                self.vectors[row] = self.vectors[last]
+                self.type_ids[row] = self.type_ids[last]
+                self.hashes[row] = moved
+                self.rows[moved] = row
+            self.hashes.pop()
+            self.size = last
+            self.stats['removals'] += 1
+    
+    def mark_pending(self, error_hash: Optional[str] = None):
+        """
+        다른 프로세스의 해결책 변경 표시 (NOTIFY 콜백 - 다음 검색 전에 메시지를 다시 읽음)
+        
+        Args:
+            error_hash: 에러 해시 시그니처 (비어 있으면 전체 재구축)
+        """
+        with self.lock:
+            if error_hash:
+                self.pending.add(error_hash)
+            else:
+                self.built = False
+    
+    def take_pending(self) -> List[str]:
+        """다시 읽어야 하는 해시 목록을 꺼냄"""
+        with self.lock:
+            pending, self.pending = list(self.pending), set()
+            return pending
+    
+    def search(self, error_type: str, error_message: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """
+        같은 에러 타입 안에서 유사한 메시지 검색
+        
+        Args:
+            error_type: 에러 타입
+            error_message: 에러 메시지
+            top_k: 최대 결과 수
+            
+        Returns:
+            (error_hash, 코사인 유사도) 리스트 (유사도 높은 순)
+        """
+        vector = self.vectorize(error_message)
+        with self.lock:
+            self.stats['searches'] += 1
+            type_id = self.types.get(error_type)
+            if type_id is None or not self.size:
+                return []
+                
+            scores = self.vectors[:self.size] @ vector
+            scores[self.type_ids[:self.size] != type_id] = -1.0
+            
+            k = min(top_k, self.size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            results = [(self.hashes[row], float(scores[row])) for row in top if scores[row] > 0]
+            if results:
+                self.stats['nonempty_searches'] += 1
+            return results
+    
+    def get_stats(self) -> Dict:
+        """인덱스 통계"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['entries'] = self.size
+            stats['error_types'] = len(self.types)
+            stats['memory_bytes'] = int(self.vectors.nbytes)
+            return stats
+
+_similarity_index = None
+_similarity_index_lock = threading.Lock()
+
+def get_similarity_index(config: Optional[Dict] = None) -> Optional[SolutionSimilarityIndex]:
+    """
+    프로세스 공용 유사도 인덱스 반환 (여러 AIAnalyzer 인스턴스가 공유)
+    
+    Args:
+        config: database.similarity_index 설정 (최초 생성 시에만 사용)
+        
+    Returns:
+        SolutionSimilarityIndex 인스턴스 (NumPy가 없으면 None)
+    """
+    global _similarity_index
+    if np is None:
+        return None
+    with _similarity_index_lock:
+        if _similarity_index is None:
+            _similarity_index = SolutionSimilarityIndex(config)
+        return _similarity_index
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+해결책 캐시 모듈
+- error_hash → 최적 해결책(성공률/실행 횟수 순)을 TTL + LRU로 프로세스 메모리에 보관
+- 시작 시 solutions 테이블에서 적재(warm), 해결책이 없는 해시도 TTL 동안 기억
+- solutions 변경 시 트리거가 보내는 NOTIFY(payload = error_hash)로 무효화
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+# solutions INSERT/UPDATE/DELETE 트리거가 알림을 보내는 채널 (sql/database_schema.sql)
+SOLUTION_CHANNEL = 'solution_changed'
+
+class SolutionCache:
+    """TTL + LRU 해결책 캐시"""
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        해결책 캐시 초기화
+        
+        Args:
+            config: database.solution_cache 설정
+        """
+        config = config or {}
+        self.max_entries = config.get('max_entries', 5000)
+        # 알림을 놓쳐도 이 시간(초)이 지나면 DB에서 다시 조회
+        self.ttl_seconds = config.get('ttl_seconds', 300)
+        
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # error_hash → (만료 시각, 해결책 또는 None)
+        self.warmed = False
+        # 무효화될 때마다 증가 - 조회 도중 무효화된 결과를 저장하지 않기 위해 사용
+        self.generation = 0
+        
+        self.stats = {
+            'hits': 0,
+            'negative_hits': 0,  # 해결책이 없다는 결과를 캐시에서 반환
+            'misses': 0,
+            'expired': 0,
+            'invalidations': 0,
+            'clears': 0,
+            'stale_puts_skipped': 0
+        }
+    
+    def get(self, error_hash: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        캐시 조회
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            
+        Returns:
+            (캐시 적중 여부, 해결책 사본 또는 None)
+        """
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(error_hash)
+            if entry is None:
+                self.stats['misses'] += 1
+                return False, None
+                
+            expires_at, solution = entry
+            if expires_at <= now:
+                del self.entries[error_hash]
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return False, None
+                
+            self.entries.move_to_end(error_hash)
+            if solution is None:
+                self.stats['negative_hits'] += 1
+                return True, None
+            self.stats['hits'] += 1
+            # 호출자가 결과에 표시 필드를 추가하므로 사본 반환
+            return True, dict(solution)
+    
+    def put(self, error_hash: str, solution: Optional[Dict], generation: Optional[int] = None):
+        """
+        조회 결과 저장
+        
+        Args:
+            error_hash: 에러 해시 시그니처
+            solution: 해결책 (없으면 None)
+            generation: 조회 시작 시점의 generation (그 사이 무효화되었으면 저장하지 않음)
+        """
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                self.stats['stale_puts_skipped'] += 1
+                return
+            self._store(error_hash, solution, time.monotonic())
+    
+    def _store(self, error_hash: str, solution: Optional[Dict], now: float):
+        """항목 저장 (lock 보유 상태에서 호출)"""
+        self.entries[error_hash] = (now + self.ttl_seconds, dict(solution) if solution else None)
+        self.entries.move_to_end(error_hash)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def warm(self, solutions: Iterable[Dict], generation: Optional[int] = None) -> int:
+        """
+        solutions 테이블의 최적 해결책으로 캐시 채우기
+        
+        Args:
+            solutions: error_hash별 최적 해결책 (오래 안 쓰인 것부터)
+            generation: 조회 시작 시점의 generation (그 사이 무효화되었으면 적재하지 않음)
+            
+        Returns:
+            적재된 해결책 수
+        """
+        solutions = list(solutions)
+        now = time.monotonic()
+        with self.lock:
+            self.warmed = True
+            if generation is not None and generation != self.generation:
+                self.stats['stale_puts_skipped'] += 1
+                return 0
+            for solution in solutions:
+                self._store(solution['error_hash'], solution, now)
+        return len(solutions)
+    
+    def invalidate(self, error_hash: Optional[str] = None):
+        """
+        해시 하나 무효화 (NOTIFY 콜백으로도 사용)
+        
+        Args:
+            error_hash: 에러 해시 시그니처 (비어 있으면 전체 무효화)
+        """
+        if not error_hash:
+            self.clear()
+            return
+        with self.lock:
+            self.generation += 1
+            self.stats['invalidations'] += 1
+            self.entries.pop(error_hash, None)
+    
+    def clear(self):
+        """전체 무효화 (알림 수신 연결이 재수립되어 놓친 알림이 있을 수 있을 때 - 다음 조회 시 다시 적재)"""
+        with self.lock:
+            self.generation += 1
+            self.stats['clears'] += 1
+            self.entries.clear()
+            self.warmed = False
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 (hit/miss 카운터 및 항목 수)"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self.entries)
+            lookups = stats['hits'] + stats['negative_hits'] + stats['misses']
+            stats['hit_ratio'] = round((stats['hits'] + stats['negative_hits']) / lookups, 4) if lookups else 0.0
+            return stats
+
+_solution_cache = None
+_solution_cache_lock = threading.Lock()
+
+def get_solution_cache(config: Optional[Dict] = None) -> SolutionCache:
+    """
+    프로세스 공용 해결책 캐시 반환 (여러 AIAnalyzer 인스턴스가 공유)
+    
+    Args:
+        config: database.solution_cache 설정 (최초 생성 시에만 사용)
+        
+    Returns:
+        SolutionCache 인스턴스
+    """
+    global _solution_cache
+    with _solution_cache_lock:
+        if _solution_cache is None:
+            _solution_cache = SolutionCache(config)
+        return _solution_cache
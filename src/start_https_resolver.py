@@ -149,6 +149,9 @@ class HTTPSELKResolver:
             resolver = AutoResolver()
             slack = SlackNotifier()
             
+            # AI 분석 시 원본 로그 문서를 Elasticsearch에서 일괄 조회
+            analyzer.raw_log_loader = self.monitor.fetch_raw_logs
+            
             # Elasticsearch 연결
             if not self.monitor.connect_elasticsearch():
                 logger.error("ErrorMonitor Elasticsearch 연결 실패")
@@ -170,11 +173,10 @@ class HTTPSELKResolver:
                 if errors:
                     logger.info(f"🔍 {len(errors)}개의 에러 감지됨")
                     
-                    # AI 분석
-                    for error in errors:
+                    # AI 분석 (동시 실행 - 분석이 끝난 에러부터 바로 해결)
+                    for analysis_result in analyzer.iter_analyses(errors):
                         try:
-                            logger.info(f"🔍 에러 분석 시작: {error['error_type']}")
-                            analysis_result = analyzer.analyze_error(error)
+                            error = analysis_result.get('error_data', {})
                             
                             if analysis_result and analysis_result.get('solution_type'):
                                 # 해결책 출처 구분
@@ -229,8 +231,21 @@ class HTTPSELKResolver:
         # 모니터 중지
         if self.monitor:
             self.monitor.running = False
+            self.monitor.pattern_manager.stop()
             logger.info("모니터 종료 요청")
         
+        # 남은 write-behind 쓰기 기록 후 알림 수신 스레드 및 데이터베이스 연결 풀 종료
+        try:
+            from src.write_behind import close_write_behind_queue
+            from src.db_listener import close_notification_listener
+            from src.db_pool import close_connection_pool
+            close_write_behind_queue()
+            close_notification_listener()
+            close_connection_pool()
+            logger.info("데이터베이스 연결 풀 종료됨")
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 풀 종료 실패: {e}")
+            
         # 포트 포워딩 프로세스 종료
         if self.port_forward_process:
             try:
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+로그 메시지 템플릿 모듈
+- 숫자, 16진수 ID, IP, UUID, Kubernetes 파드 해시 등 가변 토큰을 마스킹
+- 마스킹 결과만으로 템플릿을 만들어 이전에 본 메시지나 프로세스 재시작과 무관하게 항상 같은 값
+"""
+
+import re
+from typing import Dict, Optional
+
+# 마스킹 규칙 (순서대로 적용 - 구체적인 규칙을 먼저 적용해야 숫자 규칙에 먹히지 않음)
+MASKING_RULES = [
+    ('UUID', r'\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b'),
+    ('IP', r'\b(?:\d{1,3}\.){3}\d{1,3}(?::\d{1,5})?\b'),
+    # Deployment 파드 이름 (<name>-<replicaset 해시>-<5자리 접미사>)
+    # (Kubernetes 이름 생성기는 모음과 0/1/3을 쓰지 않는 문자 집합을 사용)
+    ('POD', r'\b([a-z0-9][a-z0-9.-]*?)-[bcdfghjklmnpqrstvwxz2-9]{6,10}-[bcdfghjklmnpqrstvwxz2-9]{5}(?![a-z0-9-])'),
+    ('TIMESTAMP', r'\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?\b'),
+    ('HEX', r'\b0[xX][0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*\d)(?=[0-9a-fA-F]*[a-fA-F])[0-9a-fA-F]{8,}\b'),
+    ('NUM', r'(?<![A-Za-z_])[-+]?\d+(?:\.\d+)?(?![A-Za-z_])'),
+]
+
+class TemplateMiner:
+    """가변 토큰 마스킹 기반 메시지 템플릿 추출기"""
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        템플릿 추출기 초기화 (마스킹 정규식은 한 번만 컴파일)
+        
+        Args:
+            config: monitoring.template_mining 설정
+        """
+        self.masking_rules = [
+            (re.compile(pattern), f"<{name}>" if name != 'POD' else r'\1-<POD>')
+            for name, pattern in MASKING_RULES
+        ]
+    
+    def mask(self, message: str) -> str:
+        """
+        가변 토큰을 자리표시자로 치환
+        
+        Args:
+            message: 원본 메시지
+            
+        Returns:
+            마스킹된 메시지
+        """
+        for regex, replacement in self.masking_rules:
+            message = regex.sub(replacement, message)
+        return message
+    
+    def template(self, message: str) -> str:
+        """
+        해시 시그니처에 사용할 메시지 템플릿 (마스킹 후 공백 정규화)
+        
+        Args:
+            message: 원본 에러 메시지
+            
+        Returns:
+            템플릿 문자열
+        """
+        return ' '.join(self.mask(message or '').split())
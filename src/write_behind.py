@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+비동기 write-behind 모듈
+- 모니터링/해결 루프의 부가 DB 쓰기(실행 이력, 시스템 상태)를 백그라운드 스레드로 넘김
+- 실행 이력은 크기 제한 큐에 모아 batch_size개 또는 flush_interval마다 일괄 INSERT
+- 시스템 상태는 컴포넌트별 마지막 값만 남겨(coalescing) 한 트랜잭션으로 반영
+- DB 연결 장애로 기록하지 못한 실행 이력과 상태는 다음 기록 때 다시 시도
+- 종료 시 남은 쓰기를 모두 기록(drain)한 뒤 스레드 종료
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Dict, Optional
+
+from .database import DatabaseManager
+
+class WriteBehindQueue:
+    """백그라운드 일괄 쓰기 큐"""
+    
+    def __init__(self, config_path: str = None, queue_config: Optional[Dict] = None):
+        """
+        write-behind 큐 초기화
+        
+        Args:
+            config_path: 설정 파일 경로 (쓰기 스레드 전용 DatabaseManager 생성용)
+            queue_config: database.write_behind 설정
+        """
+        queue_config = queue_config or {}
+        self.logger = logging.getLogger(__name__)
+        self.db = DatabaseManager(config_path)
+        self.max_queue_size = queue_config.get('max_queue_size', 10000)
+        self.batch_size = queue_config.get('batch_size', 500)
+        self.flush_interval = queue_config.get('flush_interval', 2.0)
+        # 큐가 가득 찼을 때 호출자가 기다리는 최대 시간 (초) - 지나면 버리고 기록
+        self.put_timeout = queue_config.get('put_timeout', 1.0)
+        
+        self.queue = queue.Queue(maxsize=self.max_queue_size)
+        self.status_lock = threading.Lock()
+        self.pending_statuses = {}  # 컴포넌트 → (상태, 에러 카운트) - 마지막 값만 유지
+        self.retry_executions = []  # 연결 장애로 기록하지 못해 다시 시도할 실행 이력 (최대 max_queue_size개)
+        self.stop_event = threading.Event()
+        self.thread = None
+        
+        self.metrics = {
+            'enqueued': 0,
+            'dropped': 0,
+            'status_updates': 0,
+            'status_coalesced': 0,
+            'flushes': 0,
+            'flushed_executions': 0,
+            'flushed_statuses': 0,
+            'flush_failures': 0,
+            'requeued_executions': 0,  # 연결 장애로 다음 기록 때 다시 시도
+            'skipped_executions': 0,   # 잘못된 행이라 건너뜀 (나머지 행은 기록됨)
+            'lost_executions': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'max_queue_depth': 0
+        }
+    
+    def start(self):
+        """쓰기 스레드 시작"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self.thread.start()
+    
+    def record_execution(self, execution_data: Dict) -> bool:
+        """
+        실행 이력 기록 예약
+        
+        Args:
+            execution_data: 실행 정보 (DatabaseManager.record_execution과 동일)
+            
+        Returns:
+            큐에 들어갔는지 여부 (가득 찬 상태가 put_timeout 동안 계속되면 False)
+        """
+        try:
+            self.queue.put(execution_data, timeout=self.put_timeout)
+        except queue.Full:
+            with self.status_lock:
+                self.metrics['dropped'] += 1
+            self.logger.warning(f"write-behind 큐가 가득 참 ({self.max_queue_size}) - 실행 이력 기록 누락")
+            return False
+            
+        with self.status_lock:
+            self.metrics['enqueued'] += 1
+            self.metrics['max_queue_depth'] = max(self.metrics['max_queue_depth'], self.queue.qsize())
+        return True
+    
+    def update_system_status(self, component: str, status: str, error_count: int = 0):
+        """
+        시스템 상태 업데이트 예약 (아직 기록되지 않은 이전 값은 덮어씀)
+        
+        Args:
+            component: 컴포넌트 명
+            status: 상태 ('healthy', 'warning', 'error')
+            error_count: 에러 카운트
+        """
+        with self.status_lock:
+            if component in self.pending_statuses:
+                self.metrics['status_coalesced'] += 1
+            self.pending_statuses[component] = (status, error_count)
+            self.metrics['status_updates'] += 1
+    
+    def _run(self):
+        """큐를 모아 batch_size 또는 flush_interval 기준으로 기록"""
+        batch = []
+        last_flush = time.monotonic()
+        
+        while True:
+            stopping = self.stop_event.is_set()
+            timeout = max(self.flush_interval - (time.monotonic() - last_flush), 0)
+            try:
+                batch.append(self.queue.get(timeout=0 if stopping else timeout))
+                # 이미 들어와 있는 것은 기다리지 않고 batch_size까지 가져옴
+                while len(batch) < self.batch_size:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+                
+            if len(batch) >= self.batch_size or time.monotonic() - last_flush >= self.flush_interval or stopping:
+                self._flush(batch)
+                batch = []
+                last_flush = time.monotonic()
+                
+            # 종료 요청 이후 큐와 대기 중인 상태를 모두 비웠으면 끝
+            if stopping and self.queue.empty() and not self.pending_statuses and not self.retry_executions:
+                break
+    
+    def _flush(self, executions: list):
+        """모인 실행 이력과 최신 시스템 상태를 기록"""
+        with self.status_lock:
+            statuses, self.pending_statuses = self.pending_statuses, {}
+            executions, self.retry_executions = self.retry_executions + executions, []
+        if not executions and not statuses:
+            return
+            
+        started = time.perf_counter()
+        written = None
+        statuses_ok = False
+        try:
+            if self.db.connect():
+                written = self.db.record_executions_bulk(executions)
+                statuses_ok = self.db.update_system_statuses(statuses)
+        except Exception as e:
+            self.logger.error(f"write-behind 기록 실패: {e}")
+        finally:
+            self.db.disconnect()
+            
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        lost = 0
+        with self.status_lock:
+            self.metrics['flushes'] += 1
+            self.metrics['last_flush_ms'] = round(elapsed_ms, 3)
+            self.metrics['max_flush_ms'] = round(max(self.metrics['max_flush_ms'], elapsed_ms), 3)
+            if written is None or not statuses_ok:
+                self.metrics['flush_failures'] += 1
+                
+            if written is not None:
+                self.metrics['flushed_executions'] += written
+                self.metrics['skipped_executions'] += len(executions) - written
+            elif not self.stop_event.is_set():
+                # 연결 장애 - 아무것도 기록되지 않았으므로 다음 기록 때 다시 시도 (한도를 넘는 오래된 것은 버림)
+                lost = max(len(executions) - self.max_queue_size, 0)
+                self.retry_executions = executions[lost:]
+                self.metrics['requeued_executions'] += len(executions) - lost
+            else:
+                # 종료 중에는 DB 장애로 루프가 끝나지 않을 수 있으므로 버림
+                lost = len(executions)
+            self.metrics['lost_executions'] += lost
+                
+            if statuses_ok:
+                self.metrics['flushed_statuses'] += len(statuses)
+            elif not self.stop_event.is_set():
+                # 상태는 다음 기록 때 다시 시도 (그 사이 들어온 새 값이 우선)
+                # 종료 중에는 DB 장애로 루프가 끝나지 않을 수 있으므로 버림
+                for component, value in statuses.items():
+                    self.pending_statuses.setdefault(component, value)
+                    
+        if written is None and executions:
+            self.logger.warning(f"write-behind 기록 실패: 실행 이력 {len(executions) - lost}개 재시도 예정, {lost}개 누락")
+    
+    def stop(self, timeout: float = 30.0):
+        """
+        남은 쓰기를 모두 기록한 뒤 스레드 종료
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout)
+            if self.thread.is_alive():
+                self.logger.warning(f"write-behind 종료 대기 시간 초과 - 남은 실행 이력 {self.queue.qsize()}개")
+            self.thread = None
+    
+    def get_metrics(self) -> Dict:
+        """큐 깊이와 기록 지연 지표"""
+        with self.status_lock:
+            metrics = dict(self.metrics)
+            metrics['queue_depth'] = self.queue.qsize()
+            metrics['pending_statuses'] = len(self.pending_statuses)
+            return metrics
+
+_write_behind = None
+_write_behind_lock = threading.Lock()
+
+def get_write_behind_queue(config_path: str = None, queue_config: Optional[Dict] = None) -> WriteBehindQueue:
+    """
+    프로세스 공용 write-behind 큐 반환 (최초 호출 시 생성 후 시작)
+    
+    Args:
+        config_path: 설정 파일 경로
+        queue_config: database.write_behind 설정 (최초 생성 시에만 사용)
+        
+    Returns:
+        WriteBehindQueue 인스턴스
+    """
+    global _write_behind
+    with _write_behind_lock:
+        if _write_behind is None:
+            _write_behind = WriteBehindQueue(config_path, queue_config)
+            _write_behind.start()
+        return _write_behind
+
+def close_write_behind_queue(timeout: float = 30.0):
+    """프로세스 공용 write-behind 큐 종료 (남은 쓰기 기록)"""
+    global _write_behind
+    with _write_behind_lock:
+        if _write_behind is not None:
+            _write_behind.stop(timeout)
+            _write_behind = None
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+에러 로그 삽입 벤치마크
+insert_error_log(건별 SELECT + INSERT + 커밋)와 insert_error_logs_bulk(execute_values / COPY)의
+처리 시간을 1k / 10k 배치로 비교 (설정 파일의 PostgreSQL 사용, 벤치마크 행은 종료 시 삭제)
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database import DatabaseManager
+
+BATCH_SIZES = [1000, 10000]
+BENCH_ERROR_TYPE = "benchmark_bulk_insert"
+
+def make_errors(count: int, duplicate_ratio: float = 0.2) -> list:
+    """벤치마크용 에러 생성 (일부는 배치 내 중복)"""
+    run_id = uuid.uuid4().hex[:8]
+    unique = int(count * (1 - duplicate_ratio))
+    return [
+        {
+            'error_type': BENCH_ERROR_TYPE,
+            'error_message': f"bench {run_id} request {i % unique} failed",
+            'source_system': 'benchmark',
+            'severity': 'ERROR',
+            'elasticsearch_id': f"{run_id}-{i}",
+            'raw_log_ref': {'index': 'logstash-bench', 'id': f"{run_id}-{i}"}
+        }
+        for i in range(count)
+    ]
+
+def cleanup(db: DatabaseManager):
+    """벤치마크 행 삭제"""
+    cursor = db.conn.cursor()
+    cursor.execute("DELETE FROM error_logs WHERE error_type = %s", (BENCH_ERROR_TYPE,))
+    db.conn.commit()
+
+def run(db: DatabaseManager, count: int):
+    """배치 크기별 건별 삽입과 일괄 삽입 비교"""
+    errors = make_errors(count)
+    start = time.perf_counter()
+    single_ids = [db.insert_error_log(error) for error in errors]
+    single_elapsed = time.perf_counter() - start
+    cleanup(db)
+    
+    errors = make_errors(count)
+    start = time.perf_counter()
+    bulk_ids = db.insert_error_logs_bulk(errors)
+    bulk_elapsed = time.perf_counter() - start
+    cleanup(db)
+    
+    single_inserted = sum(1 for error_id in single_ids if error_id)
+    bulk_inserted = sum(1 for error_id in bulk_ids if error_id)
+    mode = "COPY" if count >= db.config['database'].get('bulk_copy_threshold', 5000) else "execute_values"
+    
+    print(f"[{count:>6}건] 건별: {single_elapsed:7.2f}s ({count / single_elapsed:>9,.0f}건/s, 삽입 {single_inserted})"
+          f" | 일괄({mode}): {bulk_elapsed:7.2f}s ({count / bulk_elapsed:>9,.0f}건/s, 삽입 {bulk_inserted})"
+          f" | {single_elapsed / bulk_elapsed:.1f}x")
+
+def main():
+    db = DatabaseManager()
+    if not db.connect():
+        print("데이터베이스 연결 실패")
+        return 1
+        
+    try:
+        for count in BATCH_SIZES:
+            run(db, count)
+    finally:
+        cleanup(db)
+        db.disconnect()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
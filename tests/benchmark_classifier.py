@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+에러 분류기 마이크로 벤치마크
+기존 _classify_error 방식(매 메시지 re.search + any 키워드 스캔)과 ErrorClassifier의 처리량(msg/s) 비교
+"""
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.error_classifier import ErrorClassifier, KEYWORD_CLASSIFICATIONS
+
+MESSAGE_COUNT = 50000
+ROUNDS = 5
+
+# sql/database_schema.sql 의 샘플 에러 패턴
+ERROR_PATTERNS = [
+    {'pattern_name': 'Pod CrashLoopBackOff', 'pattern_regex': 'CrashLoopBackOff.*pod.*', 'error_category': 'kubernetes', 'priority': 1},
+    {'pattern_name': 'Disk Full', 'pattern_regex': 'No space left on device|disk.*full', 'error_category': 'storage', 'priority': 1},
+    {'pattern_name': 'Out of Memory', 'pattern_regex': 'OutOfMemory|OOMKilled.*', 'error_category': 'resource', 'priority': 2},
+    {'pattern_name': 'Connection Refused', 'pattern_regex': 'Connection refused.*port.*', 'error_category': 'network', 'priority': 3},
+    {'pattern_name': 'Service Unavailable', 'pattern_regex': 'Service Unavailable|503.*', 'error_category': 'service', 'priority': 4},
+]
+
+MESSAGES = [
+    "java.lang.IllegalStateException: handler {n} failed at com.example.Foo.bar(Foo.java:{n})",
+    "Back-off restarting failed container, CrashLoopBackOff for pod api-{n}",
+    "write /var/lib/data/{n}.db: No space left on device",
+    "dial tcp 10.0.0.{n}:5432: Connection refused on port 5432",
+    "upstream returned 503 Service Unavailable after {n}ms",
+    "user authentication failed for user {n}",
+    "request {n} completed with unexpected status",
+    "kernel: EXT4-fs error (device sda{n})",
+    "[INFO] retrying job {n}",
+    "invalid configuration value for key worker_{n}",
+]
+
+def legacy_classify(error_message: str) -> str:
+    """기존 ErrorMonitor._classify_error 구현 (비교 기준)"""
+    if not error_message or not isinstance(error_message, str):
+        return 'unknown'
+        
+    error_message_lower = error_message.lower()
+    
+    for pattern in ERROR_PATTERNS:
+        try:
+            if re.search(pattern['pattern_regex'], error_message, re.IGNORECASE):
+                return pattern['error_category']
+        except Exception:
+            continue
+            
+    for category, keywords in KEYWORD_CLASSIFICATIONS.items():
+        if any(keyword in error_message_lower for keyword in keywords):
+            return category
+            
+    if any(level in error_message_lower for level in ['info', 'debug', 'trace']):
+        return 'info'
+        
+    return 'application'
+
+def generate_messages(count: int) -> list:
+    """벤치마크용 메시지 생성"""
+    random.seed(42)
+    return [random.choice(MESSAGES).format(n=random.randint(1, 100000)) for _ in range(count)]
+
+def measure(label: str, func, messages: list) -> float:
+    """ROUNDS 회 실행 중 최고 처리량(msg/s) 측정"""
+    best = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func(messages)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(messages) / elapsed)
+    print(f"{label:<28} {best:>12,.0f} msg/s")
+    return best
+
+def main():
+    messages = generate_messages(MESSAGE_COUNT)
+    classifier = ErrorClassifier(ERROR_PATTERNS)
+    
+    # 분류 결과가 기존 구현과 동일한지 먼저 확인
+    expected = [legacy_classify(message) for message in messages]
+    actual = classifier.classify_many(messages)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"메시지 {len(messages)}개, 결과 불일치 {mismatches}개")
+    
+    legacy = measure("legacy _classify_error", lambda batch: [legacy_classify(m) for m in batch], messages)
+    single = measure("ErrorClassifier.classify", lambda batch: [classifier.classify(m) for m in batch], messages)
+    batch = measure("ErrorClassifier.classify_many", classifier.classify_many, messages)
+    
+    print(f"개선율: classify {single / legacy:.2f}x, classify_many {batch / legacy:.2f}x")
+    return 0 if mismatches == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+에러 탐지 쿼리 마이크로 벤치마크
+기존 scored match/wildcard 쿼리와 ErrorQueryBuilder 쿼리의 took(ms)를 픽스처 인덱스에서 비교
+"""
+
+import sys
+import random
+import statistics
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from elasticsearch import Elasticsearch, helpers
+from src.load_env import load_config_with_env
+from src.query_builder import ErrorQueryBuilder
+
+FIXTURE_INDEX = "elk-resolver-bench-fixture"
+DOC_COUNT = 50000
+ROUNDS = 20
+
+MESSAGES = [
+    "GET /api/v1/health 200 OK",
+    "user login succeeded",
+    "connection refused while connecting to upstream",
+    "java.lang.NullPointerException at com.example.Service",
+    "Out of memory: Killed process 1234 (java)",
+    "request failed with status 500",
+    "systemd[1]: Failed to start nginx.service",
+    "kernel: EXT4-fs error (device sda1)",
+    "cache warmed in 120ms",
+    "read timeout after 30s",
+]
+LEVELS = ["INFO", "INFO", "INFO", "WARN", "ERROR", "FATAL", "DEBUG"]
+PROGRAMS = ["kernel", "systemd", "nginx", "java", "filebeat"]
+
+def legacy_query(start_time: str, end_time: str) -> dict:
+    """기존 search_errors 쿼리 (scored should + leading wildcard)"""
+    return {
+        "bool": {
+            "must": [{"range": {"@timestamp": {"gte": start_time, "lte": end_time}}}],
+            "should": [
+                {"match": {"log.level": "ERROR"}},
+                {"match": {"log.level": "FATAL"}},
+                {"match": {"log.level": "CRITICAL"}},
+                {"match": {"level": "ERROR"}},
+                {"match": {"level": "FATAL"}},
+                {"match": {"level": "CRITICAL"}},
+                {"match": {"message": "error"}},
+                {"match": {"message": "exception"}},
+                {"match": {"message": "failed"}},
+                {"match": {"message": "crash"}},
+                {"match": {"message": "panic"}},
+                {"match": {"message": "fatal"}},
+                {"match": {"message": "killed"}},
+                {"match": {"message": "segmentation fault"}},
+                {"match": {"message": "out of memory"}},
+                {"match": {"message": "connection refused"}},
+                {"match": {"message": "timeout"}},
+                {"match": {"message": "permission denied"}},
+                {"match": {"event.original": "error"}},
+                {"match": {"event.original": "exception"}},
+                {"match": {"event.original": "failed"}},
+                {"bool": {"must": [{"match": {"program": "kernel"}}, {"wildcard": {"message": "*error*"}}]}},
+                {"bool": {"must": [{"match": {"program": "systemd"}}, {"wildcard": {"message": "*failed*"}}]}}
+            ],
+            "minimum_should_match": 1
+        }
+    }
+
+def create_es_client(config: dict) -> Elasticsearch:
+    """설정 파일 기준 Elasticsearch 클라이언트 생성"""
+    es_config = config['elasticsearch']
+    scheme = 'https' if es_config.get('use_ssl', False) else 'http'
+    params = {
+        'hosts': [f"{scheme}://{es_config['host']}:{es_config['port']}"],
+        'request_timeout': 60
+    }
+    if es_config.get('use_ssl', False):
+        params.update({'verify_certs': False, 'ssl_show_warn': False})
+        if es_config.get('username') and es_config.get('password'):
+            params['basic_auth'] = (es_config['username'], es_config['password'])
+    return Elasticsearch(**params)
+
+def load_fixture(es: Elasticsearch, now: datetime):
+    """픽스처 인덱스 생성 및 샘플 문서 적재"""
+    es.options(ignore_status=[404]).indices.delete(index=FIXTURE_INDEX)
+    
+    def documents():
+        for i in range(DOC_COUNT):
+            level = random.choice(LEVELS)
+            yield {
+                "_index": FIXTURE_INDEX,
+                "_source": {
+                    "@timestamp": (now - timedelta(seconds=random.randint(0, 3600))).isoformat(),
+                    "message": random.choice(MESSAGES),
+                    "log": {"level": level},
+                    "level": level,
+                    "program": random.choice(PROGRAMS),
+                    "host": {"name": f"node-{i % 5}"}
+                }
+            }
+            
+    helpers.bulk(es, documents())
+    es.indices.refresh(index=FIXTURE_INDEX)
+
+def measure(es: Elasticsearch, query: dict) -> tuple:
+    """쿼리를 ROUNDS번 실행하고 took(ms) 목록과 hit 수 반환"""
+    tooks = []
+    total = 0
+    for _ in range(ROUNDS):
+        response = es.search(index=FIXTURE_INDEX, query=query, size=100, request_cache=False)
+        tooks.append(response['took'])
+        total = response['hits']['total']['value']
+    return tooks, total
+
+def run_benchmark():
+    """벤치마크 실행"""
+    print("=== 에러 탐지 쿼리 벤치마크 ===")
+    
+    config = load_config_with_env()
+    es = create_es_client(config)
+    
+    now = datetime.now(timezone.utc)
+    print(f"픽스처 인덱스 생성 중: {FIXTURE_INDEX} ({DOC_COUNT}개 문서)")
+    load_fixture(es, now)
+    
+    start_time = (now - timedelta(hours=1)).isoformat()
+    end_time = now.isoformat()
+    builder = ErrorQueryBuilder(config.get('monitoring', {}).get('detection_query'))
+    
+    try:
+        queries = {
+            "legacy (scored + wildcard)": legacy_query(start_time, end_time),
+            "builder (filter context)": builder.build({"gte": start_time, "lte": end_time})
+        }
+        
+        for name, query in queries.items():
+            # 첫 실행은 워밍업으로 제외
+            es.search(index=FIXTURE_INDEX, query=query, size=0, request_cache=False)
+            tooks, total = measure(es, query)
+            print(f"{name:28s} hits={total:6d}  median={statistics.median(tooks):6.1f}ms  "
+                  f"mean={statistics.mean(tooks):6.1f}ms  max={max(tooks)}ms")
+    finally:
+        es.options(ignore_status=[404]).indices.delete(index=FIXTURE_INDEX)
+        
+    print("벤치마크 완료")
+
+if __name__ == "__main__":
+    run_benchmark()
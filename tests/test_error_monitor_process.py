@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+ErrorMonitor.process_errors 테스트
+모니터 연결(self.db)이 열리지 않은 상태에서 시작해도 에러 저장 전에 연결하는지 확인
+(연결이 없으면 실제 DatabaseManager처럼 None.cursor() 오류를 흉내 내는 가짜 연결 사용)
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.error_monitor import ErrorMonitor
+
+class FakeConnection:
+    """실행한 작업만 기록하는 가짜 연결"""
+    
+    def __init__(self):
+        self.closed = False
+        self.inserted = []
+
+class FakeDatabase:
+    """DatabaseManager의 연결 대여/반납 동작을 흉내 내는 가짜 DB"""
+    
+    def __init__(self):
+        self.conn = None
+        self.connects = 0
+    
+    def connect(self) -> bool:
+        if self.conn is None:
+            self.conn = FakeConnection()
+            self.connects += 1
+        return True
+    
+    def disconnect(self):
+        self.conn = None
+    
+    def insert_error_logs_bulk(self, errors):
+        if self.conn is None:
+            raise AttributeError("'NoneType' object has no attribute 'cursor'")
+        ids = []
+        for error in errors:
+            self.conn.inserted.append(error)
+            ids.append(len(self.conn.inserted))
+        return ids
+    
+    def get_signature_cache_stats(self):
+        return {}
+
+class FakeSlack:
+    """전송한 알림만 기록"""
+    
+    def __init__(self):
+        self.sent = []
+    
+    def send_error_detected(self, **kwargs):
+        self.sent.append(kwargs)
+        return True
+
+def make_monitor(threshold: int = 2) -> ErrorMonitor:
+    """설정/ES 없이 process_errors에 필요한 속성만 채운 모니터"""
+    monitor = ErrorMonitor.__new__(ErrorMonitor)
+    monitor.config = {'monitoring': {'error_threshold': threshold, 'insert_batch_size': 500}}
+    monitor.db = FakeDatabase()
+    monitor.slack = FakeSlack()
+    monitor.logger = logging.getLogger(__name__)
+    return monitor
+
+def make_errors():
+    """임계값을 넘는 타입 하나와 넘지 않는 타입 하나"""
+    errors = [{'error_type': 'memory', 'error_message': f'OOMKilled pod-{n}'} for n in range(3)]
+    errors.append({'error_type': 'network', 'error_message': 'connection refused'})
+    return errors
+
+def test_process_errors_connects_before_storing():
+    """연결되지 않은 모니터에서도 임계값을 넘은 에러가 저장됨"""
+    monitor = make_monitor()
+    
+    processed = monitor.process_errors(iter(make_errors()))
+    
+    assert monitor.db.connects == 1
+    assert [error['error_type'] for error in processed] == ['memory'] * 3
+    assert [error['error_id'] for error in processed] == [1, 2, 3]
+    assert len(monitor.slack.sent) == 1
+
+def test_process_errors_reconnects_after_disconnect():
+    """주기 사이에 연결이 반납되어도 다음 주기에 다시 대여해 저장"""
+    monitor = make_monitor()
+    monitor.process_errors(make_errors())
+    monitor.db.disconnect()
+    
+    processed = monitor.process_errors(make_errors())
+    
+    assert monitor.db.connects == 2
+    assert len(processed) == 3
+
+if __name__ == "__main__":
+    test_process_errors_connects_before_storing()
+    test_process_errors_reconnects_after_disconnect()
+    print("테스트 통과")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+프롬프트 빌더 테스트
+기존 방식(json.dumps(raw_data, indent=2)[:1000] + stack_trace[:500])과 PromptBuilder의
+에러 상세 정보 크기(글자 수/추정 토큰 수)와 핵심 필드 포함 여부 비교
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.prompt_builder import PromptBuilder
+
+# filebeat add_kubernetes_metadata 문서 (수집기 메타데이터가 앞쪽에 위치)
+FILEBEAT_DOC = {
+    '@timestamp': '2025-01-10T03:12:45.123Z',
+    '@version': '1',
+    'agent': {
+        'type': 'filebeat', 'version': '8.5.0', 'ephemeral_id': 'a3c1f0b2-7d4e-4b8a-9f1e-2c3d4e5f6a7b',
+        'id': '0f9e8d7c-6b5a-4c3d-2e1f-0a9b8c7d6e5f', 'name': 'filebeat-x7k2p'
+    },
+    'ecs': {'version': '8.0.0'},
+    'input': {'type': 'container'},
+    'host': {
+        'name': 'worker-1', 'hostname': 'worker-1', 'architecture': 'x86_64', 'containerized': True,
+        'os': {'kernel': '5.15.0-91-generic', 'codename': 'jammy', 'name': 'Ubuntu', 'family': 'debian',
+               'type': 'linux', 'version': '22.04.3 LTS (Jammy Jellyfish)', 'platform': 'ubuntu'},
+        'ip': ['10.0.0.21', '10.244.1.1', 'fe80::a00:27ff:fe4e:66a1'],
+        'mac': ['08-00-27-4E-66-A1', '02-42-AC-11-00-02']
+    },
+    'log': {'offset': 1839201, 'file': {'path': '/var/log/containers/es-data-2_elk-stack_elasticsearch-3f2a.log'},
+            'level': 'ERROR', 'logger': 'o.e.b.ElasticsearchUncaughtExceptionHandler'},
+    'stream': 'stderr',
+    'container': {'id': '3f2a9c8b7d6e5f4a3b2c1d0e9f8a7b6c5d4e3f2a1b0c9d8e7f6a5b4c3d2e1f0a',
+                  'runtime': 'containerd', 'image': {'name': 'docker.elastic.co/elasticsearch/elasticsearch:8.5.0'}},
+    'kubernetes': {
+        'pod': {'name': 'es-data-2', 'uid': '8b7c6d5e-4f3a-2b1c-0d9e-8f7a6b5c4d3e', 'ip': '10.244.1.37'},
+        'namespace': 'elk-stack',
+        'namespace_uid': '1a2b3c4d-5e6f-7a8b-9c0d-1e2f3a4b5c6d',
+        'namespace_labels': {'kubernetes_io/metadata_name': 'elk-stack'},
+        'replicaset': {'name': 'es-data-7f9c8b6d5'},
+        'labels': {'app': 'elasticsearch', 'role': 'data', 'pod-template-hash': '7f9c8b6d5'},
+        'container': {'name': 'elasticsearch'},
+        'node': {'name': 'worker-1', 'uid': '9c8b7a6d-5e4f-3a2b-1c0d-9e8f7a6b5c4d',
+                 'labels': {'kubernetes_io/hostname': 'worker-1', 'kubernetes_io/os': 'linux'}}
+    },
+    'message': 'fatal error in thread [elasticsearch[es-data-2][write][T#3]], exiting java.lang.OutOfMemoryError: Java heap space',
+}
+
+JAVA_STACK = "\n".join(
+    ["java.lang.OutOfMemoryError: Java heap space"]
+    + ["\tat org.elasticsearch.index.engine.InternalEngine.index(InternalEngine.java:1024)",
+       "\tat org.elasticsearch.index.shard.IndexShard.applyIndexOperation(IndexShard.java:877)"] * 12
+    + ["\tat org.elasticsearch.action.bulk.TransportShardBulkAction.executeBulkItemRequest(TransportShardBulkAction.java:320)",
+       "\tat java.base/java.lang.Thread.run(Thread.java:1589)",
+       "Caused by: java.lang.OutOfMemoryError: Java heap space",
+       "\tat org.apache.lucene.util.ArrayUtil.growExact(ArrayUtil.java:323)",
+       "\t... 42 more"]
+)
+
+PYTHON_STACK = "\n".join(
+    ["Traceback (most recent call last):"]
+    + ['  File "/app/worker.py", line 88, in process', "    return self.process(item.children)"] * 20
+    + ['  File "/app/worker.py", line 91, in process', "    raise RecursionError('maximum recursion depth exceeded')",
+       "RecursionError: maximum recursion depth exceeded"]
+)
+
+SAMPLES = [
+    {
+        'name': 'filebeat k8s + Java OOM',
+        'error_data': {'error_message': FILEBEAT_DOC['message'], 'stack_trace': JAVA_STACK, 'raw_log_data': FILEBEAT_DOC},
+        'expected': ['es-data-2', 'elk-stack', '"kubernetes.container.name":"elasticsearch"', 'ERROR',
+                     'Caused by: java.lang.OutOfMemoryError', '중복 프레임']
+    },
+    {
+        'name': 'syslog program + Python recursion',
+        'error_data': {
+            'error_message': 'worker crashed: maximum recursion depth exceeded',
+            'stack_trace': PYTHON_STACK,
+            'raw_log_data': {
+                '@timestamp': '2025-01-10T03:12:45Z', 'agent': FILEBEAT_DOC['agent'], 'ecs': FILEBEAT_DOC['ecs'],
+                'host': FILEBEAT_DOC['host'], 'program': 'log-worker', 'level': 'CRITICAL',
+                'message': 'worker crashed: maximum recursion depth exceeded'
+            }
+        },
+        'expected': ['log-worker', 'CRITICAL', 'RecursionError: maximum recursion depth exceeded', '중복 프레임']
+    },
+]
+
+def legacy_details(error_data: dict) -> str:
+    """기존 _build_analysis_prompt의 에러 상세 정보 부분 (비교 기준)"""
+    text = f"- **에러 메시지**: {error_data['error_message']}\n"
+    if error_data.get('stack_trace'):
+        text += f"- **스택 트레이스**: {error_data['stack_trace'][:500]}...\n"
+    if isinstance(error_data.get('raw_log_data'), dict):
+        text += f"- **원시 로그**: {json.dumps(error_data['raw_log_data'], indent=2)[:1000]}...\n"
+    return text
+
+def test_prompt_builder():
+    """샘플 문서별 크기 감소와 핵심 정보 포함 여부 확인"""
+    print("=== 프롬프트 빌더 테스트 ===")
+    builder = PromptBuilder()
+    
+    print(f"{'샘플':<36} {'기존 글자':>9} {'새 글자':>8} {'기존 토큰':>9} {'새 토큰':>8} {'감소율':>7}")
+    for sample in SAMPLES:
+        legacy = legacy_details(sample['error_data'])
+        compact = '\n'.join(builder.build_details(sample['error_data']))
+        
+        legacy_tokens = builder.estimate_tokens(legacy)
+        compact_tokens = builder.estimate_tokens(compact)
+        reduction = (1 - compact_tokens / legacy_tokens) * 100
+        print(f"{sample['name']:<36} {len(legacy):>9,} {len(compact):>8,} {legacy_tokens:>9,} {compact_tokens:>8,} {reduction:>6.1f}%")
+        
+        missing = [text for text in sample['expected'] if text not in compact]
+        legacy_missing = [text for text in sample['expected'] if text not in legacy]
+        print(f"  핵심 정보 누락 - 기존: {legacy_missing or '없음'} / 새: {missing or '없음'}")
+        
+        assert not missing, f"{sample['name']}: 핵심 정보 누락 {missing}"
+        assert compact_tokens < legacy_tokens, f"{sample['name']}: 기존 방식보다 토큰 수가 줄지 않음"
+        assert compact_tokens <= builder.token_budget, f"{sample['name']}: 예산 초과 ({compact_tokens} > {builder.token_budget})"
+        
+    # 일괄 분석 예산에서도 우선순위 필드 유지
+    batch = '\n'.join(builder.build_details(SAMPLES[0]['error_data'], builder.batch_token_budget))
+    batch_tokens = builder.estimate_tokens(batch)
+    print(f"일괄 분석 요약: {batch_tokens} 토큰 (예산 {builder.batch_token_budget})")
+    assert batch_tokens <= builder.batch_token_budget, f"일괄 분석 예산 초과 ({batch_tokens} > {builder.batch_token_budget})"
+    assert 'es-data-2' in batch, "일괄 분석 요약에 파드 이름 누락"
+
+if __name__ == "__main__":
+    test_prompt_builder()
+    print("테스트 통과")